@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Columns Benchmark
+Compara agregar horas de varios años con listas de diccionarios (como las
+filas de generate_hours_report.calculate_task_durations) y con el almacén
+columnar de prd_columns.py, con y sin NumPy.
+
+Genera un corpus sintético de --days días con --tasks tareas cada uno (por
+defecto 3 años x 100 = 109.500 entradas), con títulos que se repiten como
+las tareas recurrentes reales, y mide para cada variante la memoria que
+ocupan las entradas y el tiempo de: suma total, horas por mes, horas por
+título y percentiles de duración.
+
+Uso:
+    python bench_columns.py [--days 1095] [--tasks 100] [--titles 500] [--repeat 5]
+
+Ejemplos:
+    python bench_columns.py
+    python bench_columns.py --days 3650 --tasks 50     # 10 años
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from generate_corpus import make_prd, sentence
+from generate_hours_report import calculate_task_durations, tasks_from_prd
+from prd_columns import ColumnsBuilder, TimeEntries, load_numpy
+from prd_core import parse_prd
+
+START_DAY = date(2023, 1, 1)
+
+
+def make_days(days, tasks, titles):
+    """(day, parsed PRD) for each day, task names drawn from a fixed pool."""
+    rng = random.Random(0)
+    pool = [sentence(rng, 4).rstrip('.') for _ in range(titles)]
+    for offset in range(days):
+        day = START_DAY + timedelta(days=offset)
+        prd = parse_prd(make_prd(day, tasks=tasks, body_lines=1))
+        for task in prd.tasks:
+            task.name = rng.choice(pool)
+        yield day, prd
+
+
+def build_rows(days):
+    """The list-of-dicts representation: one report row per task."""
+    rows = []
+    for day, prd in days:
+        task_rows, _ = calculate_task_durations(tasks_from_prd(prd))
+        key = day.strftime("%Y%m%d")
+        for row in task_rows:
+            row['day'] = key
+            row['status'] = 'completada'
+        rows.extend(task_rows)
+    return rows
+
+
+def dict_queries(rows):
+    def total():
+        return sum(row['duration_mins'] for row in rows)
+
+    def by_month():
+        months = {}
+        for row in rows:
+            key = row['day'][:6]
+            months[key] = months.get(key, 0) + row['duration_mins']
+        return months
+
+    def by_title():
+        titles = {}
+        for row in rows:
+            titles[row['name']] = titles.get(row['name'], 0) + row['duration_mins']
+        return titles
+
+    def percentiles():
+        ordered = sorted(row['duration_mins'] for row in rows)
+        return [ordered[int((len(ordered) - 1) * p / 100)] for p in (50, 90, 99)]
+
+    return {'total': total, 'by_month': by_month, 'by_title': by_title, 'percentiles': percentiles}
+
+
+def column_queries(entries):
+    return {
+        'total': entries.total,
+        'by_month': lambda: entries.group('month'),
+        'by_title': lambda: entries.group('title'),
+        'percentiles': lambda: entries.percentiles([50, 90, 99]),
+    }
+
+
+def measure(function, repeat):
+    """Best wall time of repeat runs, in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return min(samples) * 1000
+
+
+def traced(function):
+    """(result, bytes allocated and still held by it)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = function()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Listas de diccionarios frente a columnas (array/memoryview/NumPy)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python bench_columns.py
+  python bench_columns.py --days 3650 --tasks 50
+        """
+    )
+    parser.add_argument('--days', type=int, default=1095, help='Días del corpus (default: 1095)')
+    parser.add_argument('--tasks', type=int, default=100, help='Tareas por día (default: 100)')
+    parser.add_argument('--titles', type=int, default=500, help='Títulos distintos (default: 500)')
+    parser.add_argument('--repeat', type=int, default=5, help='Ejecuciones por caso, se toma la mejor (default: 5)')
+
+    args = parser.parse_args()
+    days = list(make_days(args.days, args.tasks, args.titles))
+
+    with tempfile.TemporaryDirectory(prefix="prd_columns_") as tmp:
+        path = Path(tmp) / "prd_columns.bin"
+        rows, dict_bytes = traced(lambda: build_rows(days))
+        builder = ColumnsBuilder()
+        for day, prd in days:
+            builder.add_day(day, prd)
+        builder.save(path)
+        del days, builder
+
+        variants = [('dicts', dict_bytes, dict_queries(rows))]
+        engines = [False] + ([True] if load_numpy() else [])
+        opened = []
+        for use_numpy in engines:
+            entries, _ = traced(lambda: TimeEntries(path, use_numpy=use_numpy))
+            opened.append(entries)
+            name = 'numpy' if use_numpy else 'memoryview'
+            variants.append((name, path.stat().st_size, column_queries(entries)))
+
+        print(f"🧮 {len(rows)} entradas ({args.days} días x {args.tasks} tareas, {args.titles} títulos)")
+        if not load_numpy():
+            print("   NumPy no está instalado: solo se mide memoryview")
+        cases = list(variants[0][2])
+        header = ''.join(f"{case + ' (ms)':>18}" for case in cases)
+        print(f"\n{'Variante':<12}{'Memoria':>12}{header}")
+        for name, size, queries in variants:
+            times = ''.join(f"{measure(queries[case], args.repeat):>18.1f}" for case in cases)
+            print(f"{name:<12}{size / 1024 / 1024:>10.1f}MB{times}")
+
+        # Same answers from every variant
+        total = sum(row['duration_mins'] for row in rows)
+        answers = [(entries.total(), entries.group('month'), entries.group('title'),
+                    entries.percentiles([50, 90, 99])) for entries in opened]
+        assert answers[0][0][0] == total
+        assert all(answer == answers[0] for answer in answers)
+        for entries in opened:
+            entries.close()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Concurrent Writes Stress Test
+Varios procesos (como varias sesiones de agente) crean el mismo PRD y le
+añaden tareas a la vez con prd_edit.add_task. Al final se parsea el PRD y se
+comprueba que están todas las tareas, cada una una sola vez, con números
+consecutivos, y que el PRD se creó una sola vez.
+
+Mide el rendimiento de las escrituras (tareas añadidas por segundo entre
+todos los procesos) y la latencia de cada add_task, espera del bloqueo
+incluida. Con --no-lock se desactiva el bloqueo para ver las tareas que se
+pierden sin él.
+
+Uso:
+    python bench_concurrent_writes.py [--writers 8] [--tasks 50] [--rounds 3]
+                                      [--no-lock]
+
+Ejemplos:
+    python bench_concurrent_writes.py                      # 8 procesos x 50 tareas
+    python bench_concurrent_writes.py --writers 32 --tasks 20
+    python bench_concurrent_writes.py --no-lock            # Sin bloqueo: se pierden tareas
+"""
+
+import argparse
+import multiprocessing
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import create_daily_prd
+import prd_edit
+from prd_core import STATUS_COMPLETED, parse_prd
+
+DAY = "20250317"
+
+
+def writer(index, prd_dir, tasks, use_lock, start, results):
+    """Create the PRD if missing, then add tasks tasks to it."""
+    if not use_lock:
+        prd_edit.locked = lambda path: nullcontext()
+        create_daily_prd.locked = lambda path: nullcontext()
+    start.wait()
+    _, prd_path, created, message = create_daily_prd.create_prd(DAY, prd_dir)
+    latencies = []
+    errors = []
+    for number in range(tasks):
+        started = time.perf_counter()
+        _, error = prd_edit.add_task(prd_path, f"Agente {index} tarea {number}", "09:00",
+                                     description=f"Escritura concurrente {index}-{number}")
+        latencies.append(time.perf_counter() - started)
+        if error:
+            errors.append(error)
+    results.put((index, created, latencies, errors))
+
+
+def run_round(writers, tasks, use_lock):
+    """One stress round in a fresh folder; returns its measurements."""
+    context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory(prefix="prd_concurrent_") as tmp:
+        start = context.Event()
+        results = context.Queue()
+        processes = [
+            context.Process(target=writer, args=(i, tmp, tasks, use_lock, start, results))
+            for i in range(writers)
+        ]
+        for process in processes:
+            process.start()
+        # Let every process finish importing before releasing them together
+        time.sleep(0.5)
+        started = time.perf_counter()
+        start.set()
+        outcome = [results.get() for _ in processes]
+        elapsed = time.perf_counter() - started
+        for process in processes:
+            process.join()
+
+        prd_path = Path(tmp) / f"PRD_{DAY}.md"
+        with open(prd_path, 'r', encoding='utf-8') as f:
+            prd = parse_prd(f.read())
+
+    expected = {f"Agente {i} tarea {n}" for i in range(writers) for n in range(tasks)}
+    names = [task.name for task in prd.tasks if task.status == STATUS_COMPLETED]
+    numbers = [int(task.number) for task in prd.tasks if task.status == STATUS_COMPLETED]
+    return {
+        'elapsed': elapsed,
+        'created': sum(1 for _, created, _, _ in outcome if created),
+        'errors': [error for _, _, _, errors in outcome for error in errors],
+        'latencies': sorted(l for _, _, latencies, _ in outcome for l in latencies),
+        'lost': len(expected - set(names)),
+        'duplicated': len(names) - len(set(names)),
+        'numbering_ok': numbers == list(range(1, len(numbers) + 1)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Varios procesos añadiendo tareas al mismo PRD a la vez",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python bench_concurrent_writes.py
+  python bench_concurrent_writes.py --writers 32 --tasks 20
+  python bench_concurrent_writes.py --no-lock
+        """
+    )
+    parser.add_argument('--writers', type=int, default=8, help='Procesos escritores (default: 8)')
+    parser.add_argument('--tasks', type=int, default=50, help='Tareas que añade cada proceso (default: 50)')
+    parser.add_argument('--rounds', type=int, default=3, help='Repeticiones de la prueba (default: 3)')
+    parser.add_argument('--no-lock', action='store_true', help='Desactivar el bloqueo del PRD (para comparar)')
+
+    args = parser.parse_args()
+    total = args.writers * args.tasks
+    mode = "sin bloqueo" if args.no_lock else "con bloqueo"
+    print(f"✍️  {args.writers} procesos x {args.tasks} tareas = {total} tareas por ronda ({mode})")
+    print(f"\n{'Ronda':<7}{'Tareas/s':>10}{'p50 (ms)':>10}{'p99 (ms)':>10}"
+          f"{'Perdidas':>10}{'Dupl.':>7}{'Creado':>8}{'Números':>9}{'Errores':>9}")
+
+    failed = False
+    for round_number in range(1, args.rounds + 1):
+        result = run_round(args.writers, args.tasks, not args.no_lock)
+        latencies = result['latencies']
+        p50 = statistics.median(latencies) * 1000
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+        numbering = "ok" if result['numbering_ok'] else "mal"
+        print(f"{round_number:<7}{total / result['elapsed']:>10.0f}{p50:>10.1f}{p99:>10.1f}"
+              f"{result['lost']:>10}{result['duplicated']:>7}{result['created']:>7}x"
+              f"{numbering:>9}{len(result['errors']):>9}")
+        for error in sorted(set(result['errors']))[:3]:
+            print(f"       ❌ {error}")
+        failed |= bool(result['lost'] or result['duplicated'] or result['errors']
+                       or result['created'] != 1 or not result['numbering_ok'])
+
+    if failed:
+        print("\n❌ Se perdieron o duplicaron escrituras")
+        return 1
+    print("\n✅ Ninguna tarea perdida")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
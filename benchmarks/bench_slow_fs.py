@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Slow Filesystem Benchmark
+Mide los modos rango/lote (reporte de horas, dashboards y resúmenes) sobre
+un sistema de archivos lento simulado, con --io-workers 1 frente a N.
+
+El sistema de archivos lento es un sustituto local: mientras está activo,
+open(), os.stat() y os.scandir() sobre rutas del corpus esperan la latencia
+indicada antes de ejecutarse, como en una carpeta de OneDrive o SMB. Las
+salidas (reportes, manifiestos) se escriben fuera del corpus, sin latencia.
+
+Uso:
+    python bench_slow_fs.py [--latency-ms 20] [--days 60] [--concurrency 1 8]
+                            [--repeat 3] [--filter TEXTO]
+
+Ejemplos:
+    python bench_slow_fs.py                             # 20 ms por operación, 60 días
+    python bench_slow_fs.py --latency-ms 50 --concurrency 1 4 16
+    python bench_slow_fs.py --filter hours --days 365
+"""
+
+import argparse
+import builtins
+import io
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import generate_dashboard
+import generate_day_summary
+import generate_hours_report
+from generate_corpus import write_daily_tree, write_prd_corpus
+from prd_aio import iter_prds
+from prd_core import clear_loaded
+
+START_DAY = date(2025, 1, 1)
+
+
+@contextmanager
+def slow_filesystem(root, latency):
+    """Add latency seconds to every open/stat/scandir of a path under root."""
+    root = os.path.realpath(root)
+    originals = {
+        'open': builtins.open, 'io_open': io.open,
+        'stat': os.stat, 'scandir': os.scandir,
+    }
+
+    def is_slow(path):
+        try:
+            path = os.fsdecode(path)
+        except TypeError:
+            return False  # File descriptors
+        return os.path.abspath(path).startswith(root)
+
+    def delayed(original):
+        def call(path, *args, **kwargs):
+            if is_slow(path):
+                time.sleep(latency)
+            return original(path, *args, **kwargs)
+        return call
+
+    builtins.open = io.open = delayed(originals['open'])
+    os.stat = delayed(originals['stat'])
+    os.scandir = delayed(originals['scandir'])
+    try:
+        yield
+    finally:
+        builtins.open = originals['open']
+        io.open = originals['io_open']
+        os.stat = originals['stat']
+        os.scandir = originals['scandir']
+
+
+def build_cases(workdir, days):
+    """Return {case name: callable(concurrency)} over a corpus in workdir/slow."""
+    slow = workdir / "slow"
+    output_dir = workdir / "REPORTS"
+    prd_dir = slow / "PRD_DOCUMENTS"
+    daily_dir = slow / "DAILY_WORK"
+    prd_files = write_prd_corpus(prd_dir, days, START_DAY)
+    write_daily_tree(daily_dir, days, START_DAY, files_per_day=4)
+    first = f"{START_DAY:%Y%m%d}"
+    last = f"{START_DAY + timedelta(days=days - 1):%Y%m%d}"
+
+    def read_all(concurrency):
+        for _ in iter_prds(prd_files, concurrency):
+            pass
+
+    def hours_range(concurrency):
+        report_file, message = generate_hours_report.generate_range_report(
+            first, last, 'bench', prd_dir, output_dir, force=True,
+            archive_dir=workdir / "ARCHIVES", io_workers=concurrency)
+        if not report_file:
+            raise RuntimeError(message)
+
+    def dashboard_batch(concurrency):
+        generate_dashboard.generate_batch(prd_files, output_dir, workers=1, force=True,
+                                          io_workers=concurrency)
+
+    def summary_range(concurrency):
+        for _ in generate_day_summary.generate_summary_range(
+                first, last, daily_dir, output_dir, force=True, io_workers=concurrency):
+            pass
+
+    cases = {
+        'iter_prds': read_all,
+        'hours.generate_range_report': hours_range,
+        'dashboard.generate_batch': dashboard_batch,
+        'summary.generate_summary_range': summary_range,
+    }
+    return cases, slow
+
+
+def measure(function, concurrency, repeat):
+    """Best wall time of repeat runs, in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        clear_loaded()
+        started = time.perf_counter()
+        function(concurrency)
+        samples.append(time.perf_counter() - started)
+    return min(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Medir los modos rango/lote sobre un sistema de archivos lento simulado",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python bench_slow_fs.py
+  python bench_slow_fs.py --latency-ms 50 --concurrency 1 4 16
+  python bench_slow_fs.py --filter hours --days 365
+        """
+    )
+    parser.add_argument('--latency-ms', type=float, default=20.0,
+                        help='Latencia añadida a cada open/stat/scandir (default: 20)')
+    parser.add_argument('--days', type=int, default=60, help='Días del corpus (default: 60)')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8],
+                        help='Valores de --io-workers a comparar (default: 1 8)')
+    parser.add_argument('--repeat', type=int, default=3, help='Ejecuciones por caso, se toma la mejor (default: 3)')
+    parser.add_argument('--filter', default=None, help='Medir solo los casos que contienen este texto')
+
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory(prefix="prd_slowfs_") as tmp:
+        cases, slow = build_cases(Path(tmp), args.days)
+        print(f"🐢 {args.latency_ms:g} ms por operación sobre {slow} ({args.days} días)")
+        header = ''.join(f"{f'io={c} (ms)':>14}" for c in args.concurrency)
+        print(f"\n{'Caso':<34}{header}{'Mejora':>9}")
+        with slow_filesystem(slow, args.latency_ms / 1000):
+            for name, function in cases.items():
+                if args.filter and args.filter not in name:
+                    continue
+                times = [measure(function, c, args.repeat) for c in args.concurrency]
+                row = ''.join(f"{t:>14.0f}" for t in times)
+                print(f"{name:<34}{row}{times[0] / min(times):>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
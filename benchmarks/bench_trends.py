@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Trend Dashboard Benchmark
+Mide el dashboard de tendencias sobre --days PRD sintéticos (por defecto un
+año): recalcular todos los totales (lo que costaría leer cada PRD del rango),
+actualizarlos sin cambios, actualizarlos tras editar un día y dibujar el
+HTML desde los totales guardados.
+
+Termina con código 1 si el dibujo supera RENDER_BUDGET de
+generate_trend_dashboard.py.
+
+Uso:
+    python bench_trends.py [--days 365] [--tasks 20] [--repeat 5]
+
+Ejemplos:
+    python bench_trends.py
+    python bench_trends.py --days 1825              # 5 años de historial
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from generate_corpus import make_prd
+from generate_trend_dashboard import RENDER_BUDGET, default_range, render_trends
+from prd_edit import add_task
+from prd_rollups import update_rollups
+
+START_DAY = date(2025, 1, 1)
+
+
+def measure(function, repeat):
+    """Best wall time of repeat runs, in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return min(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Totales precalculados y dibujo del dashboard de tendencias",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python bench_trends.py
+  python bench_trends.py --days 1825
+        """
+    )
+    parser.add_argument('--days', type=int, default=365, help='Días del corpus (default: 365)')
+    parser.add_argument('--tasks', type=int, default=20, help='Tareas por día (default: 20)')
+    parser.add_argument('--repeat', type=int, default=5, help='Ejecuciones por caso, se toma la mejor (default: 5)')
+
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="prd_trends_") as tmp:
+        prd_dir = Path(tmp) / "PRD_DOCUMENTS"
+        prd_dir.mkdir()
+        for offset in range(args.days):
+            day = START_DAY + timedelta(days=offset)
+            (prd_dir / f"PRD_{day:%Y%m%d}.md").write_text(make_prd(day, tasks=args.tasks), encoding='utf-8')
+        path = Path(tmp) / "prd_rollups.json"
+        archives = Path(tmp) / "ARCHIVES"
+        last_prd = prd_dir / f"PRD_{START_DAY + timedelta(days=args.days - 1):%Y%m%d}.md"
+
+        def rebuild():
+            update_rollups(prd_dir, path, archives, rebuild=True)
+
+        def unchanged():
+            update_rollups(prd_dir, path, archives)
+
+        def one_day():
+            add_task(last_prd, "Tarea añadida", "23:00")
+            update_rollups(prd_dir, path, archives)
+
+        cases = [('recalcular todo', rebuild), ('sin cambios', unchanged), ('un día editado', one_day)]
+        print(f"📈 {args.days} días x {args.tasks} tareas")
+        print(f"\n{'Caso':<20}{'Tiempo (ms)':>14}")
+        for name, function in cases:
+            print(f"{name:<20}{measure(function, args.repeat):>14.1f}")
+
+        rollups, _ = update_rollups(prd_dir, path, archives)
+        date_from, date_to = default_range(rollups)
+        render_ms = measure(lambda: render_trends(rollups, date_from, date_to), args.repeat)
+        size = len(render_trends(rollups, date_from, date_to).encode('utf-8'))
+        print(f"{'dibujar (1 año)':<20}{render_ms:>14.1f}   {size / 1024:.0f} KB")
+
+    if render_ms > RENDER_BUDGET * 1000:
+        print(f"\n❌ El dibujo superó el presupuesto de {RENDER_BUDGET * 1000:.0f} ms")
+        return 1
+    print(f"\n✅ Dibujo dentro del presupuesto de {RENDER_BUDGET * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
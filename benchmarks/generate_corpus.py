@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+PRD Corpus Generator
+Genera PRD sintéticos y árboles DAILY_WORK para medir el rendimiento de
+los scripts.
+
+Se puede variar el número de tareas, la longitud de las descripciones, la
+proporción de pendientes y añadir entradas patológicas: logs largos
+pegados en una tarea o encabezados sin separador ni hora.
+
+Uso:
+    python generate_corpus.py OUTPUT [--days 365] [--tasks 10] [--body-lines 3]
+                              [--pending-ratio 0.2] [--log-lines 0] [--missing-separators]
+                              [--daily-work] [--files-per-day 8]
+
+Ejemplos:
+    python generate_corpus.py /tmp/corpus                       # Un año de PRD_DOCUMENTS
+    python generate_corpus.py /tmp/corpus --tasks 1000 --days 5  # Días de agente
+    python generate_corpus.py /tmp/corpus --log-lines 20000 --days 1
+    python generate_corpus.py /tmp/corpus --daily-work          # También DAILY_WORK/YYMMDD
+"""
+
+import argparse
+import os
+import random
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+SPANISH_MONTHS = {
+    1: "enero", 2: "febrero", 3: "marzo", 4: "abril",
+    5: "mayo", 6: "junio", 7: "julio", 8: "agosto",
+    9: "septiembre", 10: "octubre", 11: "noviembre", 12: "diciembre"
+}
+
+WORDS = (
+    "revisar servidor backup correo impresora formulario cliente red firewall "
+    "usuario licencia certificado vpn proxmox access trello actualizar migrar "
+    "configurar instalar documentar reunión informe base datos consulta error"
+).split()
+
+DAILY_FILES = ("notas.md", "captura.png", "informe.docx", "datos.xlsx", "script.ps1", "acta.pdf")
+
+
+def sentence(rng, words=12):
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def make_prd(day, tasks=10, body_lines=3, pending_ratio=0.2, log_lines=0,
+             missing_separators=False, seed=None):
+    """Return the markdown of a synthetic PRD for day (a date).
+
+    log_lines pastes a fenced log of that many lines into the first task;
+    missing_separators drops the '—' and the time of every fifth header.
+    """
+    rng = random.Random(seed if seed is not None else day.toordinal())
+    pending = int(tasks * pending_ratio)
+    completed = tasks - pending
+
+    def task_block(number, emoji, index, last_label):
+        minutes = 8 * 60 + index * max(1, (12 * 60) // max(tasks, 1))
+        time_str = f"{(minutes // 60) % 24:02d}:{minutes % 60:02d}"
+        title = sentence(rng, 5).rstrip('.')
+        if missing_separators and number % 5 == 0:
+            header = f"### {emoji} {number}. {title}"
+        else:
+            header = f"### {emoji} {number}. {title} — **{time_str}**"
+        lines = [header, "", "**Descripción**"]
+        lines.extend(sentence(rng) for _ in range(body_lines))
+        if log_lines and index == 0:
+            lines.append("```")
+            lines.extend(f"2026-01-01 10:{i % 60:02d}:00 INFO ### {i}. proceso — **10:00** ok"
+                         for i in range(log_lines))
+            lines.append("```")
+        lines += ["", last_label]
+        lines.extend(sentence(rng) for _ in range(max(1, body_lines // 2)))
+        lines.append("")
+        return lines
+
+    content = [
+        f"# PRD - {day.day} de {SPANISH_MONTHS[day.month]} de {day.year}",
+        "",
+        "## Resumen Ejecutivo",
+        "",
+        f"- **Tareas completadas**: {completed}",
+        f"- **Tareas pendientes**: {pending}",
+        f"- **Total de horas**: {tasks}h 0m",
+        "",
+        "---",
+        "",
+        "## Tareas Realizadas",
+        "",
+    ]
+    for number in range(1, completed + 1):
+        content += task_block(number, "✅", number - 1, "**Solución**")
+    content += ["---", "", "## Tareas Pendientes", ""]
+    for number in range(1, pending + 1):
+        content += task_block(number, "⏳", completed + number - 1, "**Estado**")
+    content += ["---", "", "## Notas", "", sentence(rng), ""]
+    return '\n'.join(content)
+
+
+def write_prd_corpus(output_dir, days=365, start=None, **options):
+    """Write PRD_YYYYMMDD.md files for `days` consecutive days.
+
+    Returns the list of written paths.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    start = start or date(2025, 1, 1)
+    paths = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        path = output_dir / f"PRD_{day:%Y%m%d}.md"
+        path.write_text(make_prd(day, **options), encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+def write_daily_tree(output_dir, days=365, start=None, files_per_day=8, subfolders=2, **options):
+    """Write a DAILY_WORK tree: one YYMMDD folder per day with its PRD,
+    some work files and a few subfolders (plus an ignored node_modules).
+
+    Returns the list of day folders.
+    """
+    output_dir = Path(output_dir)
+    start = start or date(2025, 1, 1)
+    folders = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        folder = output_dir / f"{day:%y%m%d}"
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / f"PRD_{day:%Y%m%d}.md").write_text(make_prd(day, **options), encoding='utf-8')
+
+        base = datetime(day.year, day.month, day.day, 8).timestamp()
+        for index in range(files_per_day):
+            target = folder
+            if subfolders and index % 3 == 2:
+                target = folder / f"proyecto_{index % subfolders}"
+                target.mkdir(exist_ok=True)
+            file = target / f"{index:02d}_{DAILY_FILES[index % len(DAILY_FILES)]}"
+            file.write_bytes(b"x" * (256 * (index + 1)))
+            os.utime(file, (base + index * 1800, base + index * 1800))
+
+        ignored = folder / "node_modules" / "paquete"
+        ignored.mkdir(parents=True, exist_ok=True)
+        (ignored / "index.js").write_text("module.exports = {};\n", encoding='utf-8')
+        folders.append(folder)
+    return folders
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generar PRD sintéticos para benchmarks",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python generate_corpus.py /tmp/corpus
+  python generate_corpus.py /tmp/corpus --tasks 1000 --days 5
+  python generate_corpus.py /tmp/corpus --log-lines 20000 --days 1
+  python generate_corpus.py /tmp/corpus --daily-work
+        """
+    )
+    parser.add_argument('output', help='Carpeta de salida')
+    parser.add_argument('--days', type=int, default=365, help='Número de días (default: 365)')
+    parser.add_argument('--start', default='20250101', help='Primer día YYYYMMDD (default: 20250101)')
+    parser.add_argument('--tasks', type=int, default=10, help='Tareas por día (default: 10)')
+    parser.add_argument('--body-lines', type=int, default=3, help='Líneas de descripción por tarea (default: 3)')
+    parser.add_argument('--pending-ratio', type=float, default=0.2, help='Proporción de pendientes (default: 0.2)')
+    parser.add_argument('--log-lines', type=int, default=0, help='Líneas de log pegadas en la primera tarea')
+    parser.add_argument('--missing-separators', action='store_true', help='Quitar separador y hora a 1 de cada 5 tareas')
+    parser.add_argument('--daily-work', action='store_true', help='Generar también DAILY_WORK/YYMMDD')
+    parser.add_argument('--files-per-day', type=int, default=8, help='Archivos por carpeta diaria (default: 8)')
+
+    args = parser.parse_args()
+    start = datetime.strptime(args.start, "%Y%m%d").date()
+    options = {
+        'tasks': args.tasks,
+        'body_lines': args.body_lines,
+        'pending_ratio': args.pending_ratio,
+        'log_lines': args.log_lines,
+        'missing_separators': args.missing_separators,
+    }
+
+    output = Path(args.output).expanduser()
+    paths = write_prd_corpus(output / "PRD_DOCUMENTS", args.days, start, **options)
+    print(f"✅ {len(paths)} PRD generados en {output / 'PRD_DOCUMENTS'}")
+    if args.daily_work:
+        folders = write_daily_tree(output / "DAILY_WORK", args.days, start, args.files_per_day, **options)
+        print(f"✅ {len(folders)} carpetas diarias generadas en {output / 'DAILY_WORK'}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
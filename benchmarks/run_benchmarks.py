@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+PRD Benchmarks
+Mide el tiempo de parseo y generación de los scripts sobre un corpus
+sintético (ver generate_corpus.py) y guarda los resultados en JSON para
+compararlos con una ejecución de referencia.
+
+Casos medidos para cada escenario (normal, grande, log pegado, sin
+separadores):
+- generate_dashboard.parse_prd_markdown
+- generate_hours_report.extract_tasks_from_prd
+- generate_day_summary.extract_tasks_from_prd
+- generate_dashboard.generate_html
+- generate_hours_report.generate_report
+y generate_day_summary.analyze_daily_folder sobre un árbol DAILY_WORK.
+
+Uso:
+    python run_benchmarks.py [--output results.json] [--baseline baseline.json]
+                             [--threshold 0.15] [--filter TEXTO] [--quick]
+
+Ejemplos:
+    python run_benchmarks.py --output baseline.json         # Guardar referencia
+    python run_benchmarks.py --baseline baseline.json       # Comparar tras un cambio
+    python run_benchmarks.py --filter html --quick
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import generate_dashboard
+import generate_day_summary
+import generate_hours_report
+from generate_corpus import make_prd, write_daily_tree, write_prd_corpus
+from prd_core import clear_loaded
+
+RESULTS_VERSION = 1
+START_DAY = date(2025, 1, 1)
+
+# name -> options for generate_corpus.make_prd
+SCENARIOS = {
+    'normal': {'tasks': 10, 'body_lines': 3},
+    'large': {'tasks': 1000, 'body_lines': 3},
+    'log': {'tasks': 10, 'body_lines': 3, 'log_lines': 20000},
+    'no_separators': {'tasks': 100, 'body_lines': 3, 'missing_separators': True},
+}
+
+
+def measure(function, repeat=5, min_time=0.2):
+    """Time function like timeit: calls per sample are chosen so a sample
+    lasts at least min_time. Returns per-call statistics in milliseconds."""
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    samples = [elapsed / number] + [timer.timeit(number) / number for _ in range(repeat - 1)]
+    return {
+        'median_ms': statistics.median(samples) * 1000,
+        'min_ms': min(samples) * 1000,
+        'number': number,
+        'repeat': repeat,
+    }
+
+
+def build_cases(workdir, daily_days):
+    """Return {case name: callable} over a corpus written to workdir."""
+    cases = {}
+    output_dir = workdir / "REPORTS"
+    output_dir.mkdir()
+
+    for scenario, options in SCENARIOS.items():
+        prd_file = write_prd_corpus(workdir / scenario, 1, START_DAY, **options)[0]
+        content = prd_file.read_text(encoding='utf-8')
+        data = generate_dashboard.parse_prd_markdown(content)
+
+        def report(prd_file=prd_file):
+            # Cold parse every call: drop the model load_prd() keeps
+            clear_loaded()
+            generate_hours_report.generate_report(prd_file, output_dir, force=True)
+
+        cases[f'{scenario}/parse_prd_markdown'] = lambda c=content: generate_dashboard.parse_prd_markdown(c)
+        cases[f'{scenario}/hours.extract_tasks_from_prd'] = lambda c=content: generate_hours_report.extract_tasks_from_prd(c)
+        cases[f'{scenario}/summary.extract_tasks_from_prd'] = lambda c=content: generate_day_summary.extract_tasks_from_prd(c)
+        cases[f'{scenario}/generate_html'] = lambda d=data: generate_dashboard.generate_html(d)
+        cases[f'{scenario}/generate_report'] = report
+
+    days = [START_DAY + timedelta(days=offset) for offset in range(daily_days)]
+    daily_dir = workdir / "DAILY_WORK"
+    write_daily_tree(daily_dir, daily_days, START_DAY, **SCENARIOS['normal'])
+
+    def analyze_all():
+        clear_loaded()
+        for day in days:
+            generate_day_summary.analyze_daily_folder(datetime(day.year, day.month, day.day), daily_dir)
+
+    cases[f'daily_work_{daily_days}d/analyze_daily_folder'] = analyze_all
+    return cases
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=Path(__file__).parent,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    """Print current vs baseline medians. Returns the names that regressed."""
+    regressions = []
+    print(f"\n{'Caso':<48} {'Base (ms)':>11} {'Actual (ms)':>12} {'Ratio':>7}")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            print(f"{name:<48} {'—':>11} {current['median_ms']:>12.3f} {'nuevo':>7}")
+            continue
+        ratio = current['median_ms'] / previous['median_ms'] if previous['median_ms'] else 1.0
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = ' ⚠️'
+            regressions.append(name)
+        print(f"{name:<48} {previous['median_ms']:>11.3f} {current['median_ms']:>12.3f} {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Medir el rendimiento de los scripts PRD",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python run_benchmarks.py --output baseline.json
+  python run_benchmarks.py --baseline baseline.json
+  python run_benchmarks.py --filter html --quick
+        """
+    )
+    parser.add_argument('--output', default=None, help='Guardar resultados en este JSON')
+    parser.add_argument('--baseline', default=None, help='JSON de referencia con el que comparar')
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help='Ralentización tolerada antes de marcar regresión (default: 0.15 = 15%%)')
+    parser.add_argument('--filter', default=None, help='Medir solo los casos que contienen este texto')
+    parser.add_argument('--repeat', type=int, default=5, help='Muestras por caso (default: 5)')
+    parser.add_argument('--daily-days', type=int, default=60, help='Carpetas diarias para analyze_daily_folder (default: 60)')
+    parser.add_argument('--quick', action='store_true', help='Menos muestras y carpetas (para probar cambios rápido)')
+
+    args = parser.parse_args()
+    repeat = 3 if args.quick else args.repeat
+    min_time = 0.05 if args.quick else 0.2
+    daily_days = 10 if args.quick else args.daily_days
+
+    results = {}
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="prd_bench_") as tmp:
+        cases = build_cases(Path(tmp), daily_days)
+        for name, function in cases.items():
+            if args.filter and args.filter not in name:
+                continue
+            results[name] = measure(function, repeat, min_time)
+            print(f"⏱️  {name:<48} {results[name]['median_ms']:>10.3f} ms")
+
+    print(f"\n✅ {len(results)} casos medidos en {time.perf_counter() - started:.1f}s")
+
+    if args.output:
+        output = {
+            'version': RESULTS_VERSION,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
+        print(f"📁 Resultados guardados en {args.output}")
+
+    if args.baseline:
+        try:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f).get('results', {})
+        except (OSError, ValueError) as e:
+            print(f"❌ Error al leer la referencia: {e}")
+            return 1
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n⚠️  {len(regressions)} caso(s) más lentos que la referencia (> {args.threshold:.0%})")
+            return 1
+        print("\n✅ Sin regresiones respecto a la referencia")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
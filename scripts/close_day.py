@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Close Day
+Cierre del día en una sola pasada: genera el reporte de horas (HORAS_), el
+resumen (RESUMEN_) y el dashboard (_DASHBOARD.html) de una fecha.
+
+- El PRD_YYYYMMDD.md se lee y se parsea una sola vez; los tres reportes se
+  generan desde el mismo modelo
+- La carpeta DAILY_WORK/YYMMDD se recorre una sola vez
+- Las escrituras, independientes entre sí, van a un pequeño pool de hilos
+- Los reportes al día (según el manifiesto de prd_build) no se regeneran
+- Muestra el tiempo total del cierre
+
+Si la carpeta del día no tiene su propio PRD, el resumen usa las tareas del
+PRD de PRD_DOCUMENTS.
+
+Uso:
+    python close_day.py [--date YYYYMMDD] [--prd-path ./PRD_DOCUMENTS] [--path ./DAILY_WORK]
+                        [--output ./reports] [--force]
+
+Ejemplos:
+    python close_day.py                         # Cierre de hoy
+    python close_day.py --date 20260216         # Cierre de una fecha concreta
+    python close_day.py --output ./reports      # Los tres reportes en una carpeta
+"""
+
+import argparse
+import time
+from datetime import datetime
+from pathlib import Path
+
+import generate_dashboard
+import generate_day_summary
+import generate_hours_report
+from prd_build import add_build_arguments, manifest_for, write_if_changed
+from prd_core import read_prd_file
+from prd_scan import DEFAULT_MAX_DEPTH, scan_folder
+from prd_trace import add_trace_arguments, setup_trace, span
+
+# One thread per report: HORAS_, RESUMEN_ and _DASHBOARD
+DEFAULT_WRITE_WORKERS = 3
+
+
+def plan_reports(date_obj, prd_path, daily_dir, output_dir=None, max_depth=DEFAULT_MAX_DEPTH,
+                 scan_workers=None, external_assets=False, layout='auto'):
+    """Read the PRD, scan the day folder and describe the three reports.
+
+    Returns (jobs, warnings). Each job is (label, path, inputs, render);
+    render() returns the report text, or raises ValueError if the report
+    cannot be built.
+    """
+    prd, prd_hash = read_prd_file(prd_path)
+    warnings = [f"Línea {d.line}: {d.message}" for d in prd.diagnostics]
+    jobs = []
+
+    def render_hours():
+        with span('render', report='hours'):
+            content, error = generate_hours_report.render_report(prd)
+        if error:
+            raise ValueError(error)
+        return content
+
+    jobs.append(('Horas', generate_hours_report.report_path(prd_path, output_dir),
+                 generate_hours_report.report_inputs(prd_path, prd_hash), render_hours))
+
+    folder_path = Path(daily_dir).expanduser() / date_obj.strftime("%y%m%d")
+    if folder_path.is_dir():
+        files = scan_folder(folder_path, max_depth, workers=scan_workers)
+        # The folder exists, so planning cannot fail
+        (summary_path, inputs, render), _ = generate_day_summary.plan_summary(
+            date_obj, daily_dir, output_dir, max_depth, prepared=(files, None, None),
+            prd_dir=prd_path.parent, prd=prd, prd_hash=prd_hash)
+
+        def render_summary():
+            _, content = render()
+            return content
+
+        jobs.append(('Resumen', summary_path, inputs, render_summary))
+    else:
+        warnings.append(f"Sin resumen: carpeta no encontrada: {folder_path}")
+
+    dashboard_file = generate_dashboard.dashboard_path(prd_path, output_dir)
+    assets = generate_dashboard.write_assets(dashboard_file.parent) if external_assets else None
+
+    def render_dashboard():
+        with span('render', report='dashboard'):
+            return generate_dashboard.generate_html(generate_dashboard.prd_to_dashboard_data(prd),
+                                                    assets, layout)
+
+    jobs.append(('Dashboard', dashboard_file,
+                 generate_dashboard.dashboard_inputs(prd_path, assets, layout, prd_hash), render_dashboard))
+    return jobs, warnings
+
+
+def close_day(date_obj, prd_dir, daily_dir, output_dir=None, force=False, max_depth=DEFAULT_MAX_DEPTH,
+              scan_workers=None, write_workers=DEFAULT_WRITE_WORKERS, external_assets=False, layout='auto'):
+    """Generate the hours report, summary and dashboard of one day.
+
+    Reports are rendered one after another on this thread (rendering is
+    CPU bound) while the previous ones are written by a thread pool.
+
+    Returns (results, warnings, error); results is a list of
+    (label, path, state) with state 'generado', 'sin cambios' (same bytes
+    as on disk), 'al día' (inputs unchanged) or an error message.
+    """
+    prd_path = Path(prd_dir).expanduser() / f"PRD_{date_obj.strftime('%Y%m%d')}.md"
+    if not prd_path.exists():
+        return [], [], f"Archivo no encontrado: {prd_path}"
+
+    jobs, warnings = plan_reports(date_obj, prd_path, daily_dir, output_dir, max_depth,
+                                  scan_workers, external_assets, layout)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    results = []
+    pending = []
+    with ThreadPoolExecutor(max_workers=max(1, write_workers)) as pool:
+        for label, path, inputs, render in jobs:
+            if not force and manifest_for(path).is_fresh(path, inputs):
+                results.append((label, str(path), 'al día'))
+                continue
+            try:
+                content = render()
+            except ValueError as e:
+                results.append((label, str(path), str(e)))
+                continue
+            pending.append((label, path, inputs, pool.submit(write_if_changed, path, content)))
+
+        # The manifests are not thread-safe: record from this thread only
+        manifests = []
+        for label, path, inputs, future in pending:
+            try:
+                written = future.result()
+            except OSError as e:
+                results.append((label, str(path), f"Error al escribir: {e}"))
+                continue
+            manifest = manifest_for(path)
+            manifest.record(path, inputs)
+            if manifest not in manifests:
+                manifests.append(manifest)
+            results.append((label, str(path), 'generado' if written else 'sin cambios'))
+
+    for manifest in manifests:
+        manifest.save()
+
+    order = [job[0] for job in jobs]
+    results.sort(key=lambda result: order.index(result[0]))
+    return results, warnings, None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Cierre del día: reporte de horas, resumen y dashboard en una sola pasada",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python close_day.py                         # Cierre de hoy
+  python close_day.py --date 20260216         # Cierre de una fecha concreta
+  python close_day.py --output ./reports      # Los tres reportes en una carpeta
+        """
+    )
+    parser.add_argument('--date', help='Fecha en formato YYYYMMDD (default: hoy)')
+    parser.add_argument('--prd-path', default=None,
+                        help=f'Carpeta PRD_DOCUMENTS (default: {generate_hours_report.DEFAULT_PRD_DIR})')
+    parser.add_argument('--path', default=None,
+                        help=f'Carpeta DAILY_WORK (default: {generate_day_summary.DEFAULT_BASE_DIR})')
+    parser.add_argument('--output', default=None, help='Carpeta de salida de los reportes (default: la de cada script)')
+    parser.add_argument('--depth', type=int, default=DEFAULT_MAX_DEPTH,
+                        help=f'Niveles de subcarpetas a analizar (default: {DEFAULT_MAX_DEPTH})')
+    parser.add_argument('--scan-workers', type=int, default=None,
+                        help='Hilos para leer metadatos en paralelo (útil en carpetas de red o sincronizadas)')
+    parser.add_argument('--write-workers', type=int, default=DEFAULT_WRITE_WORKERS,
+                        help=f'Hilos para escribir los reportes (default: {DEFAULT_WRITE_WORKERS})')
+    parser.add_argument('--assets', choices=('inline', 'external'), default='inline',
+                        help='CSS/JS del dashboard dentro del HTML (inline) o en archivos compartidos (external)')
+    parser.add_argument('--layout', choices=generate_dashboard.LAYOUTS, default='auto',
+                        help='Tarjetas estáticas (cards) o lista virtual (virtual) en el dashboard')
+    add_build_arguments(parser)
+    add_trace_arguments(parser)
+
+    args = parser.parse_args(argv)
+    setup_trace(args)
+    started = time.perf_counter()
+
+    try:
+        date_obj = generate_day_summary.parse_date(args.date) if args.date else datetime.now()
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return 1
+
+    prd_dir = args.prd_path or generate_hours_report.DEFAULT_PRD_DIR
+    daily_dir = args.path or generate_day_summary.DEFAULT_BASE_DIR
+
+    print(f"🌙 Cerrando el día {generate_day_summary.format_spanish_date(date_obj)}...")
+    results, warnings, error = close_day(date_obj, prd_dir, daily_dir, args.output, args.force,
+                                         args.depth, args.scan_workers, args.write_workers,
+                                         args.assets == 'external', args.layout)
+    if error:
+        print(f"❌ Error: {error}")
+        return 1
+
+    for warning in warnings:
+        print(f"⚠️  {warning}")
+    failed = False
+    for label, path, state in results:
+        if state in ('generado', 'sin cambios', 'al día'):
+            print(f"   ✅ {label} {state}: {path}")
+        else:
+            failed = True
+            print(f"   ❌ {label}: {state}")
+
+    elapsed = time.perf_counter() - started
+    print(f"⏱️  Cierre completado en {elapsed * 1000:.0f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    exit(main())
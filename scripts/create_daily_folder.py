@@ -14,21 +14,21 @@ Ejemplos:
 
 import argparse
 import os
-import json
 from datetime import datetime
 from pathlib import Path
 
+from prd_config import load_config
+from prd_trace import add_trace_arguments, setup_trace
+
 # Load configuration
-CONFIG_FILE = Path(__file__).parent.parent / "config.json"
 DEFAULT_DAILY_WORK_DIR = "~/Documents/prd_diarios/DAILY_WORK"
 
-if CONFIG_FILE.exists():
+config = load_config()
+if config:
     try:
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-            DEFAULT_DAILY_WORK_DIR = os.path.expanduser(
-                config.get("folders", {}).get("daily_work", DEFAULT_DAILY_WORK_DIR)
-            )
+        DEFAULT_DAILY_WORK_DIR = os.path.expanduser(
+            config.get("folders", {}).get("daily_work", DEFAULT_DAILY_WORK_DIR)
+        )
     except Exception:
         pass
 
@@ -108,7 +108,7 @@ Esta carpeta contiene todos los documentos del trabajo realizado durante el día
         return folder_name, str(folder_path), False, str(e)
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Crear una carpeta diaria con formato YYMMDD en DAILY_WORK",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -121,8 +121,10 @@ Ejemplos:
     )
     parser.add_argument('--date', help='Fecha en formato YYYYMMDD (default: hoy)')
     parser.add_argument('--path', default=None, help=f'Ruta base (default: {DEFAULT_DAILY_WORK_DIR})')
+    add_trace_arguments(parser)
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    setup_trace(args)
     
     folder_name, folder_path, success, message = create_daily_folder(args.date, args.path)
     
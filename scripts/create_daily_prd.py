@@ -14,31 +14,33 @@ Ejemplos:
 
 import argparse
 import os
-import json
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from prd_config import load_config
+from prd_core import parse_prd, write_sidecar
+from prd_trace import add_trace_arguments, setup_trace
+from prd_write import locked, write_atomic
+
 # Load configuration
-CONFIG_FILE = Path(__file__).parent.parent / "config.json"
 DEFAULT_BASE_DIR = "."
 USE_DAILY_FOLDERS = True
 PRD_DOCUMENTS_DIR = "~/Documents/prd_diarios/PRD_DOCUMENTS"
 
-if CONFIG_FILE.exists():
+config = load_config()
+if config:
     try:
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-            # Try to get PRD documents directory from folders config
-            prd_docs = config.get("folders", {}).get("prd_documents")
-            if prd_docs:
-                PRD_DOCUMENTS_DIR = os.path.expanduser(prd_docs)
-            # Fallback to old config format
-            if not prd_docs:
-                DEFAULT_BASE_DIR = os.path.expanduser(
-                    config.get("prd_base_directory", ".")
-                )
-                PRD_DOCUMENTS_DIR = DEFAULT_BASE_DIR
-            USE_DAILY_FOLDERS = config.get("features", {}).get("use_daily_folders", True)
+        # Try to get PRD documents directory from folders config
+        prd_docs = config.get("folders", {}).get("prd_documents")
+        if prd_docs:
+            PRD_DOCUMENTS_DIR = os.path.expanduser(prd_docs)
+        # Fallback to old config format
+        if not prd_docs:
+            DEFAULT_BASE_DIR = os.path.expanduser(
+                config.get("prd_base_directory", ".")
+            )
+            PRD_DOCUMENTS_DIR = DEFAULT_BASE_DIR
+        USE_DAILY_FOLDERS = config.get("features", {}).get("use_daily_folders", True)
     except Exception:
         PRD_DOCUMENTS_DIR = DEFAULT_BASE_DIR
 
@@ -133,25 +135,25 @@ def create_prd(date_str=None, path=None):
     filename = f"PRD_{date_formatted}.md"
     filepath = output_dir / filename
     
-    # Check if file already exists
-    if filepath.exists():
-        return filename, str(filepath), False, "Archivo ya existe"
-    
     # Generate content
     date_spanish = format_spanish_date(date_obj)
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     content = TEMPLATE.format(date_spanish=date_spanish, timestamp=timestamp)
     
-    # Write file
+    # Check and write under the PRD lock: another session may be creating
+    # the same day, or already adding tasks to it
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        with locked(filepath):
+            if filepath.exists():
+                return filename, str(filepath), False, "Archivo ya existe"
+            write_atomic(filepath, content)
+            write_sidecar(filepath, content, parse_prd(content))
         return filename, str(filepath), True, "Creado exitosamente"
     except Exception as e:
         return filename, str(filepath), False, str(e)
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Crear un nuevo PRD diario en carpeta PRD_DOCUMENTS",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -164,8 +166,10 @@ Ejemplos:
     )
     parser.add_argument('--date', help='Fecha en formato YYYYMMDD (default: hoy)')
     parser.add_argument('--path', default=None, help=f'Ruta (default: {PRD_DOCUMENTS_DIR})')
+    add_trace_arguments(parser)
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    setup_trace(args)
     
     filename, filepath, success, message = create_prd(args.date, args.path)
     
@@ -5,153 +5,62 @@ Convierte un PRD Markdown a un Dashboard HTML visual e interactivo.
 
 Uso:
     python generate_dashboard.py PRD_260216.md [--output ./path]
+    python generate_dashboard.py --all | --from YYYYMMDD --to YYYYMMDD [--workers N]
+    python generate_dashboard.py ... [--assets auto|inline|external] [--layout auto|cards|virtual]
 
 Genera: PRD_260216_DASHBOARD.html (auto-abre en navegador)
+En modo lote el CSS y el JS se escriben una sola vez por carpeta
+(prd-dashboard.<hash>.css/.js) y cada dashboard los enlaza.
+Los días con cientos de tareas usan una lista virtual: las tareas van como
+JSON y el navegador solo dibuja las filas visibles.
 """
 
 import argparse
-import re
+import glob
 import json
 import os
+import time
 from pathlib import Path
 from datetime import datetime
 
+from prd_build import add_build_arguments, code_fingerprint, hash_bytes, manifest_for, write_if_changed
+from prd_config import load_config
+from prd_cache import ParseCache, add_cache_arguments, setup_parse_cache
+from prd_storage import add_io_arguments, add_storage_arguments, as_entry, entry_hash, load_entry, open_storage
+from prd_store import TaskStore, add_store_arguments, setup_store
+from prd_core import parse_prd, set_parse_cache
+from prd_trace import add_trace_arguments, setup_trace, span
+
 # Load configuration
-CONFIG_FILE = Path(__file__).parent.parent / "config.json"
 DEFAULT_OUTPUT_DIR = None
+DEFAULT_REPORTS_DIR = None
+DEFAULT_PRD_DIR = "~/Documents/prd_diarios/PRD_DOCUMENTS"
 
-if CONFIG_FILE.exists():
+config = load_config()
+if config:
     try:
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-            default_output = config.get("prd_output_directory", None)
-            if default_output:
-                DEFAULT_OUTPUT_DIR = os.path.expanduser(default_output)
+        default_output = config.get("prd_output_directory", None)
+        if default_output:
+            DEFAULT_OUTPUT_DIR = os.path.expanduser(default_output)
+        reports_dir = config.get("folders", {}).get("reports")
+        if reports_dir:
+            DEFAULT_REPORTS_DIR = os.path.expanduser(reports_dir)
+        prd_docs = config.get("folders", {}).get("prd_documents")
+        if prd_docs:
+            DEFAULT_PRD_DIR = os.path.expanduser(prd_docs)
     except Exception:
         pass
 
-def parse_prd_markdown(content):
-    """Parse PRD markdown content to extract structured data."""
-    data = {
-        'date': '',
-        'summary': {},
-        'completed_tasks': [],
-        'pending_tasks': [],
-        'notes': ''
-    }
-    
-    # Extract date
-    date_match = re.search(r'# PRD - (.+)', content)
-    if date_match:
-        data['date'] = date_match.group(1).strip()
-    
-    # Extract summary (key: value pairs)
-    summary_section = re.search(r'## Resumen Ejecutivo\n(.*?)\n---', content, re.DOTALL)
-    if summary_section:
-        summary_text = summary_section.group(1)
-        for line in summary_text.split('\n'):
-            if '**' in line and ':' in line:
-                match = re.search(r'\*\*(.+?)\*\*:\s*(.+)', line)
-                if match:
-                    key, value = match.groups()
-                    data['summary'][key.strip()] = value.strip()
-    
-    # Extract completed tasks - more flexible pattern
-    completed_pattern = r'###\s+.+?\s+(\d+)\.\s+(.+?)\s+(?:—|--)\s+\*\*(\d{2}:\d{2})\*\*\n+\*\*Descripción\*\*\s*\n\n?(.+?)\n+\*\*Solución\*\*\s*\n\n?(.+?)(?=\n---\n###|\n\n###|$)'
-    for match in re.finditer(completed_pattern, content, re.DOTALL):
-        task_num, task_name, time_str, desc, solution = match.groups()
-        data['completed_tasks'].append({
-            'number': task_num,
-            'name': task_name.strip(),
-            'time': time_str,
-            'description': desc.strip(),
-            'solution': solution.strip()
-        })
-    
-    # Extract pending tasks - more flexible pattern
-    pending_pattern = r'###\s+.+?\s+(\d+)\.\s+(.+?)\s+(?:—|--)\s+\*\*(\d{2}:\d{2})\*\*\n+\*\*Descripción\*\*\s*\n\n?(.+?)\n+\*\*Estado\*\*\s*\n\n?(.+?)(?=\n---\n###|\n\n###|$)'
-    for match in re.finditer(pending_pattern, content, re.DOTALL):
-        task_num, task_name, time_str, desc, status = match.groups()
-        data['pending_tasks'].append({
-            'number': task_num,
-            'name': task_name.strip(),
-            'time': time_str,
-            'description': desc.strip(),
-            'status': status.strip()
-        })
-    
-    return data
-
-def generate_html(prd_data):
-    """Generate HTML dashboard from PRD data."""
-    
-    completed_count = len(prd_data['completed_tasks'])
-    pending_count = len(prd_data['pending_tasks'])
-    total_tasks = completed_count + pending_count
-    completion_pct = int((completed_count / total_tasks * 100)) if total_tasks > 0 else 0
-    
-    # Extract hours from summary
-    total_hours = prd_data['summary'].get('Total de horas', '0h 0m')
-    
-    # Generate task cards HTML
-    completed_html = ''
-    for task in prd_data['completed_tasks']:
-        completed_html += f"""
-        <div class="task-card completed" data-task-id="completed-{task['number']}">
-            <div class="task-header">
-                <span class="task-emoji">✅</span>
-                <h3 class="task-title">{task['number']}. {task['name']}</h3>
-                <span class="task-time">🕐 {task['time']}</span>
-            </div>
-            <div class="task-body">
-                <div class="task-section">
-                    <h4>📝 Descripción</h4>
-                    <p>{task['description']}</p>
-                </div>
-                <div class="task-section">
-                    <h4>✔️ Solución</h4>
-                    <p>{task['solution']}</p>
-                </div>
-            </div>
-        </div>
-        """
-    
-    pending_html = ''
-    for task in prd_data['pending_tasks']:
-        pending_html += f"""
-        <div class="task-card pending" data-task-id="pending-{task['number']}">
-            <div class="task-header">
-                <span class="task-emoji">⏳</span>
-                <h3 class="task-title">{task['number']}. {task['name']}</h3>
-                <span class="task-time">🕐 {task['time']}</span>
-            </div>
-            <div class="task-body">
-                <div class="task-section">
-                    <h4>📝 Descripción</h4>
-                    <p>{task['description']}</p>
-                </div>
-                <div class="task-section">
-                    <h4>📊 Estado</h4>
-                    <p><strong>{task['status']}</strong></p>
-                </div>
-            </div>
-        </div>
-        """
-    
-    html = f"""<!DOCTYPE html>
-<html lang="es">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PRD Dashboard - {prd_data['date']}</title>
-    <style>
-        * {{
+# Dashboard stylesheet and theme script. Inlined in every page by default;
+# with external assets they are written once per folder as
+# prd-dashboard.<hash>.css/.js and referenced from each page.
+DASHBOARD_CSS = """        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        :root {{
+        :root {
             --primary: #6366f1;
             --primary-dark: #4f46e5;
             --success: #10b981;
@@ -164,49 +73,49 @@ def generate_html(prd_data):
             --text-light: #1e293b;
             --border-dark: #334155;
             --border-light: #e2e8f0;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
             transition: background-color 0.3s, color 0.3s;
             padding: 20px;
-        }}
+        }
         
-        body.dark-mode {{
+        body.dark-mode {
             background-color: var(--bg-dark);
             color: var(--text-dark);
-        }}
+        }
         
-        body.light-mode {{
+        body.light-mode {
             background-color: var(--bg-light);
             color: var(--text-light);
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
-        }}
+        }
         
-        .header {{
+        .header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 40px;
             padding-bottom: 20px;
             border-bottom: 2px solid var(--border-dark);
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 2.5em;
             margin-bottom: 5px;
-        }}
+        }
         
-        .header-date {{
+        .header-date {
             font-size: 1.1em;
             opacity: 0.8;
-        }}
+        }
         
-        .theme-toggle {{
+        .theme-toggle {
             background: var(--primary);
             color: white;
             border: none;
@@ -215,201 +124,514 @@ def generate_html(prd_data):
             cursor: pointer;
             font-size: 1em;
             transition: background-color 0.3s;
-        }}
+        }
         
-        .theme-toggle:hover {{
+        .theme-toggle:hover {
             background-color: var(--primary-dark);
-        }}
+        }
         
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin-bottom: 40px;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             padding: 25px;
             border-radius: 12px;
             border: 1px solid var(--border-dark);
-        }}
+        }
         
-        body.dark-mode .stat-card {{
+        body.dark-mode .stat-card {
             background-color: var(--card-dark);
-        }}
+        }
         
-        body.light-mode .stat-card {{
+        body.light-mode .stat-card {
             background-color: var(--card-light);
             border-color: var(--border-light);
-        }}
+        }
         
-        .stat-card h3 {{
+        .stat-card h3 {
             font-size: 0.9em;
             opacity: 0.7;
             margin-bottom: 10px;
             text-transform: uppercase;
             letter-spacing: 1px;
-        }}
+        }
         
-        .stat-value {{
+        .stat-value {
             font-size: 2.5em;
             font-weight: bold;
             color: var(--primary);
             margin-bottom: 10px;
-        }}
+        }
         
-        .stat-subtext {{
+        .stat-subtext {
             font-size: 0.9em;
             opacity: 0.7;
-        }}
+        }
         
-        .progress-bar {{
+        .progress-bar {
             width: 100%;
             height: 8px;
             background-color: var(--border-dark);
             border-radius: 4px;
             overflow: hidden;
             margin-top: 10px;
-        }}
+        }
         
-        .progress-fill {{
+        .progress-fill {
             height: 100%;
             background: linear-gradient(90deg, var(--success), var(--primary));
             transition: width 0.5s ease;
-        }}
+        }
         
-        .section {{
+        .section {
             margin-bottom: 50px;
-        }}
+        }
         
-        .section h2 {{
+        .section h2 {
             font-size: 1.8em;
             margin-bottom: 25px;
             padding-bottom: 10px;
             border-bottom: 3px solid var(--primary);
-        }}
+        }
         
-        .tasks-grid {{
+        .tasks-grid {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(350px, 1fr));
             gap: 20px;
-        }}
+        }
         
-        .task-card {{
+        .task-card {
             border-radius: 12px;
             border: 2px solid var(--border-dark);
             overflow: hidden;
             transition: all 0.3s;
             cursor: pointer;
-        }}
+        }
         
-        body.dark-mode .task-card {{
+        body.dark-mode .task-card {
             background-color: var(--card-dark);
-        }}
+        }
         
-        body.light-mode .task-card {{
+        body.light-mode .task-card {
             background-color: var(--card-light);
             border-color: var(--border-light);
-        }}
+        }
         
-        .task-card:hover {{
+        .task-card:hover {
             transform: translateY(-5px);
             box-shadow: 0 10px 25px rgba(99, 102, 241, 0.2);
-        }}
+        }
         
-        .task-card.completed .task-header {{
+        .task-card.completed .task-header {
             background: linear-gradient(135deg, rgba(16, 185, 129, 0.1), rgba(99, 102, 241, 0.1));
             border-bottom: 2px solid var(--success);
-        }}
+        }
         
-        .task-card.pending .task-header {{
+        .task-card.pending .task-header {
             background: linear-gradient(135deg, rgba(245, 158, 11, 0.1), rgba(99, 102, 241, 0.1));
             border-bottom: 2px solid var(--warning);
-        }}
+        }
         
-        .task-header {{
+        .task-header {
             padding: 20px;
             display: flex;
             align-items: center;
             gap: 15px;
-        }}
+        }
         
-        .task-emoji {{
+        .task-emoji {
             font-size: 1.8em;
-        }}
+        }
         
-        .task-title {{
+        .task-title {
             flex: 1;
             font-size: 1.1em;
-        }}
+        }
         
-        .task-time {{
+        .task-time {
             font-size: 0.9em;
             opacity: 0.7;
             white-space: nowrap;
-        }}
+        }
         
-        .task-body {{
+        .task-body {
             padding: 20px;
-        }}
+        }
         
-        .task-section {{
+        .task-section {
             margin-bottom: 15px;
-        }}
+        }
         
-        .task-section:last-child {{
+        .task-section:last-child {
             margin-bottom: 0;
-        }}
+        }
         
-        .task-section h4 {{
+        .task-section h4 {
             font-size: 0.9em;
             margin-bottom: 8px;
             opacity: 0.8;
             font-weight: 600;
-        }}
+        }
         
-        .task-section p {{
+        .task-section p {
             font-size: 0.95em;
             line-height: 1.6;
             opacity: 0.9;
-        }}
+        }
         
-        .empty-state {{
+        .empty-state {
             text-align: center;
             padding: 40px;
             opacity: 0.6;
-        }}
+        }
         
-        .empty-state-icon {{
+        .empty-state-icon {
             font-size: 3em;
             margin-bottom: 10px;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            .header {{
+        @media (max-width: 768px) {
+            .header {
                 flex-direction: column;
                 gap: 20px;
                 text-align: center;
-            }}
+            }
             
-            .tasks-grid {{
+            .tasks-grid {
                 grid-template-columns: 1fr;
-            }}
+            }
             
-            .stats-grid {{
+            .stats-grid {
                 grid-template-columns: 1fr;
-            }}
-        }}
+            }
+        }
         
-        footer {{
+        footer {
             text-align: center;
             margin-top: 50px;
             padding-top: 20px;
             border-top: 1px solid var(--border-dark);
             opacity: 0.6;
             font-size: 0.9em;
-        }}
-    </style>
+        }
+"""
+
+DASHBOARD_JS = """        // Tema oscuro/claro
+        function toggleTheme() {
+            const body = document.body;
+            const button = document.querySelector('.theme-toggle');
+            
+            if (body.classList.contains('dark-mode')) {
+                body.classList.remove('dark-mode');
+                body.classList.add('light-mode');
+                button.textContent = '☀️ Modo Claro';
+                localStorage.setItem('theme', 'light');
+            } else {
+                body.classList.remove('light-mode');
+                body.classList.add('dark-mode');
+                button.textContent = '🌙 Modo Oscuro';
+                localStorage.setItem('theme', 'dark');
+            }
+        }
+        
+        // Restaurar tema guardado
+        window.addEventListener('DOMContentLoaded', () => {
+            const savedTheme = localStorage.getItem('theme') || 'dark';
+            document.body.classList.add(savedTheme + '-mode');
+            const button = document.querySelector('.theme-toggle');
+            button.textContent = savedTheme === 'dark' ? '☀️ Modo Claro' : '🌙 Modo Oscuro';
+        });
+"""
+
+# Virtual layout: tasks travel as one JSON payload and the browser only
+# creates the rows in view; the detail of a task is built when clicked.
+VIRTUAL_CSS = """        .virtual-list {
+            position: relative;
+            max-height: 70vh;
+            overflow-y: auto;
+            border-radius: 12px;
+            border: 2px solid var(--border-dark);
+        }
+        
+        body.light-mode .virtual-list {
+            border-color: var(--border-light);
+        }
+        
+        .virtual-spacer {
+            position: relative;
+        }
+        
+        .virtual-row {
+            position: absolute;
+            left: 0;
+            right: 0;
+            height: 56px;
+            padding: 0 20px;
+            display: flex;
+            align-items: center;
+            gap: 15px;
+            cursor: pointer;
+            border-bottom: 1px solid var(--border-dark);
+        }
+        
+        body.light-mode .virtual-row {
+            border-bottom-color: var(--border-light);
+        }
+        
+        .virtual-row:hover {
+            background: rgba(99, 102, 241, 0.1);
+        }
+        
+        .virtual-row .task-title {
+            font-size: 1em;
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
+        }
+        
+        .virtual-detail {
+            margin-top: 20px;
+        }
+"""
+
+VIRTUAL_JS = """        // Lista virtual: solo se crean las filas visibles
+        (function () {
+            const payload = document.getElementById('prd-tasks');
+            if (!payload) return;
+            const data = JSON.parse(payload.textContent);
+            const ROW_HEIGHT = 56;
+            const OVERSCAN = 10;
+            const LABELS = {
+                completed: ['✅', '✔️ Solución'],
+                pending: ['⏳', '📊 Estado']
+            };
+            
+            function element(tag, className, text) {
+                const node = document.createElement(tag);
+                if (className) node.className = className;
+                if (text !== undefined) node.textContent = text;
+                return node;
+            }
+            
+            function showDetail(group, task, panel) {
+                const [number, name, time, description, closing] = task;
+                const card = element('div', 'task-card ' + group);
+                const header = element('div', 'task-header');
+                header.append(
+                    element('span', 'task-emoji', LABELS[group][0]),
+                    element('h3', 'task-title', number + '. ' + name),
+                    element('span', 'task-time', '🕐 ' + time)
+                );
+                const body = element('div', 'task-body');
+                [['📝 Descripción', description], [LABELS[group][1], closing]].forEach(([title, text]) => {
+                    const section = element('div', 'task-section');
+                    section.append(element('h4', null, title), element('p', null, text));
+                    body.append(section);
+                });
+                card.append(header, body);
+                panel.replaceChildren(card);
+            }
+            
+            document.querySelectorAll('.virtual-list').forEach(list => {
+                const group = list.dataset.group;
+                const tasks = data[group] || [];
+                const panel = document.querySelector('.virtual-detail[data-group="' + group + '"]');
+                const spacer = element('div', 'virtual-spacer');
+                spacer.style.height = (tasks.length * ROW_HEIGHT) + 'px';
+                list.append(spacer);
+                
+                let first = -1;
+                let last = -1;
+                let queued = false;
+                function render() {
+                    queued = false;
+                    const start = Math.max(0, Math.floor(list.scrollTop / ROW_HEIGHT) - OVERSCAN);
+                    const end = Math.min(tasks.length, Math.ceil((list.scrollTop + list.clientHeight) / ROW_HEIGHT) + OVERSCAN);
+                    if (start === first && end === last) return;
+                    first = start;
+                    last = end;
+                    const rows = document.createDocumentFragment();
+                    for (let i = start; i < end; i++) {
+                        const row = element('div', 'virtual-row ' + group);
+                        row.style.top = (i * ROW_HEIGHT) + 'px';
+                        row.dataset.index = i;
+                        row.append(
+                            element('span', 'task-emoji', LABELS[group][0]),
+                            element('span', 'task-title', tasks[i][0] + '. ' + tasks[i][1]),
+                            element('span', 'task-time', '🕐 ' + tasks[i][2])
+                        );
+                        rows.append(row);
+                    }
+                    spacer.replaceChildren(rows);
+                }
+                
+                list.addEventListener('scroll', () => {
+                    if (!queued) {
+                        queued = true;
+                        requestAnimationFrame(render);
+                    }
+                }, { passive: true });
+                spacer.addEventListener('click', event => {
+                    const row = event.target.closest('.virtual-row');
+                    if (row) showDetail(group, tasks[row.dataset.index], panel);
+                });
+                render();
+            });
+        })();
+"""
+
+LAYOUTS = ('auto', 'cards', 'virtual')
+
+# With --layout auto, days with more tasks than this use the virtual layout
+VIRTUAL_THRESHOLD = 200
+
+ASSET_MODES = ('auto', 'inline', 'external')
+
+# Folders whose external assets were already written by this process
+_ASSETS_WRITTEN = {}
+
+def prd_to_dashboard_data(prd):
+    """Convert a parsed PRD model into the dict used by generate_html."""
+    return {
+        'date': prd.date,
+        'summary': prd.summary,
+        'completed_tasks': [
+            {
+                'number': task.number,
+                'name': task.name,
+                'time': task.time,
+                'description': task.description,
+                'solution': task.solution
+            }
+            for task in prd.completed_tasks
+        ],
+        'pending_tasks': [
+            {
+                'number': task.number,
+                'name': task.name,
+                'time': task.time,
+                'description': task.description,
+                'status': task.state
+            }
+            for task in prd.pending_tasks
+        ],
+        'notes': prd.notes,
+        'diagnostics': [
+            {'line': d.line, 'message': d.message} for d in prd.diagnostics
+        ]
+    }
+
+def parse_prd_markdown(content):
+    """Parse PRD markdown content to extract structured data."""
+    return prd_to_dashboard_data(parse_prd(content))
+
+def generate_html(prd_data, assets=None, layout='cards'):
+    """Generate HTML dashboard from PRD data.
+
+    assets is None for a self-contained page, or a dict with the 'css' and
+    'js' file names (see asset_names) to reference instead of inlining.
+    layout is 'cards' (one static card per task), 'virtual' (tasks as a
+    JSON payload rendered on demand by the browser) or 'auto' (virtual
+    above VIRTUAL_THRESHOLD tasks).
+    """
+    
+    completed_count = len(prd_data['completed_tasks'])
+    pending_count = len(prd_data['pending_tasks'])
+    total_tasks = completed_count + pending_count
+    completion_pct = int((completed_count / total_tasks * 100)) if total_tasks > 0 else 0
+    
+    # Extract hours from summary
+    total_hours = prd_data['summary'].get('Total de horas', '0h 0m')
+    
+    if layout == 'auto':
+        layout = 'virtual' if total_tasks > VIRTUAL_THRESHOLD else 'cards'
+    
+    if layout == 'virtual':
+        # One compact JSON payload; the browser renders only visible rows
+        tasks_class = 'tasks-virtual'
+        payload = {
+            'completed': [[t['number'], t['name'], t['time'], t['description'], t['solution']]
+                          for t in prd_data['completed_tasks']],
+            'pending': [[t['number'], t['name'], t['time'], t['description'], t['status']]
+                        for t in prd_data['pending_tasks']],
+        }
+        payload_json = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+        payload_html = f'    <script type="application/json" id="prd-tasks">{payload_json}</script>\n'
+        completed_html = ('<div class="virtual-list" data-group="completed"></div>'
+                          '<div class="virtual-detail" data-group="completed"></div>') if completed_count else ''
+        pending_html = ('<div class="virtual-list" data-group="pending"></div>'
+                        '<div class="virtual-detail" data-group="pending"></div>') if pending_count else ''
+        css = DASHBOARD_CSS + VIRTUAL_CSS
+        js = DASHBOARD_JS + VIRTUAL_JS
+    else:
+        # Generate task cards HTML
+        tasks_class = 'tasks-grid'
+        payload_html = ''
+        completed_html = ''.join(
+            f"""
+        <div class="task-card completed" data-task-id="completed-{task['number']}">
+            <div class="task-header">
+                <span class="task-emoji">✅</span>
+                <h3 class="task-title">{task['number']}. {task['name']}</h3>
+                <span class="task-time">🕐 {task['time']}</span>
+            </div>
+            <div class="task-body">
+                <div class="task-section">
+                    <h4>📝 Descripción</h4>
+                    <p>{task['description']}</p>
+                </div>
+                <div class="task-section">
+                    <h4>✔️ Solución</h4>
+                    <p>{task['solution']}</p>
+                </div>
+            </div>
+        </div>
+        """
+            for task in prd_data['completed_tasks']
+        )
+        pending_html = ''.join(
+            f"""
+        <div class="task-card pending" data-task-id="pending-{task['number']}">
+            <div class="task-header">
+                <span class="task-emoji">⏳</span>
+                <h3 class="task-title">{task['number']}. {task['name']}</h3>
+                <span class="task-time">🕐 {task['time']}</span>
+            </div>
+            <div class="task-body">
+                <div class="task-section">
+                    <h4>📝 Descripción</h4>
+                    <p>{task['description']}</p>
+                </div>
+                <div class="task-section">
+                    <h4>📊 Estado</h4>
+                    <p><strong>{task['status']}</strong></p>
+                </div>
+            </div>
+        </div>
+        """
+            for task in prd_data['pending_tasks']
+        )
+        css = DASHBOARD_CSS
+        js = DASHBOARD_JS
+    
+    if assets:
+        head_assets = f"""    <link rel="stylesheet" href="{assets['css']}">"""
+        body_assets = f"""    <script src="{assets['js']}"></script>"""
+    else:
+        head_assets = f"    <style>\n{css}    </style>"
+        body_assets = f"    <script>\n{js}    </script>"
+    
+    html = f"""<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>PRD Dashboard - {prd_data['date']}</title>
+{head_assets}
 </head>
 <body class="dark-mode">
     <div class="container">
@@ -454,7 +676,7 @@ def generate_html(prd_data):
         <!-- Tareas Completadas -->
         <div class="section">
             <h2>✅ Tareas Completadas ({completed_count})</h2>
-            <div class="tasks-grid">
+            <div class="{tasks_class}">
                 {completed_html if completed_html else '<div class="empty-state"><div class="empty-state-icon">📭</div><p>No hay tareas completadas aún</p></div>'}
             </div>
         </div>
@@ -462,93 +684,309 @@ def generate_html(prd_data):
         <!-- Tareas Pendientes -->
         <div class="section">
             <h2>⏳ Tareas Pendientes ({pending_count})</h2>
-            <div class="tasks-grid">
+            <div class="{tasks_class}">
                 {pending_html if pending_html else '<div class="empty-state"><div class="empty-state-icon">✨</div><p>¡No hay tareas pendientes! 🎉</p></div>'}
             </div>
         </div>
         
         <footer>
-            <p>Dashboard generado: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
             <p>💾 Datos vinculados desde PRD Markdown</p>
         </footer>
     </div>
     
-    <script>
-        // Tema oscuro/claro
-        function toggleTheme() {{
-            const body = document.body;
-            const button = document.querySelector('.theme-toggle');
-            
-            if (body.classList.contains('dark-mode')) {{
-                body.classList.remove('dark-mode');
-                body.classList.add('light-mode');
-                button.textContent = '☀️ Modo Claro';
-                localStorage.setItem('theme', 'light');
-            }} else {{
-                body.classList.remove('light-mode');
-                body.classList.add('dark-mode');
-                button.textContent = '🌙 Modo Oscuro';
-                localStorage.setItem('theme', 'dark');
-            }}
-        }}
-        
-        // Restaurar tema guardado
-        window.addEventListener('DOMContentLoaded', () => {{
-            const savedTheme = localStorage.getItem('theme') || 'dark';
-            document.body.classList.add(savedTheme + '-mode');
-            const button = document.querySelector('.theme-toggle');
-            button.textContent = savedTheme === 'dark' ? '☀️ Modo Claro' : '🌙 Modo Oscuro';
-        }});
-    </script>
+{payload_html}{body_assets}
 </body>
 </html>
 """
     
     return html
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Generar dashboard HTML desde PRD Markdown"
-    )
-    parser.add_argument('prd_file', help='Archivo PRD a convertir')
-    parser.add_argument('--output', default=None, help=f'Directorio de salida (default: {DEFAULT_OUTPUT_DIR or "mismo dir del PRD"})')
+def asset_names():
+    """File names of the external stylesheet and script, versioned by content."""
+    return {
+        'css': f"prd-dashboard.{hash_bytes((DASHBOARD_CSS + VIRTUAL_CSS).encode('utf-8'))[:12]}.css",
+        'js': f"prd-dashboard.{hash_bytes((DASHBOARD_JS + VIRTUAL_JS).encode('utf-8'))[:12]}.js",
+    }
+
+def write_assets(folder):
+    """Write the external stylesheet and script into folder (once per process).
+
+    Returns the asset names to pass to generate_html.
+    """
+    folder = Path(folder).resolve()
+    if folder not in _ASSETS_WRITTEN:
+        names = asset_names()
+        # Shared by both layouts, so they include the virtual list too
+        write_if_changed(folder / names['css'], DASHBOARD_CSS + VIRTUAL_CSS)
+        write_if_changed(folder / names['js'], DASHBOARD_JS + VIRTUAL_JS)
+        _ASSETS_WRITTEN[folder] = names
+    return _ASSETS_WRITTEN[folder]
+
+def dashboard_path(prd_path, output_dir=None):
+    """Return the *_DASHBOARD.html path for a PRD, creating its folder."""
+    if output_dir is None:
+        output_dir = DEFAULT_OUTPUT_DIR
+    if output_dir:
+        output_path = Path(output_dir).expanduser()
+        output_path.mkdir(parents=True, exist_ok=True)
+        return output_path / f"{prd_path.stem}_DASHBOARD.html"
+    return prd_path.parent / f"{prd_path.stem}_DASHBOARD.html"
+
+def render_dashboard(prd_file, output_dir=None, assets=None, layout='auto', prd=None):
+    """Parse one PRD and write its dashboard (unless the bytes are identical).
+
+    prd_file is a path or a PRDEntry (possibly archived, see prd_storage);
+    prd is its parsed model when the caller already has it. assets are the
+    external asset names (already written) or None to inline them; layout
+    is passed to generate_html. Returns (dashboard_file, diagnostics).
+    Top-level so it can run in a worker process.
+    """
+    entry = as_entry(prd_file)
+    prd_data = prd_to_dashboard_data(prd if prd is not None else load_entry(entry))
+    with span('render', file=entry.name):
+        html = generate_html(prd_data, assets, layout)
+    
+    dashboard_file = dashboard_path(entry.path, output_dir)
+    write_if_changed(dashboard_file, html)
+    return str(dashboard_file), prd_data['diagnostics']
+
+def dashboard_inputs(prd_path, assets=None, layout='auto', prd_hash=None):
+    """Input fingerprint of a dashboard for the build manifest.
+
+    prd_hash saves hashing the PRD again when the caller already has it.
+    """
+    entry = as_entry(prd_path)
+    inputs = {
+        entry.key: prd_hash or entry_hash(entry),
+        'code': code_fingerprint(__file__)
+    }
+    if assets:
+        inputs['assets'] = assets
+    if layout != 'auto':
+        inputs['layout'] = layout
+    return inputs
+
+def generate_dashboard(prd_file, output_dir=None, force=False, external_assets=False, layout='auto'):
+    """Write the dashboard of one PRD if the PRD changed since the last run.
+
+    With external_assets the stylesheet and script are written next to the
+    dashboard and referenced instead of inlined. layout is one of LAYOUTS.
+
+    Returns (dashboard_file, diagnostics); diagnostics is None when the
+    dashboard was already up to date.
+    """
+    dashboard_file = dashboard_path(Path(prd_file), output_dir)
+    assets = write_assets(dashboard_file.parent) if external_assets else None
+    manifest = manifest_for(dashboard_file)
+    inputs = dashboard_inputs(prd_file, assets, layout)
+    if not force and manifest.is_fresh(dashboard_file, inputs):
+        return str(dashboard_file), None
     
-    args = parser.parse_args()
+    dashboard_file, diagnostics = render_dashboard(prd_file, output_dir, assets, layout)
+    manifest.record(dashboard_file, inputs)
+    manifest.save()
+    return dashboard_file, diagnostics
+
+def _init_worker(cache_path, from_store=False):
+    """Give each worker process its own parse cache (or store) connection."""
+    if cache_path:
+        try:
+            set_parse_cache(TaskStore(cache_path) if from_store else ParseCache(cache_path))
+        except Exception:
+            set_parse_cache(None)
+
+def collect_prd_files(args):
+    """Resolve the PRD files selected by positional args, --all and --from/--to.
+
+    --all and --from/--to also select archived days, as PRDEntry objects.
+    """
+    files = []
+    for pattern in args.prd_files:
+        # Expand globs here too: Windows shells pass them through unexpanded
+        matches = sorted(glob.glob(os.path.expanduser(pattern)))
+        if matches:
+            files.extend(Path(m) for m in matches)
+        else:
+            files.append(Path(pattern))
     
-    prd_path = Path(args.prd_file)
-    if not prd_path.exists():
-        print(f"❌ Error: Archivo no encontrado: {args.prd_file}")
-        return 1
+    if args.all or args.date_from or args.date_to:
+        prd_dir = Path(args.path or DEFAULT_PRD_DIR).expanduser()
+        files.extend(open_storage(prd_dir, args.archives).entries(args.date_from, args.date_to))
     
-    # Read and parse PRD
-    with open(prd_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Drop duplicates while keeping order
+    seen = set()
+    unique = []
+    for file in files:
+        key = as_entry(file).key
+        if key not in seen:
+            seen.add(key)
+            unique.append(file)
+    return unique
+
+def generate_batch(prd_files, output_dir=None, workers=None, cache=None, force=False,
+                   external_assets=False, layout='auto', io_workers=None):
+    """Render many dashboards in one process, fanning out over a pool.
+
+    PRDs whose dashboard is up to date in the build manifest are skipped
+    before any parsing; the PRDs are hashed io_workers at a time. The
+    manifest and the external assets are only touched by this (parent)
+    process. Without worker processes the PRDs are read through the
+    prd_aio pipeline and rendered in order as they arrive.
+
+    Returns (generated, skipped, errors) where errors is a list of
+    (file, message).
+    """
+    # Imported here: asyncio is costly to import and only batch mode needs it
+    from prd_aio import hash_entries, iter_prds
     
-    prd_data = parse_prd_markdown(content)
-    html = generate_html(prd_data)
+    generated = 0
+    skipped = 0
+    errors = []
+    jobs = {}
+    for prd_file, prd_hash in zip(prd_files, hash_entries(prd_files, io_workers)):
+        target = dashboard_path(as_entry(prd_file).path, output_dir)
+        assets = write_assets(target.parent) if external_assets else None
+        inputs = dashboard_inputs(prd_file, assets, layout, prd_hash)
+        if not force and manifest_for(target).is_fresh(target, inputs):
+            skipped += 1
+        else:
+            jobs[prd_file] = (target, inputs, assets)
     
-    # Determine output file
-    if args.output:
-        output_path = Path(args.output).expanduser()
-        output_path.mkdir(parents=True, exist_ok=True)
-        dashboard_file = output_path / f"{prd_path.stem}_DASHBOARD.html"
-    elif DEFAULT_OUTPUT_DIR:
-        output_path = Path(DEFAULT_OUTPUT_DIR).expanduser()
-        output_path.mkdir(parents=True, exist_ok=True)
-        dashboard_file = output_path / f"{prd_path.stem}_DASHBOARD.html"
+    def done(prd_file):
+        target, inputs, _ = jobs[prd_file]
+        manifest_for(target).record(target, inputs)
+    
+    if workers == 1 or len(jobs) <= 1:
+        for prd_file, prd in iter_prds(jobs, io_workers, return_exceptions=True):
+            _, _, assets = jobs[prd_file]
+            try:
+                if isinstance(prd, Exception):
+                    raise prd
+                render_dashboard(prd_file, output_dir, assets, layout, prd)
+                done(prd_file)
+                generated += 1
+            except Exception as e:
+                errors.append((prd_file, str(e)))
     else:
-        dashboard_file = prd_path.parent / f"{prd_path.stem}_DASHBOARD.html"
+        # Imported here: multiprocessing is costly to import and only batch mode needs it
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        
+        cache_path = str(cache.db_path) if cache else None
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(cache_path, isinstance(cache, TaskStore))) as pool:
+            futures = {
+                pool.submit(render_dashboard, f, output_dir, assets, layout): f
+                for f, (_, _, assets) in jobs.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    done(futures[future])
+                    generated += 1
+                except Exception as e:
+                    errors.append((futures[future], str(e)))
     
-    # Write HTML
+    for manifest in {id(manifest_for(t)): manifest_for(t) for t, _, _ in jobs.values()}.values():
+        manifest.save()
+    return generated, skipped, errors
+
+def parse_day(value):
+    """argparse type for YYYYMMDD dates."""
     try:
-        with open(dashboard_file, 'w', encoding='utf-8') as f:
-            f.write(html)
+        datetime.strptime(value, "%Y%m%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Formato de fecha inválido: {value}. Use YYYYMMDD")
+    return value
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generar dashboard HTML desde PRD Markdown",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python generate_dashboard.py PRD_20260216.md
+  python generate_dashboard.py "PRD_202602*.md" --workers 4
+  python generate_dashboard.py --all
+  python generate_dashboard.py --from 20260101 --to 20260331
+  python generate_dashboard.py --all --assets inline   # HTML autocontenidos
+  python generate_dashboard.py PRD_20260216.md --layout virtual
+        """
+    )
+    parser.add_argument('prd_files', nargs='*', metavar='prd_file', help='Archivo(s) PRD a convertir (admite patrones glob)')
+    parser.add_argument('--output', default=None, help=f'Directorio de salida (default: {DEFAULT_OUTPUT_DIR or "mismo dir del PRD"})')
+    parser.add_argument('--all', action='store_true', help='Generar dashboards de todos los PRD de PRD_DOCUMENTS')
+    parser.add_argument('--from', dest='date_from', type=parse_day, help='Primera fecha (YYYYMMDD) a generar desde PRD_DOCUMENTS')
+    parser.add_argument('--to', dest='date_to', type=parse_day, help='Última fecha (YYYYMMDD) a generar desde PRD_DOCUMENTS')
+    parser.add_argument('--path', default=None, help=f'Carpeta PRD_DOCUMENTS (default: {DEFAULT_PRD_DIR})')
+    add_storage_arguments(parser)
+    add_io_arguments(parser)
+    parser.add_argument('--workers', type=int, default=None, help='Procesos en paralelo para modo lote (default: núcleos de CPU)')
+    parser.add_argument('--assets', choices=ASSET_MODES, default='auto',
+                        help='CSS/JS dentro de cada HTML (inline) o en archivos compartidos (external). '
+                             'auto: inline para un archivo, external en modo lote')
+    parser.add_argument('--layout', choices=LAYOUTS, default='auto',
+                        help='Tarjetas estáticas (cards) o lista virtual con datos JSON (virtual). '
+                             f'auto: virtual con más de {VIRTUAL_THRESHOLD} tareas')
+    add_cache_arguments(parser)
+    add_store_arguments(parser)
+    add_build_arguments(parser)
+    add_trace_arguments(parser)
+    
+    args = parser.parse_args(argv)
+    setup_trace(args)
+    if not (args.prd_files or args.all or args.date_from or args.date_to):
+        parser.error("indica un archivo PRD, --all o --from/--to")
+    cache = setup_store(args) or setup_parse_cache(args, DEFAULT_REPORTS_DIR)
+    
+    try:
+        prd_files = collect_prd_files(args)
+    except OSError as e:
+        print(f"❌ Error: {e}")
+        return 1
+    batch = args.all or args.date_from or args.date_to or len(prd_files) > 1
+    
+    # Only explicit paths can be missing; --all/--from/--to come from the index
+    missing = [f for f in prd_files if isinstance(f, Path) and not f.exists()]
+    for prd_path in missing:
+        print(f"❌ Error: Archivo no encontrado: {prd_path}")
+    if missing and not batch:
+        return 1
+    prd_files = [f for f in prd_files if f not in missing]
+    external_assets = args.assets == 'external' or (args.assets == 'auto' and batch)
+    
+    if not batch:
+        try:
+            dashboard_file, diagnostics = generate_dashboard(prd_files[0], args.output, args.force,
+                                                             external_assets, args.layout)
+        except Exception as e:
+            print(f"❌ Error al generar dashboard: {str(e)}")
+            return 1
+        if diagnostics is None:
+            print(f"✅ Dashboard al día (PRD sin cambios)")
+            print(f"   Archivo: {dashboard_file}")
+            return 0
+        for diagnostic in diagnostics:
+            print(f"⚠️  Línea {diagnostic['line']}: {diagnostic['message']}")
         print(f"✅ Dashboard generado exitosamente")
         print(f"   Archivo: {dashboard_file}")
         return 0
-    except Exception as e:
-        print(f"❌ Error al generar dashboard: {str(e)}")
+    
+    if not prd_files:
+        print("❌ Error: No se encontraron PRD para generar")
         return 1
+    
+    print(f"📊 Generando {len(prd_files)} dashboards...")
+    started = time.perf_counter()
+    generated, skipped, errors = generate_batch(prd_files, args.output, args.workers, cache, args.force,
+                                                external_assets, args.layout, args.io_workers)
+    elapsed = time.perf_counter() - started
+    
+    for prd_file, message in errors:
+        print(f"❌ {prd_file}: {message}")
+    processed = generated + skipped
+    print(f"✅ {generated} dashboards generados, {skipped} al día, en {elapsed:.2f}s "
+          f"({processed / elapsed if elapsed else 0:.1f} archivos/s)")
+    return 1 if errors or missing else 0
 
 if __name__ == "__main__":
     exit(main())
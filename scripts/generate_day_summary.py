@@ -4,7 +4,8 @@ Daily Summary Generator
 Genera un resumen completo del día analizando todos los archivos en la carpeta diaria.
 
 Características:
-- Lee metadatos de archivos (fecha creación, modificación)
+- Lee metadatos de archivos (fecha creación, modificación), también en
+  subcarpetas, ignorando .git, node_modules y archivos ocultos
 - Extrae tareas del PRD del día
 - Calcula hora de inicio del día (primer archivo creado)
 - Genera resumen con horas trabajadas y documentos
@@ -12,40 +13,54 @@ creados
 
 Uso:
     python generate_day_summary.py [--date YYYYMMDD] [--path ./base/path] [--output ./output]
+                                   [--depth N] [--scan-workers N]
+    python generate_day_summary.py --from YYYYMMDD --to YYYYMMDD | --month YYYYMM | --week YYYY-Www
 
 Ejemplos:
     python generate_day_summary.py                          # Resumen de hoy
     python generate_day_summary.py --date 20260225         # Resumen de fecha específica
     python generate_day_summary.py --output ./reports       # Específica carpeta de salida
+    python generate_day_summary.py --scan-workers 8         # Carpeta en red: stat en paralelo
+    python generate_day_summary.py --month 202602           # Un resumen por cada día del mes
 """
 
 import argparse
+import hashlib
 import os
-import json
-import re
 from pathlib import Path
 from datetime import datetime, timedelta
-import platform
+
+from prd_build import add_build_arguments, code_fingerprint, hash_file, manifest_for, write_if_changed
+from prd_config import load_config
+from prd_cache import add_cache_arguments, setup_parse_cache
+from prd_store import add_store_arguments, setup_store
+from prd_core import load_prd, parse_prd, read_prd_file, resolve_range
+from prd_scan import DEFAULT_IGNORE, DEFAULT_MAX_DEPTH, compile_ignore, file_metadata, iter_entries, scan_folder
+from prd_storage import add_io_arguments
+from prd_trace import add_trace_arguments, setup_trace, span
 
 # Load configuration
-CONFIG_FILE = Path(__file__).parent.parent / "config.json"
 DEFAULT_BASE_DIR = "."
 DEFAULT_REPORTS_DIR = None
+DEFAULT_PRD_DIR = "~/Documents/prd_diarios/PRD_DOCUMENTS"
 
-if CONFIG_FILE.exists():
+config = load_config()
+if config:
     try:
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-            folders = config.get("folders", {})
-            DEFAULT_BASE_DIR = os.path.expanduser(
-                folders.get("daily_work", ".")
-            )
-            DEFAULT_REPORTS_DIR = os.path.expanduser(
-                folders.get("reports", None)
-            )
+        folders = config.get("folders", {})
+        DEFAULT_BASE_DIR = os.path.expanduser(
+            folders.get("daily_work", ".")
+        )
+        DEFAULT_REPORTS_DIR = os.path.expanduser(
+            folders.get("reports", None)
+        )
+        DEFAULT_PRD_DIR = os.path.expanduser(folders.get("prd_documents", DEFAULT_PRD_DIR))
     except Exception:
         pass
 
+# The summary never lists (nor is rebuilt because of) its own reports
+SUMMARY_IGNORE = DEFAULT_IGNORE + ('RESUMEN_*',)
+
 SPANISH_MONTHS = {
     1: "enero", 2: "febrero", 3: "marzo", 4: "abril",
     5: "mayo", 6: "junio", 7: "julio", 8: "agosto",
@@ -68,58 +83,26 @@ def format_spanish_date(date_obj):
 
 def get_file_metadata(filepath):
     """Get creation and modification times for a file."""
-    stat = os.stat(filepath)
-    
-    # Different platforms store creation time differently
-    if platform.system() == 'Darwin':  # macOS
-        creation_time = datetime.fromtimestamp(stat.st_birthtime)
-    elif platform.system() == 'Windows':
-        creation_time = datetime.fromtimestamp(stat.st_ctime)
-    else:  # Linux and others
-        # Linux doesn't reliably store creation time, use modification time
-        creation_time = datetime.fromtimestamp(stat.st_mtime)
-    
-    modification_time = datetime.fromtimestamp(stat.st_mtime)
-    
-    return {
-        'creation_time': creation_time,
-        'modification_time': modification_time,
-        'size': stat.st_size
-    }
+    return file_metadata(filepath)
+
+
+def tasks_from_prd(prd):
+    """Convert the tasks of a parsed PRD model into summary rows."""
+    return [
+        {
+            'number': task.number,
+            'name': task.name,
+            'time': task.time,
+            'status': task.status,
+            'emoji': task.emoji
+        }
+        for task in prd.tasks
+    ]
 
 
 def extract_tasks_from_prd(prd_content):
     """Extract tasks from PRD content using hierarchical format."""
-    tasks = []
-    
-    # Pattern: ### [emoji] N. Description — **HH:MM**
-    # Matches both ✅ (completed) and ⏳ (pending)
-    pattern = r'###\s+(.+?)\s+(\d+)\.\s+(.+?)\s+—\s+\*\*(\d{2}:\d{2})\*\*'
-    
-    matches = re.finditer(pattern, prd_content, re.DOTALL)
-    for match in matches:
-        emoji = match.group(1).strip()
-        task_num = match.group(2)
-        task_name = match.group(3).strip()
-        time_str = match.group(4)
-        
-        # Determine status based on emoji
-        if '✅' in emoji:
-            status = 'completada'
-        elif '⏳' in emoji:
-            status = 'pendiente'
-        else:
-            status = 'desconocido'
-        
-        tasks.append({
-            'number': task_num,
-            'name': task_name,
-            'time': time_str,
-            'status': status,
-            'emoji': emoji
-        })
-    
-    return tasks
+    return tasks_from_prd(parse_prd(prd_content))
 
 
 def calculate_work_hours(tasks, first_file_time):
@@ -153,24 +136,27 @@ def calculate_work_hours(tasks, first_file_time):
     return hours, minutes
 
 
-def analyze_daily_folder(date_obj, base_path):
-    """Analyze all files in the daily folder."""
+def analyze_daily_folder(date_obj, base_path, max_depth=DEFAULT_MAX_DEPTH, workers=None,
+                         files=None, prd=None, folder_prd=None, prd_path=None):
+    """Analyze all files in the daily folder and its subfolders (up to
+    max_depth levels; workers > 1 stats them in parallel).
+
+    files is a scan_folder() result of the same folder to reuse instead of
+    scanning again. When the folder holds no PRD file of its own the tasks
+    come from prd_path (the PRD_DOCUMENTS PRD of the day), or from prd if
+    it was already parsed; folder_prd is the folder's PRD already parsed.
+    """
     folder_name = date_obj.strftime("%y%m%d")
     folder_path = Path(base_path).expanduser() / folder_name
     
-    if not folder_path.exists():
+    if files is None and not folder_path.exists():
         return None, f"Carpeta no encontrada: {folder_path}"
     
-    # Collect all files
-    files = []
-    for file in folder_path.iterdir():
-        if file.is_file() and not file.name.startswith('.'):
-            metadata = get_file_metadata(file)
-            files.append({
-                'name': file.name,
-                'path': str(file),
-                'metadata': metadata
-            })
+    # Collect all files (hidden files, .git, node_modules... are skipped)
+    if files is None:
+        files = scan_folder(folder_path, max_depth, workers=workers)
+    else:
+        files = list(files)
     
     if not files:
         return None, "No se encontraron archivos en la carpeta"
@@ -180,18 +166,19 @@ def analyze_daily_folder(date_obj, base_path):
     
     # Find PRD file
     prd_file = None
-    prd_content = None
     for file in files:
         if file['name'].startswith('PRD_'):
             prd_file = file
-            with open(file['path'], 'r', encoding='utf-8') as f:
-                prd_content = f.read()
             break
     
     # Extract tasks if PRD exists
     tasks = []
-    if prd_content:
-        tasks = extract_tasks_from_prd(prd_content)
+    if prd_file:
+        tasks = tasks_from_prd(folder_prd if folder_prd is not None else load_prd(prd_file['path']))
+    elif prd is not None:
+        tasks = tasks_from_prd(prd)
+    elif prd_path is not None and Path(prd_path).exists():
+        tasks = tasks_from_prd(load_prd(prd_path))
     
     # Calculate work hours
     first_file_time = files[0]['metadata']['creation_time']
@@ -211,8 +198,8 @@ def analyze_daily_folder(date_obj, base_path):
     }, None
 
 
-def generate_summary_report(analysis, date_obj, output_dir=None):
-    """Generate a markdown summary report."""
+def render_summary_report(analysis, date_obj):
+    """Return the markdown of the summary report."""
     
     date_spanish = format_spanish_date(date_obj)
     folder_name = analysis['folder_name']
@@ -270,7 +257,6 @@ def generate_summary_report(analysis, date_obj, output_dir=None):
 
 ## Metadatos
 
-- **Resumen generado**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 - **Carpeta analizada**: `{analysis['folder_path']}`
 - **Script**: `generate_day_summary.py`
 
@@ -279,26 +265,202 @@ def generate_summary_report(analysis, date_obj, output_dir=None):
 *Este resumen fue generado automáticamente analizando todos los archivos de la carpeta del día.*
 """
     
+    return report
+
+
+def generate_summary_report(analysis, date_obj, output_dir=None):
+    """Generate a markdown summary report."""
+    with span('render', folder=analysis['folder_name']):
+        report = render_summary_report(analysis, date_obj)
+    
     # Save report
+    output_path = summary_report_path(analysis['folder_name'], analysis['folder_path'], output_dir)
+    write_if_changed(output_path, report)
+    
+    return str(output_path)
+
+
+def summary_report_path(folder_name, folder_path, output_dir=None):
+    """Return the RESUMEN_YYMMDD.md path, creating its folder."""
     if output_dir is None:
         if DEFAULT_REPORTS_DIR:
             reports_path = Path(DEFAULT_REPORTS_DIR).expanduser()
             reports_path.mkdir(parents=True, exist_ok=True)
-            output_path = reports_path / f"RESUMEN_{folder_name}.md"
-        else:
-            # Fallback: save in the daily work folder
-            output_path = Path(analysis['folder_path']) / f"RESUMEN_{folder_name}.md"
+            return reports_path / f"RESUMEN_{folder_name}.md"
+        # Fallback: save in the daily work folder
+        return Path(folder_path) / f"RESUMEN_{folder_name}.md"
+    
+    output_path = Path(output_dir).expanduser() / f"RESUMEN_{folder_name}.md"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    return output_path
+
+
+def day_prd_path(date_obj, prd_dir=None):
+    """PRD_DOCUMENTS/PRD_YYYYMMDD.md of a day: the source of the summary
+    tasks when the daily folder has no PRD of its own."""
+    return Path(prd_dir or DEFAULT_PRD_DIR).expanduser() / f"PRD_{date_obj.strftime('%Y%m%d')}.md"
+
+
+def summary_inputs(folder_path, max_depth=DEFAULT_MAX_DEPTH, files=None, prd_path=None, prd_hash=None):
+    """Input fingerprint of a daily summary for the build manifest.
+
+    The summary reports names, sizes and times of every file, so the
+    listing (name, size, mtime) is hashed; PRD files are hashed by content.
+    files is a scan_folder() result of the folder to reuse instead of
+    walking it again. If no file of the folder is a PRD, prd_path (see
+    day_prd_path) is an input too; prd_hash is its hash if already known.
+    """
+    if files is None:
+        listed = []
+        for name, entry in iter_entries(folder_path, max_depth, SUMMARY_IGNORE):
+            stat = entry.stat()
+            listed.append((name, entry.path, stat.st_size, stat.st_mtime_ns))
     else:
-        output_path = Path(output_dir).expanduser() / f"RESUMEN_{folder_name}.md"
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        own_report = compile_ignore(('RESUMEN_*',))
+        listed = [
+            (f['name'], f['path'], f['metadata']['size'], f['metadata']['mtime_ns'])
+            for f in files if not own_report(os.path.basename(f['path']))
+        ]
+    
+    listing = hashlib.sha256()
+    inputs = {}
+    for name, path, size, mtime_ns in sorted(listed):
+        listing.update(f"{name}\0{size}\0{mtime_ns}\n".encode())
+        if os.path.basename(path).startswith('PRD_'):
+            inputs[path] = hash_file(path)
+    
+    if prd_path is not None and not any(name.startswith('PRD_') for name, _, _, _ in listed):
+        prd_path = Path(prd_path).expanduser()
+        try:
+            inputs[str(prd_path.resolve())] = prd_hash or hash_file(prd_path)
+        except FileNotFoundError:
+            pass
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(report)
+    inputs['listing'] = listing.hexdigest()
+    inputs['code'] = code_fingerprint(__file__, Path(__file__).parent / "prd_scan.py")
+    return inputs
+
+
+def plan_summary(date_obj, base_path, output_dir=None, max_depth=DEFAULT_MAX_DEPTH, workers=None,
+                 prepared=None, prd_dir=None, prd=None, prd_hash=None):
+    """Describe the summary of one day for the build manifest.
+
+    Every entry point (this script, close_day, watch_reports) goes through
+    here, so the same folder gives the same summary and the same inputs.
+    prepared is the prepare_day() result of the folder to reuse; prd and
+    prd_hash are the PRD_DOCUMENTS PRD of the day if already read.
+
+    Returns ((report_path, inputs, render), error); render() returns
+    (analysis, markdown) or raises ValueError.
+    """
+    files, inputs, folder_prd = prepared or (None, None, None)
+    folder_name = date_obj.strftime("%y%m%d")
+    folder_path = Path(base_path).expanduser() / folder_name
+    if files is None and not folder_path.is_dir():
+        return None, f"Carpeta no encontrada: {folder_path}"
     
-    return str(output_path)
+    prd_path = day_prd_path(date_obj, prd_dir)
+    if inputs is None:
+        inputs = summary_inputs(folder_path, max_depth, files, prd_path, prd_hash)
+    
+    def render():
+        analysis, error = analyze_daily_folder(date_obj, base_path, max_depth, workers, files,
+                                               prd=prd, folder_prd=folder_prd, prd_path=prd_path)
+        if error:
+            raise ValueError(error)
+        with span('render', folder=folder_name):
+            return analysis, render_summary_report(analysis, date_obj)
+    
+    return (summary_report_path(folder_name, folder_path, output_dir), inputs, render), None
+
 
+def generate_summary(date_obj, base_path, output_dir=None, force=False,
+                     max_depth=DEFAULT_MAX_DEPTH, workers=None, prepared=None, prd_dir=None):
+    """Analyze the daily folder and write its summary if anything changed.
 
-def main():
+    prepared is the prepare_day() result of the folder to reuse. Returns
+    (report_path, analysis, error). analysis is None when the summary was
+    already up to date.
+    """
+    job, error = plan_summary(date_obj, base_path, output_dir, max_depth, workers, prepared, prd_dir)
+    if error:
+        return None, None, error
+    report_path, inputs, render = job
+    
+    # Skip when nothing in the daily folder changed since the last summary
+    manifest = manifest_for(report_path)
+    if not force and manifest.is_fresh(report_path, inputs):
+        return str(report_path), None, None
+    
+    try:
+        analysis, report = render()
+    except ValueError as e:
+        return None, None, str(e)
+    
+    write_if_changed(report_path, report)
+    manifest.record(report_path, inputs)
+    manifest.save()
+    return str(report_path), analysis, None
+
+
+def prepare_day(folder_path, max_depth=DEFAULT_MAX_DEPTH, prd_path=None):
+    """Do the blocking I/O of one summary: scan the folder, fingerprint it
+    (with prd_path, see summary_inputs) and read (or load from its sidecar)
+    its PRD file.
+
+    Safe to run in reader threads. Returns (files, inputs, folder_prd) for
+    generate_summary(prepared=...).
+    """
+    files = scan_folder(folder_path, max_depth)
+    inputs = summary_inputs(folder_path, max_depth, files, prd_path)
+    # Same PRD analyze_daily_folder picks: the first one by creation time
+    files.sort(key=lambda x: x['metadata']['creation_time'])
+    folder_prd = None
+    prd_file = next((f for f in files if f['name'].startswith('PRD_')), None)
+    if prd_file:
+        folder_prd, _ = read_prd_file(prd_file['path'])
+    return files, inputs, folder_prd
+
+
+def daily_folders(base_path, date_from, date_to):
+    """(date, folder) of the YYMMDD folders between two YYYYMMDD days,
+    found with a single listing of DAILY_WORK."""
+    folders = []
+    with os.scandir(Path(base_path).expanduser()) as entries:
+        for entry in entries:
+            if len(entry.name) != 6 or not entry.name.isdigit():
+                continue
+            day = f"20{entry.name}"
+            if date_from <= day <= date_to and entry.is_dir():
+                folders.append((datetime.strptime(day, "%Y%m%d"), entry.path))
+    folders.sort()
+    return folders
+
+
+def generate_summary_range(date_from, date_to, base_path, output_dir=None, force=False,
+                           max_depth=DEFAULT_MAX_DEPTH, io_workers=None, prd_dir=None):
+    """Write the summary of every daily folder between two YYYYMMDD days.
+
+    The folders are scanned and their PRD read io_workers at a time (see
+    prd_aio and prepare_day), which hides the per-file latency of network
+    and cloud-synced drives; summaries are written in date order as their
+    folder arrives. Yields (date, report_path, analysis, error) per folder.
+    """
+    # Imported here: asyncio is costly to import and only range mode needs it
+    from prd_aio import map_ordered
+    
+    folders = daily_folders(base_path, date_from, date_to)
+    days = map_ordered(lambda folder: prepare_day(folder[1], max_depth, day_prd_path(folder[0], prd_dir)), folders,
+                       io_workers, return_exceptions=True)
+    for (date_obj, folder_path), prepared in days:
+        if isinstance(prepared, Exception):
+            yield date_obj, None, None, f"No se pudo leer {folder_path}: {prepared}"
+            continue
+        yield (date_obj, *generate_summary(date_obj, base_path, output_dir, force, max_depth,
+                                           prepared=prepared, prd_dir=prd_dir))
+
+
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Generar resumen del día analizando carpeta diaria",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -307,13 +469,62 @@ Ejemplos:
   python generate_day_summary.py                    # Resumen de hoy
   python generate_day_summary.py --date 20260225   # Resumen de fecha específica
   python generate_day_summary.py --output ./custom  # Guardar en carpeta custom
+  python generate_day_summary.py --month 202602     # Resúmenes de todo el mes
         """
     )
     parser.add_argument('--date', help='Fecha en formato YYYYMMDD (default: hoy)')
     parser.add_argument('--path', default=None, help=f'Ruta base DAILY_WORK (default: {DEFAULT_BASE_DIR})')
+    parser.add_argument('--prd-path', default=None,
+                        help=f'Carpeta PRD_DOCUMENTS, de donde salen las tareas si la carpeta del día no tiene PRD '
+                             f'(default: {DEFAULT_PRD_DIR})')
     parser.add_argument('--output', default=None, help='Carpeta de salida para reporte (default: carpeta REPORTS)')
+    parser.add_argument('--depth', type=int, default=DEFAULT_MAX_DEPTH,
+                        help=f'Niveles de subcarpetas a analizar (default: {DEFAULT_MAX_DEPTH})')
+    parser.add_argument('--scan-workers', type=int, default=None,
+                        help='Hilos para leer metadatos en paralelo (útil en carpetas de red o sincronizadas)')
+    range_group = parser.add_argument_group('resúmenes por rango (una carpeta por día)')
+    range_group.add_argument('--from', dest='date_from', help='Primera fecha YYYYMMDD')
+    range_group.add_argument('--to', dest='date_to', help='Última fecha YYYYMMDD (default: hoy)')
+    range_group.add_argument('--month', help='Mes completo YYYYMM')
+    range_group.add_argument('--week', help='Semana ISO YYYY-Www')
+    add_io_arguments(range_group)
+    add_cache_arguments(parser)
+    add_store_arguments(parser)
+    add_build_arguments(parser)
+    add_trace_arguments(parser)
+    
+    args = parser.parse_args(argv)
+    setup_trace(args)
+    range_mode = args.date_from or args.date_to or args.month or args.week
+    if args.date and range_mode:
+        parser.error("--date no se puede combinar con un rango (--from/--to, --month, --week)")
+    if sum(bool(x) for x in (args.date_from or args.date_to, args.month, args.week)) > 1:
+        parser.error("--from/--to, --month y --week son excluyentes")
+    setup_parse_cache(args, DEFAULT_REPORTS_DIR)
+    setup_store(args)
     
-    args = parser.parse_args()
+    base_path = args.path if args.path else DEFAULT_BASE_DIR
+    if range_mode:
+        try:
+            date_from, date_to, label = resolve_range(args.date_from, args.date_to, args.month, args.week)
+            summaries = generate_summary_range(date_from, date_to, base_path, args.output, args.force,
+                                               args.depth, args.io_workers, args.prd_path)
+            print(f"📁 Analizando carpetas diarias de {label}...")
+            generated = fresh = failed = 0
+            for date_obj, report_path, analysis, error in summaries:
+                if error:
+                    failed += 1
+                    print(f"   ⚠️  {date_obj:%y%m%d}: {error}")
+                elif analysis is None:
+                    fresh += 1
+                else:
+                    generated += 1
+                    print(f"   ✅ {date_obj:%y%m%d}: {report_path}")
+        except (OSError, ValueError) as e:
+            print(f"❌ Error: {e}")
+            return 1
+        print(f"✅ {generated} resúmenes generados, {fresh} al día, {failed} con avisos")
+        return 0
     
     # Determine date
     if args.date:
@@ -321,19 +532,16 @@ Ejemplos:
     else:
         date_obj = datetime.now()
     
-    base_path = args.path if args.path else DEFAULT_BASE_DIR
-    
-    # Analyze folder
     print(f"📁 Analizando carpeta del día {format_spanish_date(date_obj)}...")
-    analysis, error = analyze_daily_folder(date_obj, base_path)
+    report_path, analysis, error = generate_summary(date_obj, base_path, args.output, args.force,
+                                                    args.depth, args.scan_workers, prd_dir=args.prd_path)
     
     if error:
         print(f"❌ Error: {error}")
         return 1
-    
-    # Generate report
-    print(f"📝 Generando resumen...")
-    report_path = generate_summary_report(analysis, date_obj, args.output)
+    if analysis is None:
+        print(f"✅ Resumen al día (carpeta sin cambios): {report_path}")
+        return 0
     
     print(f"✅ Resumen generado exitosamente: {report_path}")
     print(f"\n📊 Estadísticas:")
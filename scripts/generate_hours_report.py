@@ -5,40 +5,59 @@ Genera un reporte de horas trabajadas a partir de un PRD diario.
 
 Uso:
     python generate_hours_report.py PRD_YYYYMMDD.md [--output ./path]
+    python generate_hours_report.py --from YYYYMMDD --to YYYYMMDD | --month YYYYMM | --week YYYY-Www
 
 Ejemplos:
     python generate_hours_report.py PRD_260216.md
     python generate_hours_report.py PRD_260216.md --output ./reports
+    python generate_hours_report.py --month 202602
 """
 
 import argparse
 import os
-import json
 import re
+from itertools import chain
 from pathlib import Path
-from datetime import datetime, time
+from datetime import datetime
+
+from prd_build import (add_build_arguments, code_fingerprint, hash_file, manifest_for, write_chunks_if_changed,
+                       write_if_changed)
+from prd_config import load_config
+from prd_cache import add_cache_arguments, setup_parse_cache
+from prd_storage import add_io_arguments, add_storage_arguments, open_storage
+from prd_store import add_store_arguments, setup_store
+from prd_core import load_prd, parse_prd, resolve_range, task_durations
+from prd_trace import add_trace_arguments, setup_trace, span
 
 # Load configuration
-CONFIG_FILE = Path(__file__).parent.parent / "config.json"
 DEFAULT_OUTPUT_DIR = None
+DEFAULT_PRD_DIR = "~/Documents/prd_diarios/PRD_DOCUMENTS"
 
-if CONFIG_FILE.exists():
+config = load_config()
+if config:
     try:
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-            # Try new config format
-            folders = config.get("folders", {})
-            reports_dir = folders.get("reports")
-            if reports_dir:
-                DEFAULT_OUTPUT_DIR = os.path.expanduser(reports_dir)
-            else:
-                # Fallback to old config format
-                default_output = config.get("prd_output_directory", None)
-                if default_output:
-                    DEFAULT_OUTPUT_DIR = os.path.expanduser(default_output)
+        # Try new config format
+        folders = config.get("folders", {})
+        if folders.get("prd_documents"):
+            DEFAULT_PRD_DIR = os.path.expanduser(folders["prd_documents"])
+        reports_dir = folders.get("reports")
+        if reports_dir:
+            DEFAULT_OUTPUT_DIR = os.path.expanduser(reports_dir)
+        else:
+            # Fallback to old config format
+            default_output = config.get("prd_output_directory", None)
+            if default_output:
+                DEFAULT_OUTPUT_DIR = os.path.expanduser(default_output)
     except Exception:
         pass
 
+# Date at the start of the '# PRD - ' header; anything after it (a sprint
+# name...) is ignored
+DATE_RE = re.compile(r'\d{1,2} de \w+ de \d{4}')
+
+# Characters of the range report body copied per write
+BODY_CHUNK_SIZE = 256 * 1024
+
 def parse_time(time_str):
     """Parse time string in HH:MM format to time object."""
     try:
@@ -46,96 +65,69 @@ def parse_time(time_str):
     except ValueError:
         return None
 
-def calculate_duration(start_time, end_time):
-    """Calculate duration in minutes between two times."""
-    if not start_time or not end_time:
-        return None
-    
-    # Convert to minutes since midnight
-    start_mins = start_time.hour * 60 + start_time.minute
-    end_mins = end_time.hour * 60 + end_time.minute
-    
-    if end_mins >= start_mins:
-        return end_mins - start_mins
-    else:
-        # Handle day wrap (shouldn't happen in normal case)
-        return (24 * 60 - start_mins) + end_mins
-
-def extract_tasks_from_prd(prd_content):
-    """Extract tasks and times from PRD content."""
+def tasks_from_prd(prd):
+    """Convert the tasks of a parsed PRD model into report rows."""
     tasks = []
-    
-    # Pattern: ### [character] N. Description **HH:MM**
-    pattern = r'###\s+.+?\s+(\d+)\.\s+(.+?)\s+\*\*(\d{2}:\d{2})\*\*'
-    
-    matches = re.finditer(pattern, prd_content, re.DOTALL)
-    for match in matches:
-        task_num = match.group(1)
-        task_name = match.group(2).strip()
-        time_str = match.group(3)
-        time_obj = parse_time(time_str)
-        
+    for task in prd.tasks:
+        time_obj = parse_time(task.time)
         if time_obj:
             tasks.append({
-                'number': task_num,
-                'name': task_name,
+                'number': task.number,
+                'name': task.name,
                 'time': time_obj,
-                'time_str': time_str
+                'time_str': task.time
             })
     
     return tasks
 
-def generate_report(prd_file, output_dir=None):
-    """Generate hours report from PRD file."""
-    
-    # Use default output dir if not specified
-    if output_dir is None:
-        output_dir = DEFAULT_OUTPUT_DIR
-    
-    # Read PRD file
-    prd_path = Path(prd_file)
-    if not prd_path.exists():
-        return None, f"Archivo no encontrado: {prd_file}"
+def extract_tasks_from_prd(prd_content):
+    """Extract tasks and times from PRD content."""
+    return tasks_from_prd(parse_prd(prd_content))
+
+def format_duration(minutes):
+    """Format minutes as 'Xh Ym' (or 'Ym' under one hour)."""
+    return f"{minutes // 60}h {minutes % 60}m" if minutes >= 60 else f"{minutes}m"
+
+def calculate_task_durations(tasks):
+    """Compute the duration of each task row.
+
+    Returns (task_durations, total_minutes).
+    """
+    start_minutes = [task['time'].hour * 60 + task['time'].minute for task in tasks]
+    durations = task_durations(start_minutes)
     
-    with open(prd_path, 'r', encoding='utf-8') as f:
-        prd_content = f.read()
+    rows = []
+    for task, duration_mins in zip(tasks, durations):
+        rows.append({
+            'number': task['number'],
+            'name': task['name'],
+            'time': task['time_str'],
+            'duration_mins': duration_mins,
+            'duration_str': format_duration(duration_mins)
+        })
     
+    return rows, sum(durations)
+
+def render_report(prd):
+    """Render the hours report markdown for a parsed PRD.
+
+    Returns (report_content, error_message).
+    """
     # Extract date from PRD
-    date_match = re.search(r'# PRD - (\d{1,2} de \w+ de \d{4})', prd_content)
+    date_match = DATE_RE.match(prd.date)
     if not date_match:
         return None, "No se encontró la fecha en el PRD"
     
-    date_str = date_match.group(1)
+    date_str = date_match.group(0)
     
     # Extract tasks
-    tasks = extract_tasks_from_prd(prd_content)
+    tasks = tasks_from_prd(prd)
     
     if not tasks:
         return None, "No se encontraron tareas con horas"
     
     # Calculate durations
-    task_durations = []
-    total_minutes = 0
-    
-    for i, task in enumerate(tasks):
-        if i < len(tasks) - 1:
-            # Duration = time of next task - time of current task
-            start_time = task['time']
-            end_time = tasks[i + 1]['time']
-            duration_mins = calculate_duration(start_time, end_time)
-            total_minutes += duration_mins
-        else:
-            # For last task, estimate based on typical work session
-            duration_mins = 60  # Default 1 hour for last task
-            total_minutes += duration_mins
-        
-        task_durations.append({
-            'number': task['number'],
-            'name': task['name'],
-            'time': task['time_str'],
-            'duration_mins': duration_mins,
-            'duration_str': f"{duration_mins // 60}h {duration_mins % 60}m" if duration_mins >= 60 else f"{duration_mins}m"
-        })
+    task_durations, total_minutes = calculate_task_durations(tasks)
     
     # Generate report content
     report_content = f"""# Reporte de Horas – {date_str}
@@ -160,25 +152,191 @@ def generate_report(prd_file, output_dir=None):
     report_content += f"## Totales\n\n"
     report_content += f"**Horas trabajadas**: {total_minutes // 60}h {total_minutes % 60}m\n"
     report_content += f"**Promedio por tarea**: {total_minutes / len(task_durations):.0f} minutos\n"
-    report_content += f"**Generado**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
     
-    # Determine output file
+    return report_content, None
+
+def report_path(prd_path, output_dir=None):
+    """Return the HORAS_*.md path for a PRD, creating its folder."""
+    if output_dir is None:
+        output_dir = DEFAULT_OUTPUT_DIR
     if output_dir:
         output_path = Path(output_dir).expanduser()
         output_path.mkdir(parents=True, exist_ok=True)
-        report_file = output_path / f"HORAS_{prd_path.stem}.md"
-    else:
-        report_file = prd_path.parent / f"HORAS_{prd_path.stem}.md"
+        return output_path / f"HORAS_{prd_path.stem}.md"
+    return prd_path.parent / f"HORAS_{prd_path.stem}.md"
+
+def report_inputs(prd_path, prd_hash=None):
+    """Input fingerprint of an hours report for the build manifest.
+
+    prd_hash saves hashing the PRD again when the caller already has it.
+    """
+    return {
+        str(Path(prd_path).resolve()): prd_hash or hash_file(prd_path),
+        'code': code_fingerprint(__file__)
+    }
+
+def generate_report(prd_file, output_dir=None, force=False):
+    """Generate hours report from PRD file.
+
+    The report is skipped when the PRD has not changed since it was last
+    generated (see prd_build), unless force is set.
+    """
+    
+    # Read PRD file
+    prd_path = Path(prd_file)
+    if not prd_path.exists():
+        return None, f"Archivo no encontrado: {prd_file}"
+    
+    report_file = report_path(prd_path, output_dir)
+    manifest = manifest_for(report_file)
+    inputs = report_inputs(prd_path)
+    if not force and manifest.is_fresh(report_file, inputs):
+        return str(report_file), "Reporte al día (PRD sin cambios)"
+    
+    prd = load_prd(prd_path)
+    with span('render', file=prd_path.name):
+        report_content, error = render_report(prd)
+    if error:
+        return None, error
     
     # Write report
     try:
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+        write_if_changed(report_file, report_content)
+        manifest.record(report_file, inputs)
+        manifest.save()
         return str(report_file), "Reporte generado exitosamente"
     except Exception as e:
         return None, f"Error al generar reporte: {str(e)}"
 
-def main():
+def _add_period(totals, key, minutes, tasks):
+    """Accumulate minutes/tasks into a {key: [minutes, tasks, days]} dict."""
+    entry = totals.setdefault(key, [0, 0, 0])
+    entry[0] += minutes
+    entry[1] += tasks
+    entry[2] += 1
+
+def _period_table(title, totals):
+    """Markdown table for weekly or monthly subtotals."""
+    table = f"## {title}\n\n| Periodo | Días | Tareas | Horas |\n|---|---|---|---|\n"
+    for key in sorted(totals):
+        minutes, tasks, days = totals[key]
+        table += f"| {key} | {days} | {tasks} | {minutes // 60}h {minutes % 60}m |\n"
+    return table + "\n"
+
+def generate_range_report(date_from, date_to, label, prd_dir=None, output_dir=None, force=False,
+                          archive_dir=None, io_workers=None):
+    """Generate a consolidated HORAS_<label>.md over a range of daily PRDs.
+
+    PRDs are read io_workers at a time (see prd_aio) and parsed as they
+    arrive; their per-day / per-task breakdown is streamed, in date order,
+    to a temporary file, so no parsed PRD is kept while the range is read.
+    The report is then assembled in chunks (header, body, totals) into the
+    file that atomically replaces the old one, unless the bytes are the
+    same (write_chunks_if_changed): memory stays flat whatever the range.
+    Skipped when no PRD of the range changed.
+    Days already archived (see prd_archive) are read from ARCHIVES.
+    """
+    # Imported here: asyncio and tempfile are costly to import and only
+    # range mode needs them
+    import tempfile
+
+    from prd_aio import hash_entries, iter_prds
+    
+    if output_dir is None:
+        output_dir = DEFAULT_OUTPUT_DIR
+    prd_dir = Path(prd_dir or DEFAULT_PRD_DIR).expanduser()
+    
+    try:
+        prd_files = open_storage(prd_dir, archive_dir).entries(date_from, date_to)
+    except OSError as e:
+        return None, f"No se pudo leer la carpeta de PRD: {e}"
+    if not prd_files:
+        return None, f"No se encontraron PRD entre {date_from} y {date_to} en {prd_dir}"
+    
+    # Determine output file
+    if output_dir:
+        output_path = Path(output_dir).expanduser()
+        output_path.mkdir(parents=True, exist_ok=True)
+    else:
+        output_path = prd_dir
+    report_file = output_path / f"HORAS_{label}.md"
+    
+    manifest = manifest_for(report_file)
+    inputs = {entry.key: digest for entry, digest in zip(prd_files, hash_entries(prd_files, io_workers))}
+    inputs['code'] = code_fingerprint(__file__)
+    if not force and manifest.is_fresh(report_file, inputs):
+        return str(report_file), "Reporte al día (ningún PRD del rango cambió)"
+    
+    total_minutes = 0
+    total_tasks = 0
+    days = 0
+    skipped = []
+    weeks = {}
+    months = {}
+    
+    with tempfile.TemporaryFile('w+', encoding='utf-8') as body:
+        for entry, prd in iter_prds(prd_files, io_workers):
+            tasks = tasks_from_prd(prd)
+            if not tasks:
+                skipped.append(entry.name)
+                continue
+            
+            task_durations, day_minutes = calculate_task_durations(tasks)
+            day = datetime.strptime(entry.day, "%Y%m%d").date()
+            iso_year, iso_week, _ = day.isocalendar()
+            
+            days += 1
+            total_minutes += day_minutes
+            total_tasks += len(task_durations)
+            _add_period(weeks, f"{iso_year}-W{iso_week:02d}", day_minutes, len(task_durations))
+            _add_period(months, day.strftime("%Y-%m"), day_minutes, len(task_durations))
+            
+            body.write(f"### {prd.date or day.isoformat()} (`{entry.name}`)\n\n")
+            body.write(f"- **Tareas**: {len(task_durations)}\n")
+            body.write(f"- **Horas**: {day_minutes // 60}h {day_minutes % 60}m\n\n")
+            body.write("| # | Tarea | Inicio | Duración |\n|---|---|---|---|\n")
+            for task in task_durations:
+                name = task['name'].replace('|', '\\|')
+                body.write(f"| {task['number']} | {name} | {task['time']} | {task['duration_str']} |\n")
+            body.write("\n")
+        
+        if not days:
+            return None, "No se encontraron tareas con horas en el rango"
+        
+        header = (
+            f"# Reporte de Horas – {label}\n\n"
+            "## Resumen\n\n"
+            f"- **Rango**: {date_from} – {date_to}\n"
+            f"- **Días con registro**: {days}\n"
+            f"- **Tareas**: {total_tasks}\n"
+            f"- **Horas totales**: {total_minutes // 60}h {total_minutes % 60}m ({total_minutes / 60:.2f}h)\n\n"
+            "---\n\n"
+            + _period_table("Totales por Semana", weeks)
+            + _period_table("Totales por Mes", months)
+            + "---\n\n## Desglose por Día\n\n"
+        )
+        footer = (
+            "---\n\n## Totales\n\n"
+            f"**Horas trabajadas**: {total_minutes // 60}h {total_minutes % 60}m\n"
+            f"**Promedio por día**: {total_minutes / days / 60:.2f} horas\n"
+            f"**Promedio por tarea**: {total_minutes / total_tasks:.0f} minutos\n"
+        )
+        if skipped:
+            footer += f"**PRD sin tareas con hora**: {', '.join(skipped)}\n"
+        
+        # The body is copied in chunks behind the header, never read whole
+        body.seek(0)
+        chunks = chain([header], iter(lambda: body.read(BODY_CHUNK_SIZE), ''), [footer])
+        try:
+            write_chunks_if_changed(report_file, chunks)
+        except OSError as e:
+            return None, f"Error al generar reporte: {str(e)}"
+    
+    manifest.record(report_file, inputs)
+    manifest.save()
+    return str(report_file), f"Reporte de {days} días generado exitosamente"
+
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Generar reporte de horas trabajadas a partir de PRD diario",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -186,14 +344,46 @@ def main():
 Ejemplos:
   python generate_hours_report.py PRD_260216.md
   python generate_hours_report.py PRD_260216.md --output ./reports
+  python generate_hours_report.py --from 20260201 --to 20260215
+  python generate_hours_report.py --month 202602
+  python generate_hours_report.py --week 2026-W07
         """
     )
-    parser.add_argument('prd_file', help='Archivo PRD a analizar')
+    parser.add_argument('prd_file', nargs='?', help='Archivo PRD a analizar')
     parser.add_argument('--output', help=f'Directorio de salida para el reporte (default: {DEFAULT_OUTPUT_DIR or "mismo dir del PRD"})')
+    range_group = parser.add_argument_group('reporte por rango (lee PRD_DOCUMENTS y ARCHIVES)')
+    range_group.add_argument('--from', dest='date_from', help='Primera fecha YYYYMMDD')
+    range_group.add_argument('--to', dest='date_to', help='Última fecha YYYYMMDD (default: hoy)')
+    range_group.add_argument('--month', help='Mes completo YYYYMM')
+    range_group.add_argument('--week', help='Semana ISO YYYY-Www')
+    range_group.add_argument('--path', default=None, help=f'Carpeta PRD_DOCUMENTS (default: {DEFAULT_PRD_DIR})')
+    add_storage_arguments(range_group)
+    add_io_arguments(range_group)
+    add_cache_arguments(parser)
+    add_store_arguments(parser)
+    add_build_arguments(parser)
+    add_trace_arguments(parser)
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    setup_trace(args)
+    range_mode = args.date_from or args.date_to or args.month or args.week
+    if bool(args.prd_file) == bool(range_mode):
+        parser.error("indica un archivo PRD o un rango (--from/--to, --month, --week)")
+    if sum(bool(x) for x in (args.date_from or args.date_to, args.month, args.week)) > 1:
+        parser.error("--from/--to, --month y --week son excluyentes")
+    setup_parse_cache(args, DEFAULT_OUTPUT_DIR)
+    setup_store(args)
     
-    report_file, message = generate_report(args.prd_file, args.output)
+    if range_mode:
+        try:
+            date_from, date_to, label = resolve_range(args.date_from, args.date_to, args.month, args.week)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        report_file, message = generate_range_report(date_from, date_to, label, args.path, args.output, args.force,
+                                                    args.archives, args.io_workers)
+    else:
+        report_file, message = generate_report(args.prd_file, args.output, args.force)
     
     if report_file:
         print(f"✅ {message}")
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+PRD Trend Dashboard
+Dashboard HTML de tendencias por semana, mes y año: horas por día, tasa de
+completación y tareas pendientes a lo largo del tiempo.
+
+Se genera desde los totales precalculados de prd_rollups.py, sin volver a
+leer los PRD del rango: antes de dibujar se actualizan los totales (solo se
+leen los PRD que cambiaron desde la última vez). Las gráficas son SVG dentro
+del propio HTML, sin librerías ni CDN, así que el archivo funciona sin
+conexión; el detalle de cada barra o punto aparece al pasar el ratón.
+
+Uso:
+    python generate_trend_dashboard.py [--from YYYYMMDD] [--to YYYYMMDD] [--view week|month|year]
+                                       [--output DIR] [--no-update]
+
+Genera: PRD_TENDENCIAS_YYYYMMDD_YYYYMMDD.html en REPORTS
+
+Ejemplos:
+    python generate_trend_dashboard.py                          # Último año con datos
+    python generate_trend_dashboard.py --from 20250101 --to 20251231 --view month
+    python generate_trend_dashboard.py --no-update              # Solo con los totales guardados
+"""
+
+import argparse
+import math
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from generate_dashboard import DASHBOARD_CSS, DASHBOARD_JS, parse_day
+from prd_build import write_if_changed
+from prd_core import period_key
+from prd_rollups import DEFAULT_REPORTS_DIR, DEFAULT_ROLLUPS_PATH, PERIOD_KINDS, Rollups, update_rollups
+from prd_storage import add_io_arguments, add_storage_arguments
+from prd_trace import add_trace_arguments, setup_trace, span
+
+# Render time allowed for a year of data, in seconds; main() warns above it
+RENDER_BUDGET = 0.05
+
+# Default range when --from is not given: this many days up to --to
+DEFAULT_RANGE_DAYS = 365
+
+VIEW_TITLES = {'week': 'Semanas', 'month': 'Meses', 'year': 'Años'}
+
+# SVG chart geometry (viewBox units; the charts scale to the page width)
+CHART_WIDTH = 960
+CHART_HEIGHT = 220
+MARGIN_LEFT = 52
+MARGIN_RIGHT = 8
+MARGIN_TOP = 12
+MARGIN_BOTTOM = 28
+# At most this many labels along the x axis
+MAX_X_LABELS = 12
+
+COLOR_HOURS = "#6366f1"
+COLOR_RATE = "#10b981"
+COLOR_PENDING = "#f59e0b"
+
+TREND_CSS = """        .view-radio {
+            display: none;
+        }
+
+        .view-tabs {
+            display: flex;
+            gap: 10px;
+            margin-bottom: 30px;
+        }
+
+        .view-tab {
+            padding: 8px 18px;
+            border-radius: 8px;
+            border: 2px solid var(--border-dark);
+            cursor: pointer;
+            font-weight: 600;
+        }
+
+        #view-week:checked ~ .view-tabs label[for="view-week"],
+        #view-month:checked ~ .view-tabs label[for="view-month"],
+        #view-year:checked ~ .view-tabs label[for="view-year"] {
+            background: var(--primary);
+            border-color: var(--primary);
+            color: white;
+        }
+
+        .view {
+            display: none;
+        }
+
+        #view-week:checked ~ .views .view-week,
+        #view-month:checked ~ .views .view-month,
+        #view-year:checked ~ .views .view-year {
+            display: block;
+        }
+
+        .chart {
+            width: 100%;
+            height: auto;
+            margin-bottom: 30px;
+        }
+
+        .chart text {
+            fill: currentColor;
+            opacity: 0.7;
+            font-size: 12px;
+        }
+
+        .chart .axis {
+            stroke: currentColor;
+            opacity: 0.3;
+        }
+
+        .chart rect:hover, .chart circle:hover {
+            opacity: 0.7;
+        }
+
+        .section h3 {
+            margin-bottom: 10px;
+            opacity: 0.9;
+        }
+
+"""
+
+
+def format_hours(value):
+    return f"{value:.1f}h"
+
+
+def format_percent(value):
+    return f"{value:.0f}%"
+
+
+def format_count(value):
+    return f"{value:.0f}"
+
+
+def _frame(points, top, value_format):
+    """Opening tag, axes and labels of a chart; returns (parts, x of each
+    point, y of a value)."""
+    plot_width = CHART_WIDTH - MARGIN_LEFT - MARGIN_RIGHT
+    plot_height = CHART_HEIGHT - MARGIN_TOP - MARGIN_BOTTOM
+    bottom = MARGIN_TOP + plot_height
+    step = plot_width / len(points)
+
+    def y_of(value):
+        return bottom - value / top * plot_height
+
+    parts = [
+        f'<svg class="chart" viewBox="0 0 {CHART_WIDTH} {CHART_HEIGHT}" role="img" xmlns="http://www.w3.org/2000/svg">',
+        f'<line class="axis" x1="{MARGIN_LEFT}" y1="{bottom}" x2="{CHART_WIDTH - MARGIN_RIGHT}" y2="{bottom}"/>',
+        f'<line class="axis" x1="{MARGIN_LEFT}" y1="{MARGIN_TOP}" x2="{MARGIN_LEFT}" y2="{bottom}"/>',
+    ]
+    for fraction in (0, 0.5, 1):
+        y = y_of(top * fraction)
+        parts.append(f'<text x="{MARGIN_LEFT - 6}" y="{y + 4:.1f}" text-anchor="end">{value_format(top * fraction)}</text>')
+    every = math.ceil(len(points) / MAX_X_LABELS)
+    for index in range(0, len(points), every):
+        x = MARGIN_LEFT + (index + 0.5) * step
+        parts.append(f'<text x="{x:.1f}" y="{CHART_HEIGHT - 8}" text-anchor="middle">{points[index][0]}</text>')
+    return parts, step, y_of
+
+
+def bar_chart(points, value_format, color, top=None):
+    """Inline SVG bar chart of points [(label, value)]."""
+    if not points:
+        return '<div class="empty-state"><p>Sin datos en el rango</p></div>'
+    top = top or max(value for _, value in points) or 1
+    parts, step, y_of = _frame(points, top, value_format)
+    width = max(step * 0.8, 1)
+    bottom = y_of(0)
+    parts.append(f'<g fill="{color}">')
+    for index, (label, value) in enumerate(points):
+        x = MARGIN_LEFT + index * step + (step - width) / 2
+        y = y_of(value)
+        parts.append(f'<rect x="{x:.1f}" y="{y:.1f}" width="{width:.1f}" height="{bottom - y:.1f}">'
+                     f'<title>{label}: {value_format(value)}</title></rect>')
+    parts.append('</g></svg>')
+    return ''.join(parts)
+
+
+def line_chart(points, value_format, color, top=None):
+    """Inline SVG line chart of points [(label, value)], one dot per point."""
+    if not points:
+        return '<div class="empty-state"><p>Sin datos en el rango</p></div>'
+    top = top or max(value for _, value in points) or 1
+    parts, step, y_of = _frame(points, top, value_format)
+    coordinates = [(MARGIN_LEFT + (index + 0.5) * step, y_of(value)) for index, (_, value) in enumerate(points)]
+    path = ' '.join(f"{x:.1f},{y:.1f}" for x, y in coordinates)
+    parts.append(f'<polyline fill="none" stroke="{color}" stroke-width="2" points="{path}"/>')
+    radius = 3 if len(points) <= 120 else 1.5
+    parts.append(f'<g fill="{color}">')
+    for (label, value), (x, y) in zip(points, coordinates):
+        parts.append(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="{radius}"><title>{label}: {value_format(value)}</title></circle>')
+    parts.append('</g></svg>')
+    return ''.join(parts)
+
+
+def completion_rate(totals):
+    return totals['completed'] / totals['tasks'] * 100 if totals['tasks'] else 0
+
+
+def period_series(rollups, kind, date_from, date_to):
+    """(key, totals) of the periods of kind that overlap [date_from, date_to]
+    (YYYYMMDD), in order. Periods are whole, so the first and last may
+    include days outside the range."""
+    first = period_key(datetime.strptime(date_from, "%Y%m%d").toordinal(), kind)
+    last = period_key(datetime.strptime(date_to, "%Y%m%d").toordinal(), kind)
+    periods = rollups.periods[kind]
+    return [(key, periods[key]) for key in sorted(periods) if first <= key <= last]
+
+
+def day_series(rollups, date_from, date_to):
+    """(YYYYMMDD, totals) of every day with a PRD in [date_from, date_to]."""
+    return [(day, rollups.days[day]) for day in sorted(rollups.days) if date_from <= day <= date_to]
+
+
+def render_view(kind, series):
+    """Charts of one view (week, month or year)."""
+    labels = [key for key, _ in series]
+    hours = [(key, totals['minutes'] / totals['days'] / 60) for key, totals in series]
+    rates = [(key, completion_rate(totals)) for key, totals in series]
+    pending = [(key, totals['pending']) for key, totals in series]
+    return f"""
+            <div class="view view-{kind}">
+                <div class="section">
+                    <h3>⏱️ Horas por día trabajado</h3>
+                    {bar_chart(hours, format_hours, COLOR_HOURS)}
+                    <h3>✅ Tasa de completación</h3>
+                    {line_chart(rates, format_percent, COLOR_RATE, top=100)}
+                    <h3>⏳ Tareas pendientes</h3>
+                    {bar_chart(pending, format_count, COLOR_PENDING)}
+                    <p class="stat-subtext">{len(labels)} periodos</p>
+                </div>
+            </div>"""
+
+
+def render_trends(rollups, date_from, date_to, view='week'):
+    """HTML of the trend dashboard for [date_from, date_to] (YYYYMMDD).
+
+    Only stored aggregates are read: the per-period totals for the views
+    and the per-day totals for the daily chart and the summary cards.
+    """
+    days = day_series(rollups, date_from, date_to)
+    minutes = sum(totals['minutes'] for _, totals in days)
+    totals = {field: sum(day[field] for _, day in days) for field in ('completed', 'pending', 'tasks')}
+    hours_per_day = minutes / len(days) / 60 if days else 0
+    daily = [(f"{day[:4]}-{day[4:6]}-{day[6:]}", day_totals['minutes'] / 60) for day, day_totals in days]
+
+    radios = '\n'.join(
+        f'        <input type="radio" name="view" id="view-{kind}" class="view-radio"{" checked" if kind == view else ""}>'
+        for kind in PERIOD_KINDS
+    )
+    tabs = ''.join(f'<label for="view-{kind}" class="view-tab">{VIEW_TITLES[kind]}</label>' for kind in PERIOD_KINDS)
+    views = ''.join(render_view(kind, period_series(rollups, kind, date_from, date_to)) for kind in PERIOD_KINDS)
+    range_label = (f"{date_from[:4]}-{date_from[4:6]}-{date_from[6:]} → "
+                   f"{date_to[:4]}-{date_to[4:6]}-{date_to[6:]}")
+
+    return f"""<!DOCTYPE html>
+<html lang="es">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>PRD Tendencias - {range_label}</title>
+    <style>
+{DASHBOARD_CSS}{TREND_CSS}    </style>
+</head>
+<body class="dark-mode">
+    <div class="container">
+        <div class="header">
+            <div>
+                <h1>📈 PRD Tendencias</h1>
+                <p class="header-date">📅 {range_label}</p>
+            </div>
+            <button class="theme-toggle" onclick="toggleTheme()">🌙 Modo Oscuro</button>
+        </div>
+
+        <div class="stats-grid">
+            <div class="stat-card">
+                <h3>Horas Trabajadas</h3>
+                <div class="stat-value">{minutes // 60}h {minutes % 60}m</div>
+                <div class="stat-subtext">en {len(days)} días con PRD</div>
+            </div>
+
+            <div class="stat-card">
+                <h3>Horas por Día</h3>
+                <div class="stat-value">{hours_per_day:.1f}h</div>
+                <div class="stat-subtext">media de los días trabajados</div>
+            </div>
+
+            <div class="stat-card">
+                <h3>Tasa de Completación</h3>
+                <div class="stat-value">{completion_rate(totals):.0f}%</div>
+                <div class="stat-subtext">{totals['completed']} de {totals['tasks']} tareas</div>
+                <div class="progress-bar">
+                    <div class="progress-fill" style="width: {completion_rate(totals):.0f}%"></div>
+                </div>
+            </div>
+
+            <div class="stat-card">
+                <h3>Tareas Pendientes</h3>
+                <div class="stat-value">{totals['pending']}</div>
+                <div class="stat-subtext">sin terminar en el rango</div>
+            </div>
+        </div>
+
+        <div class="section">
+            <h2>📅 Horas por Día</h2>
+            {bar_chart(daily, format_hours, COLOR_HOURS)}
+        </div>
+
+{radios}
+        <div class="view-tabs">{tabs}</div>
+        <div class="views">{views}
+        </div>
+
+        <footer>
+            <p>Datos hasta: {days[-1][0] if days else '-'}</p>
+            <p>💾 Totales precalculados de prd_rollups.json</p>
+        </footer>
+    </div>
+
+    <script>
+{DASHBOARD_JS}    </script>
+</body>
+</html>
+"""
+
+
+def trend_dashboard_path(date_from, date_to, output_dir=None):
+    return Path(output_dir or DEFAULT_REPORTS_DIR).expanduser() / f"PRD_TENDENCIAS_{date_from}_{date_to}.html"
+
+
+def default_range(rollups, date_from=None, date_to=None):
+    """Fill in a missing end with the last day with data (or today) and a
+    missing start with DEFAULT_RANGE_DAYS before the end."""
+    if not date_to:
+        date_to = max(rollups.days) if rollups.days else datetime.now().strftime("%Y%m%d")
+    if not date_from:
+        end = datetime.strptime(date_to, "%Y%m%d")
+        date_from = (end - timedelta(days=DEFAULT_RANGE_DAYS - 1)).strftime("%Y%m%d")
+    return date_from, date_to
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Dashboard HTML de tendencias por semana, mes y año",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python generate_trend_dashboard.py
+  python generate_trend_dashboard.py --from 20250101 --to 20251231 --view month
+  python generate_trend_dashboard.py --no-update
+        """
+    )
+    parser.add_argument('--from', dest='date_from', type=parse_day,
+                        help=f'Primera fecha YYYYMMDD (default: {DEFAULT_RANGE_DAYS} días antes de --to)')
+    parser.add_argument('--to', dest='date_to', type=parse_day, help='Última fecha YYYYMMDD (default: último día con datos)')
+    parser.add_argument('--view', choices=PERIOD_KINDS, default='week', help='Vista inicial (default: week)')
+    parser.add_argument('--output', default=None, help=f'Directorio de salida (default: {DEFAULT_REPORTS_DIR})')
+    parser.add_argument('--file', default=DEFAULT_ROLLUPS_PATH, help=f'Archivo de totales (default: {DEFAULT_ROLLUPS_PATH})')
+    parser.add_argument('--path', default=None, help='Carpeta PRD_DOCUMENTS')
+    parser.add_argument('--no-update', action='store_true', help='No actualizar los totales antes de dibujar')
+    add_storage_arguments(parser)
+    add_io_arguments(parser)
+    add_trace_arguments(parser)
+
+    args = parser.parse_args(argv)
+    setup_trace(args)
+    if args.date_from and args.date_to and args.date_from > args.date_to:
+        parser.error("--from debe ser anterior o igual a --to")
+
+    if args.no_update:
+        rollups = Rollups(args.file)
+    else:
+        try:
+            rollups, _ = update_rollups(args.path, args.file, args.archives, args.io_workers)
+        except (OSError, TimeoutError) as e:
+            print(f"❌ Error al actualizar los totales: {e}")
+            return 1
+
+    date_from, date_to = default_range(rollups, args.date_from, args.date_to)
+    started = time.perf_counter()
+    with span('render', file='trends'):
+        html = render_trends(rollups, date_from, date_to, args.view)
+    elapsed = time.perf_counter() - started
+
+    output_path = trend_dashboard_path(date_from, date_to, args.output)
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        written = write_if_changed(output_path, html)
+    except OSError as e:
+        print(f"❌ Error al escribir el dashboard: {e}")
+        return 1
+
+    print(f"✅ Dashboard de tendencias {'generado' if written else 'al día'} en {elapsed * 1000:.0f} ms")
+    print(f"   Archivo: {output_path}")
+    if elapsed > RENDER_BUDGET:
+        print(f"⚠️  El dibujo superó el presupuesto de {RENDER_BUDGET * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
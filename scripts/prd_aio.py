@@ -0,0 +1,150 @@
+"""
+PRD Async I/O
+Lectura concurrente de muchos PRD o carpetas diarias (modos rango y lote)
+para carpetas lentas: OneDrive, SMB... donde cada open() o stat() cuesta
+decenas de milisegundos.
+
+- Un bucle asyncio reparte los stat y las lecturas en un pool de hilos con
+  concurrencia limitada (--io-workers)
+- Cada PRD se lee y se parsea (o se carga de su sidecar JSON) en el pool, sin
+  esperar al resto
+- Los resultados salen en el orden de entrada, con una ventana de lectura
+  anticipada acotada: la memoria no crece con la longitud del rango
+- Un PRD ya parseado (en memoria o en la caché de parseo) se reutiliza tras
+  el stat, sin leer el archivo
+
+El bucle corre en el hilo que consume los resultados, porque la caché de
+parseo (SQLite) solo puede usarse desde el hilo que la abrió. Los scripts
+importan este módulo solo en modo rango/lote: importar asyncio es caro.
+
+Uso:
+    from prd_aio import iter_prds
+
+    for entry, prd in iter_prds(entries, concurrency=8):
+        ...
+"""
+
+import asyncio
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from prd_core import cached_prd, parse_prd, read_prd_file, remember_prd
+from prd_storage import DEFAULT_IO_WORKERS, as_entry, entry_hash, read_member
+from prd_trace import count, span
+
+# Results computed ahead of the consumer, per reader thread
+READ_AHEAD = 2
+
+_END = object()
+
+
+def _stat(path):
+    path = Path(path).expanduser().resolve()
+    return path, os.stat(path)
+
+
+async def _load(entry, loop, executor, remember):
+    """Load one PRD: stat, read and parse in the executor; caches on the loop."""
+    if entry.archived:
+        data = await loop.run_in_executor(executor, read_member, entry.archive, entry.member)
+        with span('parse', file=entry.name):
+            return parse_prd(data.decode('utf-8'))
+
+    path, stat = await loop.run_in_executor(executor, _stat, entry.path)
+    count('files_stat')
+    prd = cached_prd(path, stat)
+    if prd is not None:
+        if remember:
+            remember_prd(path, stat, prd, cache=False)
+        return prd
+
+    prd, _ = await loop.run_in_executor(executor, read_prd_file, path)
+    remember_prd(path, stat, prd, remember)
+    return prd
+
+
+async def _ordered(items, start, window, return_exceptions):
+    """Yield (item, result) in input order, with at most window items
+    started and not yet consumed. start(item) returns a coroutine."""
+    items = iter(items)
+    pending = deque()
+
+    def fill():
+        while len(pending) < window:
+            item = next(items, _END)
+            if item is _END:
+                return
+            pending.append((item, asyncio.ensure_future(start(item))))
+
+    fill()
+    try:
+        while pending:
+            item, task = pending.popleft()
+            try:
+                result = await task
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                result = e
+            fill()
+            yield item, result
+    finally:
+        for _, task in pending:
+            task.cancel()
+        await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+
+def _run_ordered(items, start, concurrency, return_exceptions):
+    """Drive _ordered from synchronous code, one result at a time.
+
+    Reads in flight keep running in the pool while the caller handles a
+    result; parsing resumes the next time the loop runs.
+    """
+    concurrency = max(1, concurrency or DEFAULT_IO_WORKERS)
+    loop = asyncio.new_event_loop()
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='prd-io')
+    pipeline = _ordered(items, lambda item: start(item, loop, executor),
+                        concurrency * READ_AHEAD, return_exceptions)
+    try:
+        with span('aio', workers=concurrency):
+            while True:
+                try:
+                    item = loop.run_until_complete(pipeline.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield item
+    finally:
+        loop.run_until_complete(pipeline.aclose())
+        executor.shutdown(wait=True, cancel_futures=True)
+        loop.close()
+
+
+def iter_prds(entries, concurrency=None, remember=False, return_exceptions=False):
+    """Yield (entry, parsed PRD) for paths or PRDEntry objects, in order.
+
+    entry is the object given. With return_exceptions a PRD that cannot be
+    read yields its exception instead of stopping the iteration.
+    """
+    async def start(entry, loop, executor):
+        return await _load(as_entry(entry), loop, executor, remember)
+
+    return _run_ordered(entries, start, concurrency, return_exceptions)
+
+
+def map_ordered(function, items, concurrency=None, return_exceptions=False):
+    """Yield (item, function(item)) in order, running function in the pool.
+
+    For blocking I/O only (stat, hashing, folder scans): function runs in
+    a reader thread.
+    """
+    async def start(item, loop, executor):
+        return await loop.run_in_executor(executor, function, item)
+
+    return _run_ordered(items, start, concurrency, return_exceptions)
+
+
+def hash_entries(entries, concurrency=None):
+    """SHA-256 of many PRDs (build manifest inputs), hashed concurrently."""
+    return [digest for _, digest in map_ordered(entry_hash, entries, concurrency)]
@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+PRD Archive
+Archiva semanas o meses ya terminados en la carpeta ARCHIVES: los PRD, las
+carpetas diarias YYMMDD y los reportes de esos días se guardan en un zip por
+periodo y se borran de las carpetas de trabajo.
+
+- Un zip por periodo (PRD_2026-02.zip, PRD_2026-W07.zip) comprimido archivo
+  a archivo: cualquier archivo se lee directamente sin descomprimir el resto
+- Índice central ARCHIVES/archive_index.json con el SHA-256 y el tamaño de
+  cada archivo, más una copia del índice del periodo dentro de cada zip
+- Los originales se borran solo después de verificar el zip (--keep para
+  conservarlos)
+- Nunca se archiva la semana o el mes en curso
+- verify comprueba los zip contra los hashes guardados
+
+Dentro del zip cada archivo va bajo su carpeta de origen:
+PRD_DOCUMENTS/PRD_20260216.md, DAILY_WORK/260216/notas.md,
+REPORTS/HORAS_PRD_20260216.md...
+
+Uso:
+    python prd_archive.py pack --month YYYYMM | --week YYYY-Www | --all [--path DIR] [--daily-path DIR] [--keep] [--dry-run]
+    python prd_archive.py verify [PRD_2026-02.zip ...]
+    python prd_archive.py list
+
+Ejemplos:
+    python prd_archive.py pack --month 202601          # Archiva enero
+    python prd_archive.py pack --all --dry-run         # ¿Qué meses se archivarían?
+    python prd_archive.py verify                       # Comprueba todos los archivos
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import zipfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from prd_config import load_config
+from prd_core import prd_file_date, resolve_range, sidecar_path
+from prd_trace import add_trace_arguments, count, setup_trace, span
+from prd_write import locked, write_atomic
+
+# Load configuration
+DEFAULT_PRD_DIR = "~/Documents/prd_diarios/PRD_DOCUMENTS"
+DEFAULT_DAILY_DIR = "~/Documents/prd_diarios/DAILY_WORK"
+DEFAULT_REPORTS_DIR = None
+DEFAULT_ARCHIVE_DIR = "~/Documents/prd_diarios/ARCHIVES"
+
+config = load_config()
+if config:
+    try:
+        folders = config.get("folders", {})
+        DEFAULT_PRD_DIR = os.path.expanduser(folders.get("prd_documents", DEFAULT_PRD_DIR))
+        DEFAULT_DAILY_DIR = os.path.expanduser(folders.get("daily_work", DEFAULT_DAILY_DIR))
+        DEFAULT_ARCHIVE_DIR = os.path.expanduser(folders.get("archives", DEFAULT_ARCHIVE_DIR))
+        reports_dir = folders.get("reports") or config.get("prd_output_directory")
+        if reports_dir:
+            DEFAULT_REPORTS_DIR = os.path.expanduser(reports_dir)
+    except Exception:
+        pass
+
+INDEX_FILENAME = "archive_index.json"
+INDEX_MEMBER = "index.json"
+INDEX_VERSION = 1
+CHUNK_SIZE = 1024 * 1024
+
+# Roots of the archived files; members are named <ROOT>/<relative path>
+PRD_ROOT = "PRD_DOCUMENTS"
+DAILY_ROOT = "DAILY_WORK"
+REPORTS_ROOT = "REPORTS"
+
+# Already compressed formats are stored as they are
+STORED_SUFFIXES = {
+    '.zip', '.gz', '.bz2', '.xz', '.7z', '.rar', '.png', '.jpg', '.jpeg', '.gif',
+    '.webp', '.pdf', '.mp3', '.mp4', '.mov', '.docx', '.xlsx', '.pptx',
+}
+
+
+def archive_name(label):
+    """File name of the archive of a period label ('2026-02', '2026-W07')."""
+    return f"PRD_{label}.zip"
+
+
+def report_names(day):
+    """Per-day reports written by the generators for day (YYYYMMDD)."""
+    return (f"HORAS_PRD_{day}.md", f"PRD_{day}_DASHBOARD.html", f"RESUMEN_{day[2:]}.md")
+
+
+def days_between(first, last):
+    """Every YYYYMMDD day from first to last, inclusive."""
+    day = datetime.strptime(first, "%Y%m%d").date()
+    end = datetime.strptime(last, "%Y%m%d").date()
+    while day <= end:
+        yield day.strftime("%Y%m%d")
+        day += timedelta(days=1)
+
+
+def collect_period(first, last, prd_dir, daily_dir, reports_dir=None):
+    """Return ([(member name, path)], days with a PRD) for the files of a period.
+
+    Collects the PRD of each day and its JSON sidecar, its DAILY_WORK/YYMMDD
+    folder (everything in it, including hidden files) and its hours report,
+    dashboard and summary from PRD_DOCUMENTS and REPORTS. Symlinks are left
+    alone.
+    """
+    prd_dir = Path(prd_dir).expanduser()
+    daily_dir = Path(daily_dir).expanduser()
+    roots = [(PRD_ROOT, prd_dir)]
+    if reports_dir and Path(reports_dir).expanduser().resolve() != prd_dir.resolve():
+        roots.append((REPORTS_ROOT, Path(reports_dir).expanduser()))
+
+    sources = []
+    days = []
+    for day in days_between(first, last):
+        prd_path = prd_dir / f"PRD_{day}.md"
+        if prd_path.is_file():
+            sources.append((f"{PRD_ROOT}/{prd_path.name}", prd_path))
+            days.append(day)
+            sidecar = sidecar_path(prd_path)
+            if sidecar.is_file():
+                sources.append((f"{PRD_ROOT}/{sidecar.name}", sidecar))
+
+        for root_name, root in roots:
+            for name in report_names(day):
+                path = root / name
+                if path.is_file() and not path.is_symlink():
+                    sources.append((f"{root_name}/{name}", path))
+
+        folder = daily_dir / day[2:]
+        if folder.is_dir() and not folder.is_symlink():
+            for dirpath, dirnames, filenames in os.walk(folder):
+                dirnames.sort()
+                for name in sorted(filenames):
+                    path = Path(dirpath) / name
+                    if path.is_symlink() or not path.is_file():
+                        continue
+                    sources.append((f"{DAILY_ROOT}/{path.relative_to(daily_dir).as_posix()}", path))
+    return sources, days
+
+
+def _add_member(zf, arcname, path):
+    """Stream path into the archive; returns its {'sha256', 'size'}."""
+    info = zipfile.ZipInfo.from_file(path, arcname)
+    info.compress_type = (zipfile.ZIP_STORED if path.suffix.lower() in STORED_SUFFIXES
+                          else zipfile.ZIP_DEFLATED)
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as src, zf.open(info, 'w') as dst:
+        for chunk in iter(lambda: src.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+            dst.write(chunk)
+            size += len(chunk)
+    count('files_archived')
+    count('bytes_archived', size)
+    return {'sha256': digest.hexdigest(), 'size': size}
+
+
+def read_archive_index(archive_path):
+    """The index stored inside an archive (its own index.json member)."""
+    with zipfile.ZipFile(archive_path) as zf:
+        return json.loads(zf.read(INDEX_MEMBER).decode('utf-8'))
+
+
+def verify_archive(archive_path, expected=None):
+    """Check every member of an archive against its stored hash and size.
+
+    expected is the period entry of the central index; without it the index
+    inside the archive is used. Returns a list of problems (empty if the
+    archive is intact).
+    """
+    problems = []
+    try:
+        with span('verify', archive=Path(archive_path).name):
+            with zipfile.ZipFile(archive_path) as zf:
+                if expected is None:
+                    expected = json.loads(zf.read(INDEX_MEMBER).decode('utf-8'))
+                names = set(zf.namelist()) - {INDEX_MEMBER}
+                for arcname, member in sorted(expected.get('members', {}).items()):
+                    if arcname not in names:
+                        problems.append(f"Falta {arcname}")
+                        continue
+                    digest = hashlib.sha256()
+                    size = 0
+                    try:
+                        with zf.open(arcname) as f:
+                            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                                digest.update(chunk)
+                                size += len(chunk)
+                    except (zipfile.BadZipFile, OSError, EOFError) as e:
+                        # BadZipFile is raised on a CRC mismatch
+                        problems.append(f"Dañado {arcname}: {e}")
+                        continue
+                    count('bytes_verified', size)
+                    if size != member['size'] or digest.hexdigest() != member['sha256']:
+                        problems.append(f"Hash distinto en {arcname}")
+                for arcname in sorted(names - set(expected.get('members', {}))):
+                    problems.append(f"Archivo no indexado: {arcname}")
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        problems.append(f"No se pudo leer {Path(archive_path).name}: {e}")
+    return problems
+
+
+class ArchiveIndex:
+    """Central index of the archives of one ARCHIVES folder.
+
+    {'version', 'archives': {file name: {'period', 'from', 'to', 'days',
+    'created', 'members': {member name: {'sha256', 'size'}}}}}
+    """
+
+    def __init__(self, archive_dir):
+        self.archive_dir = Path(archive_dir).expanduser()
+        self.path = self.archive_dir / INDEX_FILENAME
+        self.archives = self._read()
+
+    def _read(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('archives', {})
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self):
+        write_atomic(self.path, json.dumps({'version': INDEX_VERSION, 'archives': self.archives},
+                                           indent=1, ensure_ascii=False, sort_keys=True))
+
+    def add(self, name, entry):
+        """Add one archive and save, re-reading the index under the lock so
+        an archive added meanwhile by another process is kept."""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        with locked(self.path):
+            self.archives = self._read()
+            self.archives[name] = entry
+            self._write()
+
+    def save(self):
+        """Write the index atomically under the write lock."""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        with locked(self.path):
+            self._write()
+
+    def rebuild(self):
+        """Re-read the index of every archive in the folder (index lost or
+        archives copied in by hand). Returns the number of archives."""
+        self.archives = {}
+        for archive_path in sorted(self.archive_dir.glob("PRD_*.zip")):
+            try:
+                self.archives[archive_path.name] = read_archive_index(archive_path)
+            except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+                continue
+        return len(self.archives)
+
+
+def check_period_closed(last, today=None):
+    """Raise ValueError unless the period ending on last is over."""
+    today = today or date.today()
+    if datetime.strptime(last, "%Y%m%d").date() >= today:
+        raise ValueError("El periodo no ha terminado; solo se archivan semanas o meses completos")
+
+
+def pack_period(label, first, last, prd_dir, daily_dir, reports_dir=None, archive_dir=None,
+                keep=False, dry_run=False):
+    """Archive the files of a finished period.
+
+    The zip is written under a temporary name, verified member by member,
+    moved into place and added to the central index; only then are the
+    originals deleted (unless keep). Returns (archive_path, sources, problems).
+    """
+    check_period_closed(last)
+    archive_dir = Path(archive_dir or DEFAULT_ARCHIVE_DIR).expanduser()
+    archive_path = archive_dir / archive_name(label)
+
+    with span('scan', period=label):
+        sources, days = collect_period(first, last, prd_dir, daily_dir, reports_dir)
+    if not sources or dry_run:
+        return archive_path, sources, []
+    if archive_path.exists():
+        raise ValueError(f"Ya existe {archive_path.name}; los archivos restantes del periodo no se han tocado")
+
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = archive_path.with_name(archive_path.name + '.tmp')
+    entry = {
+        'period': label,
+        'from': first,
+        'to': last,
+        'days': days,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'members': {},
+    }
+    try:
+        with span('pack', period=label, files=len(sources)):
+            with zipfile.ZipFile(tmp_path, 'w') as zf:
+                for arcname, path in sources:
+                    entry['members'][arcname] = _add_member(zf, arcname, path)
+                zf.writestr(INDEX_MEMBER, json.dumps(entry, indent=1, ensure_ascii=False, sort_keys=True),
+                            compress_type=zipfile.ZIP_DEFLATED)
+
+        problems = verify_archive(tmp_path, entry)
+        if problems:
+            return archive_path, sources, problems
+        os.replace(tmp_path, archive_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    index = ArchiveIndex(archive_dir)
+    index.add(archive_path.name, entry)
+
+    if not keep:
+        remove_sources(sources, daily_dir)
+    return archive_path, sources, []
+
+
+def remove_sources(sources, daily_dir):
+    """Delete archived files, then the day folders they leave empty."""
+    daily_dir = Path(daily_dir).expanduser()
+    folders = set()
+    with span('delete', files=len(sources)):
+        for arcname, path in sources:
+            path.unlink()
+            if arcname.startswith(f"{DAILY_ROOT}/"):
+                folders.add(daily_dir / arcname.split('/')[1])
+
+        for folder in folders:
+            for dirpath, _, _ in os.walk(folder, topdown=False):
+                try:
+                    os.rmdir(dirpath)
+                except OSError:
+                    # Not empty: something that was not archived (a symlink)
+                    pass
+
+
+def completed_months(prd_dir, daily_dir, today=None):
+    """YYYYMM of every finished month that still has live PRDs or day folders."""
+    today = today or date.today()
+    current = today.strftime("%Y%m")
+    months = set()
+    try:
+        with os.scandir(Path(prd_dir).expanduser()) as entries:
+            for entry in entries:
+                day = prd_file_date(entry.name)
+                if day:
+                    months.add(day[:6])
+    except OSError:
+        pass
+    try:
+        with os.scandir(Path(daily_dir).expanduser()) as entries:
+            for entry in entries:
+                if len(entry.name) == 6 and entry.name.isdigit() and entry.is_dir():
+                    months.add(f"20{entry.name[:4]}")
+    except OSError:
+        pass
+    return sorted(month for month in months if month < current)
+
+
+def format_size(size):
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    return f"{size / 1024:.1f} KB"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Archivar semanas o meses terminados en la carpeta ARCHIVES",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python prd_archive.py pack --month 202601          # Archiva enero
+  python prd_archive.py pack --week 2026-W03 --keep  # Archiva sin borrar los originales
+  python prd_archive.py pack --all --dry-run         # ¿Qué meses se archivarían?
+  python prd_archive.py verify                       # Comprueba todos los archivos
+  python prd_archive.py list
+        """
+    )
+    parser.add_argument('--archives', default=None, help=f'Carpeta ARCHIVES (default: {DEFAULT_ARCHIVE_DIR})')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    pack_parser = subparsers.add_parser('pack', help='Archivar un periodo terminado')
+    period = pack_parser.add_mutually_exclusive_group(required=True)
+    period.add_argument('--month', help='Mes a archivar (YYYYMM)')
+    period.add_argument('--week', help='Semana ISO a archivar (YYYY-Www)')
+    period.add_argument('--all', action='store_true', help='Todos los meses terminados con archivos sin archivar')
+    pack_parser.add_argument('--path', default=None, help=f'Carpeta PRD_DOCUMENTS (default: {DEFAULT_PRD_DIR})')
+    pack_parser.add_argument('--daily-path', default=None, help=f'Carpeta DAILY_WORK (default: {DEFAULT_DAILY_DIR})')
+    pack_parser.add_argument('--reports', default=None, help=f'Carpeta REPORTS (default: {DEFAULT_REPORTS_DIR})')
+    pack_parser.add_argument('--keep', action='store_true', help='No borrar los originales tras archivar')
+    pack_parser.add_argument('--dry-run', action='store_true', help='Mostrar qué se archivaría sin hacer nada')
+
+    verify_parser = subparsers.add_parser('verify', help='Comprobar archivos contra sus hashes')
+    verify_parser.add_argument('names', nargs='*', metavar='archive', help='Archivos a comprobar (default: todos)')
+
+    list_parser = subparsers.add_parser('list', help='Listar los periodos archivados')
+    list_parser.add_argument('--rebuild', action='store_true', help='Reconstruir el índice central desde los zip')
+
+    add_trace_arguments(parser)
+
+    args = parser.parse_args(argv)
+    setup_trace(args)
+    archive_dir = Path(args.archives or DEFAULT_ARCHIVE_DIR).expanduser()
+
+    if args.command == 'pack':
+        prd_dir = args.path or DEFAULT_PRD_DIR
+        daily_dir = args.daily_path or DEFAULT_DAILY_DIR
+        reports_dir = args.reports or DEFAULT_REPORTS_DIR
+        try:
+            if args.all:
+                periods = [resolve_range(month=month) for month in completed_months(prd_dir, daily_dir)]
+            else:
+                periods = [resolve_range(month=args.month, week=args.week)]
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            return 1
+        if not periods:
+            print("✅ No hay meses terminados pendientes de archivar")
+            return 0
+
+        failed = False
+        for first, last, label in periods:
+            try:
+                archive_path, sources, problems = pack_period(label, first, last, prd_dir, daily_dir, reports_dir,
+                                                              archive_dir, args.keep, args.dry_run)
+            except (OSError, ValueError) as e:
+                print(f"❌ {label}: {e}")
+                failed = True
+                continue
+            size = sum(path.stat().st_size for _, path in sources) if args.dry_run else 0
+            if not sources:
+                print(f"⚠️  {label}: no hay archivos que archivar")
+            elif problems:
+                failed = True
+                print(f"❌ {label}: la verificación falló, no se borró nada")
+                for problem in problems:
+                    print(f"   - {problem}")
+            elif args.dry_run:
+                print(f"📦 {label}: {len(sources)} archivos ({format_size(size)}) → {archive_path}")
+            else:
+                state = "conservados" if args.keep else "borrados"
+                print(f"✅ {label}: {len(sources)} archivos → {archive_path} "
+                      f"({format_size(archive_path.stat().st_size)}, originales {state})")
+        return 1 if failed else 0
+
+    index = ArchiveIndex(archive_dir)
+
+    if args.command == 'verify':
+        names = args.names or sorted(index.archives) or sorted(p.name for p in archive_dir.glob("PRD_*.zip"))
+        if not names:
+            print(f"⚠️  No hay archivos en {archive_dir}")
+            return 0
+        failed = False
+        for name in names:
+            archive_path = archive_dir / Path(name).name
+            problems = verify_archive(archive_path, index.archives.get(archive_path.name))
+            if problems:
+                failed = True
+                print(f"❌ {archive_path.name}")
+                for problem in problems:
+                    print(f"   - {problem}")
+            else:
+                print(f"✅ {archive_path.name}")
+        return 1 if failed else 0
+
+    if args.rebuild:
+        total = index.rebuild()
+        index.save()
+        print(f"✅ Índice reconstruido con {total} archivos: {index.path}")
+    if not index.archives:
+        print(f"⚠️  No hay periodos archivados en {archive_dir}")
+        return 0
+    for name, entry in sorted(index.archives.items()):
+        size = sum(member['size'] for member in entry['members'].values())
+        print(f"📦 {entry['period']:<9} {len(entry['days']):>3} días  {len(entry['members']):>5} archivos  "
+              f"{format_size(size):>9}  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
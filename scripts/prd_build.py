@@ -0,0 +1,182 @@
+"""
+PRD Build Manifest
+Regeneración incremental de reportes: registra el hash de las entradas de
+cada archivo generado y evita regenerarlo (o reescribirlo) si nada cambió.
+
+Cada carpeta de salida guarda un `.prd_manifest.json` con, por artefacto:
+- los hashes SHA-256 de sus entradas (PRD, listado de carpeta, código)
+- el hash, tamaño y mtime del archivo escrito
+
+Uso:
+    manifest = manifest_for(report_file)
+    inputs = {str(prd_path): hash_file(prd_path), 'code': code_fingerprint(__file__)}
+    if not manifest.is_fresh(report_file, inputs):
+        written = write_if_changed(report_file, render())
+        manifest.record(report_file, inputs)
+        manifest.save()
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from prd_trace import count, span
+from prd_write import move_into_place, replace_file, temp_path
+
+MANIFEST_FILENAME = ".prd_manifest.json"
+CHUNK_SIZE = 1024 * 1024
+
+# Open manifests of this process, keyed by folder
+_MANIFESTS = {}
+_CODE_FINGERPRINTS = {}
+
+
+def hash_bytes(data):
+    """SHA-256 hex digest of a bytes object."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path):
+    """SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+            count('bytes_hashed', len(chunk))
+    return digest.hexdigest()
+
+
+def code_fingerprint(*module_files):
+    """Hash of the given source files plus prd_core and this module.
+
+    Included in the inputs of every artifact so reports are rebuilt after
+    the scripts themselves are updated.
+    """
+    files = tuple(sorted({str(Path(f).resolve()) for f in module_files} | {
+        str(Path(__file__).resolve()),
+        str((Path(__file__).parent / "prd_core.py").resolve()),
+    }))
+    if files not in _CODE_FINGERPRINTS:
+        digest = hashlib.sha256()
+        for file in files:
+            digest.update(hash_file(file).encode())
+        _CODE_FINGERPRINTS[files] = digest.hexdigest()
+    return _CODE_FINGERPRINTS[files]
+
+
+def write_if_changed(path, content):
+    """Write content (str) to path unless the file already holds those bytes.
+
+    The file is replaced atomically. Returns True if it was written. Reports
+    carry no generation timestamp, so rendering unchanged data gives the
+    same bytes.
+    """
+    data = content.encode('utf-8')
+    path = Path(path)
+    with span('write', file=path.name):
+        try:
+            if path.stat().st_size == len(data) and hash_file(path) == hash_bytes(data):
+                count('files_unchanged')
+                return False
+        except OSError:
+            pass
+
+        replace_file(path, data)
+    count('files_written')
+    count('bytes_written', len(data))
+    return True
+
+
+def write_chunks_if_changed(path, chunks):
+    """write_if_changed() for content produced piece by piece.
+
+    The str chunks go straight to the temporary file that will replace
+    path, hashed on the way, so the whole content is never in memory. The
+    temporary file is dropped if path already holds the same bytes.
+    Returns True if path was written.
+    """
+    path = Path(path)
+    tmp_path = temp_path(path)
+    digest = hashlib.sha256()
+    size = 0
+    with span('write', file=path.name):
+        try:
+            with open(tmp_path, 'xb') as f:
+                for chunk in chunks:
+                    data = chunk.encode('utf-8')
+                    digest.update(data)
+                    f.write(data)
+                    size += len(data)
+            try:
+                unchanged = path.stat().st_size == size and hash_file(path) == digest.hexdigest()
+            except OSError:
+                unchanged = False
+            if unchanged:
+                tmp_path.unlink()
+                count('files_unchanged')
+                return False
+            move_into_place(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    count('files_written')
+    count('bytes_written', size)
+    return True
+
+
+class BuildManifest:
+    """Inputs and outputs of the artifacts generated in one folder."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.entries = {}
+        self.dirty = False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('artifacts', {})
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def is_fresh(self, artifact, inputs):
+        """True if artifact exists unchanged and was built from these inputs."""
+        entry = self.entries.get(str(Path(artifact).resolve()))
+        if not entry or entry.get('inputs') != inputs:
+            return False
+        try:
+            stat = os.stat(artifact)
+        except OSError:
+            return False
+        return [stat.st_size, stat.st_mtime_ns] == entry.get('stat')
+
+    def record(self, artifact, inputs):
+        """Remember that artifact, as it is now on disk, came from inputs."""
+        stat = os.stat(artifact)
+        self.entries[str(Path(artifact).resolve())] = {
+            'inputs': inputs,
+            'stat': [stat.st_size, stat.st_mtime_ns],
+        }
+        self.dirty = True
+
+    def save(self):
+        """Write the manifest atomically if it changed."""
+        if not self.dirty:
+            return
+        data = json.dumps({'version': 1, 'artifacts': self.entries},
+                          indent=1, ensure_ascii=False, sort_keys=True)
+        replace_file(self.path, data.encode('utf-8'))
+        self.dirty = False
+
+
+def manifest_for(artifact):
+    """Return the (process-wide) manifest of the folder holding artifact."""
+    folder = Path(artifact).resolve().parent
+    if folder not in _MANIFESTS:
+        _MANIFESTS[folder] = BuildManifest(folder / MANIFEST_FILENAME)
+    return _MANIFESTS[folder]
+
+
+def add_build_arguments(parser):
+    """Add the --force option to an argparse parser."""
+    parser.add_argument('--force', action='store_true',
+                        help='Regenerar aunque las entradas no hayan cambiado')
@@ -0,0 +1,203 @@
+"""
+PRD Parse Cache
+Caché persistente de PRD ya parseados, guardada en la carpeta REPORTS.
+
+Cada entrada se identifica por (ruta, st_mtime_ns, st_size, st_ino) y la
+versión del parser, así que un PRD que no ha cambiado desde la última ejecución se carga
+de la caché sin volver a parsear el markdown.
+
+Uso desde un script:
+    parser = argparse.ArgumentParser(...)
+    add_cache_arguments(parser)
+    args = parser.parse_args()
+    setup_parse_cache(args, reports_dir)
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+from prd_core import PARSER_VERSION, PRD, set_parse_cache
+
+CACHE_FILENAME = ".prd_cache.sqlite"
+
+# Entries whose file vanished or changed are purged at most once per day
+EVICT_INTERVAL = 24 * 60 * 60
+
+# Bump when the layout of the entries table changes; an older cache is
+# emptied on open
+CACHE_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class ParseCache:
+    """SQLite-backed store of parsed PRD models.
+
+    Cache errors never break a report: on any SQLite failure the cache
+    disables itself and load_prd() falls back to parsing.
+    """
+
+    def __init__(self, db_path):
+        import sqlite3
+
+        self._errors = (sqlite3.Error,)
+        self.db_path = Path(db_path).expanduser()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), timeout=10)
+        self.conn.executescript(SCHEMA)
+        self._check_version()
+        self.hits = 0
+        self.misses = 0
+
+    def _check_version(self):
+        """Recreate the entries table if it was created by another version."""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row and row[0] == str(CACHE_VERSION):
+            return
+        with self.conn:
+            self.conn.execute("DROP TABLE entries")
+            self.conn.execute("DELETE FROM meta")
+        self.conn.executescript(SCHEMA)
+        with self.conn:
+            self.conn.execute("INSERT INTO meta VALUES ('version', ?)", (str(CACHE_VERSION),))
+
+    def get(self, path, stat):
+        """Return the cached PRD for path if its stat still matches.
+
+        The inode is part of the key: two atomic replaces (prd_write) within
+        one mtime tick can leave the same size and mtime.
+        """
+        if self.conn is None:
+            return None
+        try:
+            row = self.conn.execute(
+                "SELECT data FROM entries "
+                "WHERE path = ? AND mtime_ns = ? AND size = ? AND ino = ? AND version = ?",
+                (str(path), stat.st_mtime_ns, stat.st_size, stat.st_ino, PARSER_VERSION)
+            ).fetchone()
+        except self._errors:
+            self.close()
+            return None
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return PRD.from_dict(json.loads(row[0]))
+
+    def put(self, path, stat, prd):
+        """Store prd for path, replacing any older entry of the same file."""
+        if self.conn is None:
+            return
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                    (str(path), stat.st_mtime_ns, stat.st_size, stat.st_ino, PARSER_VERSION,
+                     json.dumps(prd.to_dict(), ensure_ascii=False))
+                )
+        except self._errors:
+            self.close()
+
+    def evict_stale(self):
+        """Delete entries whose file is gone, changed or parsed by an older
+        parser version. Returns the number of entries removed."""
+        if self.conn is None:
+            return 0
+
+        stale = []
+        rows = self.conn.execute("SELECT path, mtime_ns, size, ino, version FROM entries")
+        for path, mtime_ns, size, ino, version in rows:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stale.append((path,))
+                continue
+            if (stat.st_mtime_ns, stat.st_size, stat.st_ino, PARSER_VERSION) != (mtime_ns, size, ino, version):
+                stale.append((path,))
+
+        with self.conn:
+            self.conn.executemany("DELETE FROM entries WHERE path = ?", stale)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('last_evict', ?)",
+                (str(time.time()),)
+            )
+        return len(stale)
+
+    def evict_if_due(self):
+        """Run evict_stale() if it has not run in the last EVICT_INTERVAL."""
+        if self.conn is None:
+            return 0
+        try:
+            row = self.conn.execute(
+                "SELECT value FROM meta WHERE key = 'last_evict'"
+            ).fetchone()
+            if row and time.time() - float(row[0]) < EVICT_INTERVAL:
+                return 0
+            return self.evict_stale()
+        except self._errors:
+            self.close()
+            return 0
+
+    def clear(self):
+        """Remove every entry."""
+        if self.conn is None:
+            return
+        with self.conn:
+            self.conn.execute("DELETE FROM entries")
+            self.conn.execute("DELETE FROM meta WHERE key != 'version'")
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def add_cache_arguments(parser):
+    """Add --no-cache and --clear-cache options to an argparse parser."""
+    parser.add_argument('--no-cache', action='store_true',
+                        help='No usar la caché de PRD parseados')
+    parser.add_argument('--clear-cache', action='store_true',
+                        help='Vaciar la caché de PRD parseados antes de ejecutar')
+
+
+def setup_parse_cache(args, reports_dir):
+    """Open the cache in reports_dir according to args and hand it to
+    load_prd(). Returns the ParseCache, or None if caching is disabled."""
+    if not reports_dir:
+        return None
+
+    db_path = Path(reports_dir).expanduser() / CACHE_FILENAME
+    if args.no_cache and not args.clear_cache:
+        return None
+
+    try:
+        cache = ParseCache(db_path)
+    except Exception:
+        return None
+
+    if args.clear_cache:
+        cache.clear()
+        print(f"🧹 Caché de PRD vaciada: {db_path}")
+    if args.no_cache:
+        cache.close()
+        return None
+
+    cache.evict_if_due()
+    set_parse_cache(cache)
+    return cache
@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+PRD Columns
+Almacén columnar compacto con una fila por entrada de tiempo (tarea con
+hora) de todos los PRD, para sumar horas de años enteros (planificación de
+capacidad) sin listas de diccionarios.
+
+Columnas de tipo fijo, ordenadas por día:
+- day       int32   ordinal del día (date.toordinal())
+- title     uint32  id del título; cada título se guarda una sola vez
+- start     int16   minuto de inicio (0-1439)
+- duration  int16   minutos, con la misma regla que el reporte de horas
+- status    uint8   0 completada, 1 pendiente
+
+El archivo prd_columns.bin es una cabecera, las columnas una tras otra y los
+títulos. Se abre con mmap y cada columna es una vista sin copia: un array de
+NumPy si está instalado, o un memoryview. Un rango de fechas es un tramo
+contiguo de filas (búsqueda binaria). Con NumPy las sumas, agrupaciones
+(reduceat, bincount) y percentiles son vectorizados; sin NumPy se usan
+sum(), sorted() y compress() sobre las vistas, que recorren las columnas en C.
+
+`build` solo rehace el archivo si cambió algún PRD (vivo o archivado).
+
+Uso:
+    python prd_columns.py build [--path ./PRD_DOCUMENTS] [--archives DIR] [--file prd_columns.bin]
+    python prd_columns.py stats [--by year|month|week|day|title] [--from YYYYMMDD] [--to YYYYMMDD]
+                                [--status completada|pendiente] [--top N]
+
+Ejemplos:
+    python prd_columns.py build                          # Tras cerrar el día o archivar
+    python prd_columns.py stats --by year                # Horas por año
+    python prd_columns.py stats --by title --from 20250101 --top 20
+    python prd_columns.py stats --by month --status pendiente
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from itertools import compress
+from pathlib import Path
+
+from prd_build import code_fingerprint, manifest_for
+from prd_config import load_config
+from prd_core import STATUS_COMPLETED, STATUS_PENDING, period_key, task_durations
+from prd_storage import add_io_arguments, add_storage_arguments, open_storage
+from prd_trace import add_trace_arguments, count, setup_trace, span
+from prd_write import replace_file
+
+# Load configuration
+DEFAULT_PRD_DIR = "~/Documents/prd_diarios/PRD_DOCUMENTS"
+DEFAULT_REPORTS_DIR = "~/Documents/prd_diarios/REPORTS"
+
+config = load_config()
+if config:
+    try:
+        folders = config.get("folders", {})
+        DEFAULT_PRD_DIR = os.path.expanduser(folders.get("prd_documents", DEFAULT_PRD_DIR))
+        DEFAULT_REPORTS_DIR = os.path.expanduser(folders.get("reports", DEFAULT_REPORTS_DIR))
+    except Exception:
+        pass
+
+COLUMNS_FILENAME = "prd_columns.bin"
+DEFAULT_COLUMNS_PATH = os.path.join(DEFAULT_REPORTS_DIR, COLUMNS_FILENAME)
+
+MAGIC = b'PRDCOLS\0'
+FORMAT_VERSION = 1
+# magic, version, rows, titles, bytes of the titles block; padded to 32
+HEADER = struct.Struct('<8sIIII8x')
+
+# name, array typecode, NumPy dtype. Widest first, so every column is
+# aligned to its item size. Stored little-endian.
+COLUMNS = (
+    ('day', 'i', '<i4'),
+    ('title', 'I', '<u4'),
+    ('start', 'h', '<i2'),
+    ('duration', 'h', '<i2'),
+    ('status', 'B', 'u1'),
+)
+
+STATUS_CODES = {STATUS_COMPLETED: 0, STATUS_PENDING: 1}
+
+PERIODS = ('day', 'week', 'month', 'year', 'title')
+
+_numpy = None
+
+
+def load_numpy():
+    """NumPy if installed, else None. Imported on first use: it is costly."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+class ColumnsBuilder:
+    """Rows accumulated in typed arrays, day by day, in date order."""
+
+    def __init__(self):
+        self.columns = {name: array(typecode) for name, typecode, _ in COLUMNS}
+        self.titles = {}
+
+    def add_day(self, day, prd):
+        """Add the timed tasks of a parsed PRD for day (a date)."""
+        timed = [task for task in prd.tasks if task.time]
+        durations = task_durations([task.minutes for task in timed])
+        ordinal = day.toordinal()
+        columns = self.columns
+        for task, duration in zip(timed, durations):
+            columns['day'].append(ordinal)
+            columns['title'].append(self.titles.setdefault(task.name, len(self.titles)))
+            columns['start'].append(task.minutes)
+            columns['duration'].append(duration)
+            columns['status'].append(STATUS_CODES.get(task.status, 0))
+
+    def tobytes(self):
+        """Contents of the columns file."""
+        rows = len(self.columns['day'])
+        titles = '\n'.join(self.titles).encode('utf-8')
+        parts = [HEADER.pack(MAGIC, FORMAT_VERSION, rows, len(self.titles), len(titles))]
+        for name, _, _ in COLUMNS:
+            column = self.columns[name]
+            if sys.byteorder == 'big':
+                column = array(column.typecode, column)
+                column.byteswap()
+            parts.append(column.tobytes())
+        parts.append(titles)
+        return b''.join(parts)
+
+    def save(self, path):
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = self.tobytes()
+        with span('write', file=path.name):
+            replace_file(path, data)
+        count('files_written')
+        count('bytes_written', len(data))
+
+
+class TimeEntries:
+    """Memory-mapped columns of a prd_columns.bin file.
+
+    Each column (day, title, start, duration, status) is a NumPy array or
+    a memoryview over the mapping. use_numpy=False forces the memoryview
+    path even when NumPy is installed.
+    """
+
+    def __init__(self, path, use_numpy=None):
+        self.path = Path(path).expanduser()
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, rows, title_count, title_bytes = HEADER.unpack_from(self._mmap)
+        except struct.error:
+            magic = version = None
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"{self.path} no es un almacén de columnas válido; ejecuta 'build'")
+
+        self.rows = rows
+        self.numpy = load_numpy() if use_numpy is not False else None
+        offset = HEADER.size
+        for name, typecode, dtype in COLUMNS:
+            size = array(typecode).itemsize
+            if self.numpy:
+                column = self.numpy.frombuffer(self._mmap, dtype=dtype, count=rows, offset=offset)
+            elif sys.byteorder == 'little':
+                column = memoryview(self._mmap)[offset:offset + rows * size].cast(typecode)
+            else:
+                column = array(typecode, self._mmap[offset:offset + rows * size])
+                column.byteswap()
+            setattr(self, name, column)
+            offset += rows * size
+        data = self._mmap[offset:offset + title_bytes]
+        self.titles = data.decode('utf-8').split('\n') if title_count else []
+
+    def close(self):
+        for name, _, _ in COLUMNS:
+            column = getattr(self, name)
+            if isinstance(column, memoryview):
+                column.release()
+            setattr(self, name, None)
+        try:
+            self._mmap.close()
+        except BufferError:
+            # A NumPy view still alive elsewhere; the mapping goes with it
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def rows_between(self, date_from=None, date_to=None):
+        """(first, stop) rows of the days in [date_from, date_to] (YYYYMMDD)."""
+        first, stop = 0, self.rows
+        if date_from:
+            first = bisect_left(self.day, datetime.strptime(date_from, "%Y%m%d").toordinal())
+        if date_to:
+            stop = bisect_right(self.day, datetime.strptime(date_to, "%Y%m%d").toordinal())
+        return first, max(first, stop)
+
+    def _durations(self, first, stop, status=None):
+        """Durations of rows [first, stop), only those with status if given."""
+        durations = self.duration[first:stop]
+        if status is None:
+            return durations
+        code = STATUS_CODES[status]
+        if self.numpy:
+            return durations[self.status[first:stop] == code]
+        return list(compress(durations, map(code.__eq__, self.status[first:stop])))
+
+    def total(self, date_from=None, date_to=None, status=None):
+        """(minutes, entries) over a date range."""
+        durations = self._durations(*self.rows_between(date_from, date_to), status)
+        if self.numpy:
+            return int(durations.sum(dtype='int64')), len(durations)
+        return sum(durations), len(durations)
+
+    def _day_runs(self, first, stop):
+        """(day ordinal, first row, stop row) of each day in [first, stop)."""
+        if self.numpy:
+            if first == stop:
+                return []
+            np = self.numpy
+            days = self.day[first:stop]
+            # Rows are sorted by day: a run starts wherever the day changes
+            starts = np.flatnonzero(days[1:] != days[:-1]) + 1
+            ordinals = days[np.concatenate(([0], starts))].tolist()
+            starts = [first] + (starts + first).tolist()
+            return zip(ordinals, starts, starts[1:] + [stop])
+        runs = []
+        row = first
+        while row < stop:
+            ordinal = self.day[row]
+            end = bisect_right(self.day, ordinal, row, stop)
+            runs.append((ordinal, row, end))
+            row = end
+        return runs
+
+    def group(self, by='month', date_from=None, date_to=None, status=None):
+        """{period: [minutes, entries]} for by in day/week/month/year/title."""
+        first, stop = self.rows_between(date_from, date_to)
+        if by == 'title':
+            return self._group_titles(first, stop, status)
+
+        groups = {}
+        runs = list(self._day_runs(first, stop))
+        if self.numpy and runs:
+            np = self.numpy
+            weights = self.duration[first:stop].astype('int64')
+            entries = np.ones(stop - first, dtype='int64')
+            if status is not None:
+                mask = self.status[first:stop] == STATUS_CODES[status]
+                weights = weights * mask
+                entries = mask.astype('int64')
+            offsets = [start - first for _, start, _ in runs]
+            day_minutes = np.add.reduceat(weights, offsets).tolist()
+            day_entries = np.add.reduceat(entries, offsets).tolist()
+        else:
+            day_minutes, day_entries = [], []
+            for _, start, end in runs:
+                durations = self._durations(start, end, status)
+                day_minutes.append(sum(durations))
+                day_entries.append(len(durations))
+
+        for (ordinal, _, _), minutes, entries in zip(runs, day_minutes, day_entries):
+            if not entries:
+                continue
+            group = groups.setdefault(period_key(ordinal, by), [0, 0])
+            group[0] += minutes
+            group[1] += entries
+        return groups
+
+    def _group_titles(self, first, stop, status):
+        titles = self.title[first:stop]
+        durations = self.duration[first:stop]
+        if self.numpy:
+            np = self.numpy
+            weights = durations.astype('int64')
+            if status is not None:
+                mask = self.status[first:stop] == STATUS_CODES[status]
+                titles, weights = titles[mask], weights[mask]
+            minutes = np.bincount(titles, weights=weights, minlength=len(self.titles))
+            entries = np.bincount(titles, minlength=len(self.titles))
+            used = np.flatnonzero(entries)
+            return {self.titles[i]: [int(minutes[i]), int(entries[i])] for i in used.tolist()}
+
+        minutes = [0] * len(self.titles)
+        entries = [0] * len(self.titles)
+        if status is None:
+            rows = zip(titles, durations)
+        else:
+            code = STATUS_CODES[status]
+            rows = compress(zip(titles, durations), map(code.__eq__, self.status[first:stop]))
+        for title_id, duration in rows:
+            minutes[title_id] += duration
+            entries[title_id] += 1
+        return {self.titles[i]: [minutes[i], entries[i]] for i in range(len(self.titles)) if entries[i]}
+
+    def percentiles(self, percents, date_from=None, date_to=None, status=None):
+        """Task duration at each percent (0-100), linearly interpolated
+        like numpy.percentile. Empty list if there are no entries."""
+        durations = self._durations(*self.rows_between(date_from, date_to), status)
+        if not len(durations):
+            return []
+        if self.numpy:
+            return [float(value) for value in self.numpy.percentile(durations, percents)]
+
+        ordered = sorted(durations)
+        values = []
+        for percent in percents:
+            position = (len(ordered) - 1) * percent / 100
+            below = int(position)
+            above = min(below + 1, len(ordered) - 1)
+            values.append(ordered[below] + (ordered[above] - ordered[below]) * (position - below))
+        return values
+
+
+def build_columns(prd_dir=None, path=None, archive_dir=None, io_workers=None, force=False):
+    """Rebuild the columns file from every live and archived PRD.
+
+    Skipped when no PRD changed since the last build. Returns
+    (path, rows or None if skipped, error).
+    """
+    # Imported here: asyncio is costly to import and only build needs it
+    from prd_aio import hash_entries, iter_prds
+
+    prd_dir = Path(prd_dir or DEFAULT_PRD_DIR).expanduser()
+    path = Path(path or DEFAULT_COLUMNS_PATH).expanduser()
+    storage = open_storage(prd_dir, archive_dir)
+    # The storage index is per process; a day may have been deleted or
+    # archived since
+    storage.refresh()
+    try:
+        entries = storage.entries()
+    except OSError as e:
+        return path, None, f"No se pudo leer la carpeta de PRD: {e}"
+
+    manifest = manifest_for(path)
+    inputs = {entry.key: digest for entry, digest in zip(entries, hash_entries(entries, io_workers))}
+    inputs['code'] = code_fingerprint(__file__)
+    if not force and manifest.is_fresh(path, inputs):
+        return path, None, None
+
+    builder = ColumnsBuilder()
+    with span('columns.build', days=len(entries)):
+        for entry, prd in iter_prds(entries, io_workers):
+            builder.add_day(datetime.strptime(entry.day, "%Y%m%d").date(), prd)
+        builder.save(path)
+    manifest.record(path, inputs)
+    manifest.save()
+    return path, len(builder.columns['day']), None
+
+
+def parse_day(value):
+    """argparse type for YYYYMMDD dates."""
+    try:
+        datetime.strptime(value, "%Y%m%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Formato de fecha inválido: {value}. Use YYYYMMDD")
+    return value
+
+
+def format_minutes(minutes):
+    return f"{minutes // 60}h {minutes % 60:02d}m"
+
+
+def print_stats(entries, args):
+    started = time.perf_counter()
+    minutes, total = entries.total(args.date_from, args.date_to, args.status)
+    groups = entries.group(args.by, args.date_from, args.date_to, args.status)
+    percentiles = entries.percentiles([50, 90, 99], args.date_from, args.date_to, args.status)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    if args.by == 'title':
+        keys = sorted(groups, key=lambda key: (-groups[key][0], key))[:args.top]
+    else:
+        keys = sorted(groups)
+    label = 'Tarea' if args.by == 'title' else 'Periodo'
+    width = max([len(key) for key in keys] + [len(label)])
+    print(f"{label:<{width}}  {'Entradas':>9}  {'Horas':>11}")
+    for key in keys:
+        group_minutes, group_entries = groups[key]
+        print(f"{key:<{width}}  {group_entries:>9}  {format_minutes(group_minutes):>11}")
+
+    print(f"\n📊 {total} entradas, {format_minutes(minutes)} ({minutes / 60:.2f}h)")
+    if percentiles:
+        p50, p90, p99 = percentiles
+        print(f"   Duración por tarea: p50 {p50:.0f}m · p90 {p90:.0f}m · p99 {p99:.0f}m")
+    engine = "NumPy" if entries.numpy else "memoryview"
+    print(f"⏱️  Consulta en {elapsed:.1f} ms sobre {entries.rows} filas ({engine})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Almacén columnar de entradas de tiempo para agregar horas de varios años",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python prd_columns.py build
+  python prd_columns.py stats --by year
+  python prd_columns.py stats --by title --from 20250101 --top 20
+  python prd_columns.py stats --by month --status pendiente
+        """
+    )
+    parser.add_argument('--file', default=DEFAULT_COLUMNS_PATH,
+                        help=f'Archivo de columnas (default: {DEFAULT_COLUMNS_PATH})')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='Rehacer el archivo desde los PRD')
+    build_parser.add_argument('--path', default=None, help=f'Carpeta PRD_DOCUMENTS (default: {DEFAULT_PRD_DIR})')
+    add_storage_arguments(build_parser)
+    add_io_arguments(build_parser)
+    build_parser.add_argument('--force', action='store_true', help='Rehacer aunque ningún PRD haya cambiado')
+
+    stats_parser = subparsers.add_parser('stats', help='Horas por periodo o por tarea')
+    stats_parser.add_argument('--by', choices=PERIODS, default='month', help='Agrupar por (default: month)')
+    stats_parser.add_argument('--from', dest='date_from', type=parse_day, help='Primera fecha (YYYYMMDD)')
+    stats_parser.add_argument('--to', dest='date_to', type=parse_day, help='Última fecha (YYYYMMDD)')
+    stats_parser.add_argument('--status', choices=list(STATUS_CODES), help='Solo tareas con este estado')
+    stats_parser.add_argument('--top', type=int, default=20, help='Tareas a mostrar con --by title (default: 20)')
+    stats_parser.add_argument('--no-numpy', action='store_true', help='No usar NumPy aunque esté instalado')
+
+    add_trace_arguments(parser)
+
+    args = parser.parse_args(argv)
+    setup_trace(args)
+
+    if args.command == 'build':
+        started = time.perf_counter()
+        path, rows, error = build_columns(args.path, args.file, args.archives, args.io_workers, args.force)
+        if error:
+            print(f"❌ Error: {error}")
+            return 1
+        if rows is None:
+            print(f"✅ Columnas al día (ningún PRD cambió): {path}")
+        else:
+            size = path.stat().st_size
+            print(f"✅ {rows} entradas en {time.perf_counter() - started:.2f}s: {path} ({size / 1024:.0f} KB)")
+        return 0
+
+    try:
+        entries = TimeEntries(args.file, use_numpy=False if args.no_numpy else None)
+    except FileNotFoundError:
+        print(f"❌ Error: No existe {args.file}; ejecuta 'prd_columns.py build'")
+        return 1
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return 1
+    with entries:
+        print_stats(entries, args)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
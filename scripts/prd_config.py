@@ -0,0 +1,41 @@
+"""
+PRD Config
+Lectura única de config.json compartida por todos los scripts.
+
+Cada módulo deriva sus rutas por defecto de load_config(); el archivo se lee
+y se parsea una sola vez por proceso, aunque se importen varios scripts
+(por ejemplo desde el CLI prddiario.py).
+
+Uso:
+    from prd_config import load_config
+
+    folders = load_config().get("folders", {})
+"""
+
+import json
+from pathlib import Path
+
+from prd_trace import span
+
+CONFIG_FILE = Path(__file__).parent.parent / "config.json"
+
+_config = None
+
+
+def load_config():
+    """Return config.json as a dict, read once per process.
+
+    A missing or invalid file gives an empty dict, so every script falls
+    back to its built-in defaults. The dict is shared: do not modify it.
+    """
+    global _config
+    if _config is None:
+        with span('config'):
+            try:
+                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+            except (OSError, ValueError):
+                config = {}
+        _config = config if isinstance(config, dict) else {}
+    return _config
+
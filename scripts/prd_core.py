@@ -0,0 +1,542 @@
+"""
+PRD Core
+Gramática y modelo compartidos por todos los scripts para leer PRD diarios.
+
+Todos los generadores (horas, resumen, dashboard) usan este módulo, de modo
+que un PRD se interpreta igual en todos ellos y se parsea una sola vez por
+proceso.
+
+Uso:
+    from prd_core import load_prd
+
+    prd = load_prd("PRD_20260216.md")
+    print(len(prd.completed_tasks), len(prd.pending_tasks))
+"""
+
+import hashlib
+import json
+import os
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+
+from prd_trace import count, span
+from prd_write import write_atomic
+
+# Bump whenever the grammar or the model changes, so persisted models
+# (parse cache) produced by an older parser are not reused.
+PARSER_VERSION = 2
+
+STATUS_COMPLETED = 'completada'
+STATUS_PENDING = 'pendiente'
+
+# Line-level grammar for the PRD markdown. Every pattern is applied to a
+# single line, so parsing cost grows linearly with the document size.
+TASK_HEADER_RE = re.compile(r'###\s+(\S+)\s+(\d+)\.\s+(.*)')
+TIME_RE = re.compile(r'(?:[01]\d|2[0-3]):[0-5]\d')
+TASK_TIME_RE = re.compile(rf'\*\*({TIME_RE.pattern})\*\*')
+SUMMARY_ITEM_RE = re.compile(r'\*\*([^*]+)\*\*:\s*(.+)')
+FIELD_LABEL_RE = re.compile(r'\*\*(Descripción|Solución|Estado)\*\*:?\s*(.*)')
+DATE_HEADER = '# PRD - '
+PRD_FILENAME_RE = re.compile(r'PRD_(\d{8})\.md')
+
+# PRD_YYYYMMDD.json next to each PRD: its model, for readers that would
+# otherwise parse the markdown (see read_prd_file)
+SIDECAR_SUFFIX = '.json'
+SIDECAR_VERSION = 1
+
+# Duration assumed for the last task of a day (no next task to end it)
+LAST_TASK_MINUTES = 60
+
+FIELD_KEYS = {
+    'Descripción': 'description',
+    'Solución': 'solution',
+    'Estado': 'state',
+}
+
+
+class _Record:
+    """Plain attribute record compared and printed by value.
+
+    Hand-written instead of @dataclass: importing dataclasses (and the
+    inspect module it pulls in) costs more than the rest of the parser.
+    """
+
+    def __eq__(self, other):
+        return type(other) is type(self) and vars(other) == vars(self)
+
+    def __repr__(self):
+        fields = ', '.join(f"{key}={value!r}" for key, value in vars(self).items())
+        return f"{type(self).__name__}({fields})"
+
+
+class Diagnostic(_Record):
+    """Problem found while parsing a PRD (1-based line number)."""
+
+    def __init__(self, line, message):
+        self.line = line
+        self.message = message
+
+
+class Task(_Record):
+    """A '### ✅ N. Título — **HH:MM**' block."""
+
+    def __init__(self, number, name, time, status, emoji, description='', solution='', state='', line=0):
+        self.number = number
+        self.name = name
+        self.time = time
+        self.status = status
+        self.emoji = emoji
+        self.description = description
+        self.solution = solution
+        self.state = state
+        self.line = line
+
+    @property
+    def is_pending(self):
+        return self.status == STATUS_PENDING
+
+    @property
+    def minutes(self):
+        """Start time as minutes since midnight."""
+        hour, minute = self.time.split(':')
+        return int(hour) * 60 + int(minute)
+
+    def replace(self, **changes):
+        """Copy of the task with the given fields changed."""
+        return Task(**{**vars(self), **changes})
+
+
+class PRD(_Record):
+    """Parsed daily PRD. Tasks keep the order in which they appear."""
+
+    def __init__(self, date='', summary=None, tasks=None, notes='', diagnostics=None):
+        self.date = date
+        self.summary = {} if summary is None else summary
+        self.tasks = [] if tasks is None else tasks
+        self.notes = notes
+        self.diagnostics = [] if diagnostics is None else diagnostics
+
+    @property
+    def completed_tasks(self):
+        return [t for t in self.tasks if t.status == STATUS_COMPLETED]
+
+    @property
+    def pending_tasks(self):
+        return [t for t in self.tasks if t.status == STATUS_PENDING]
+
+    def to_dict(self):
+        """Plain JSON-serializable representation of the model."""
+        return {
+            'date': self.date,
+            'summary': dict(self.summary),
+            'tasks': [dict(vars(task)) for task in self.tasks],
+            'notes': self.notes,
+            'diagnostics': [dict(vars(diagnostic)) for diagnostic in self.diagnostics],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a model produced by to_dict()."""
+        return cls(
+            date=data['date'],
+            summary=data['summary'],
+            tasks=[Task(**t) for t in data['tasks']],
+            notes=data['notes'],
+            diagnostics=[Diagnostic(**d) for d in data['diagnostics']]
+        )
+
+
+def split_task_header(line):
+    """Split a '### ✅ N. Título — **HH:MM**' line into its parts.
+
+    Returns (emoji, number, name, time_str) or None if the line is not a
+    task header. time_str is None when the trailing **HH:MM** is missing.
+    """
+    match = TASK_HEADER_RE.match(line)
+    if not match:
+        return None
+
+    emoji, number, rest = match.groups()
+    rest = rest.rstrip()
+    time_str = None
+    if len(rest) >= 9:
+        time_match = TASK_TIME_RE.fullmatch(rest, len(rest) - 9)
+        if time_match:
+            time_str = time_match.group(1)
+            rest = rest[:-9].rstrip()
+
+    # Separator between title and time: em dash, double hyphen or nothing
+    if rest.endswith('—'):
+        rest = rest[:-1]
+    elif rest.endswith('--'):
+        rest = rest[:-2]
+
+    return emoji, number, rest.strip(), time_str
+
+
+def _close_task(block, prd):
+    """Turn a finished task block into a Task, reporting missing sections."""
+    fields = {key: '\n'.join(lines).strip() for key, lines in block['fields'].items()}
+
+    if 'description' not in fields:
+        prd.diagnostics.append(Diagnostic(
+            block['line'], f"Tarea {block['number']} sin sección **Descripción**"
+        ))
+
+    if 'state' in fields:
+        status = STATUS_PENDING
+    elif 'solution' in fields:
+        status = STATUS_COMPLETED
+    else:
+        status = STATUS_PENDING if '⏳' in block['emoji'] else STATUS_COMPLETED
+        missing = '**Estado**' if status == STATUS_PENDING else '**Solución**'
+        prd.diagnostics.append(Diagnostic(
+            block['line'], f"Tarea {block['number']} sin sección {missing}"
+        ))
+
+    prd.tasks.append(Task(
+        number=block['number'],
+        name=block['name'],
+        time=block['time'],
+        status=status,
+        emoji=block['emoji'],
+        description=fields.get('description', ''),
+        solution=fields.get('solution', ''),
+        state=fields.get('state', ''),
+        line=block['line']
+    ))
+
+
+def parse_prd(content):
+    """Parse PRD markdown content into a PRD model.
+
+    Single pass over the lines of the document. Task blocks that cannot be
+    fully parsed are reported in prd.diagnostics instead of being dropped.
+    """
+    prd = PRD()
+
+    section = ''
+    notes = []
+    block = None     # task block being read
+    lines = None     # list collecting the lines of the current field
+    held = []        # '---' and blank lines that may close the current block
+    in_fence = False
+
+    for line_no, line in enumerate(content.splitlines(), 1):
+        stripped = line.strip()
+
+        if stripped.startswith('```'):
+            in_fence = not in_fence
+        elif not in_fence and stripped.startswith('#'):
+            # Any heading closes the current task block
+            held = []
+            if block is not None:
+                _close_task(block, prd)
+                block = lines = None
+
+            if stripped.startswith('### '):
+                header = split_task_header(stripped)
+                if header is None:
+                    if section.startswith('Tareas'):
+                        prd.diagnostics.append(Diagnostic(
+                            line_no, f"Encabezado no reconocido: {stripped}"
+                        ))
+                elif header[3] is None:
+                    prd.diagnostics.append(Diagnostic(
+                        line_no, f"Tarea {header[1]} sin hora **HH:MM**"
+                    ))
+                else:
+                    emoji, number, name, time_str = header
+                    block = {
+                        'line': line_no,
+                        'emoji': emoji,
+                        'number': number,
+                        'name': name,
+                        'time': time_str,
+                        'fields': {}
+                    }
+            elif stripped.startswith('## '):
+                section = stripped[3:].strip()
+            elif stripped.startswith(DATE_HEADER) and not prd.date:
+                prd.date = stripped[len(DATE_HEADER):].strip()
+            continue
+
+        if block is not None:
+            label = None if in_fence else FIELD_LABEL_RE.fullmatch(stripped)
+            if label:
+                held = []
+                lines = block['fields'].setdefault(FIELD_KEYS[label.group(1)], [])
+                if label.group(2):
+                    lines.append(label.group(2))
+            elif lines is None:
+                if stripped:
+                    prd.diagnostics.append(Diagnostic(
+                        line_no, f"Texto fuera de sección en tarea {block['number']}"
+                    ))
+            elif not in_fence and (stripped == '---' or (held and not stripped)):
+                held.append(line)
+            else:
+                lines.extend(held)
+                held = []
+                lines.append(line)
+        elif section == 'Resumen Ejecutivo':
+            match = SUMMARY_ITEM_RE.search(line)
+            if match:
+                key, value = match.groups()
+                prd.summary[key.strip()] = value.strip()
+        elif section.startswith('Notas'):
+            notes.append(line)
+
+    if block is not None:
+        _close_task(block, prd)
+
+    prd.notes = '\n'.join(notes).strip()
+    count('tasks_parsed', len(prd.tasks))
+    return prd
+
+
+def task_durations(start_minutes):
+    """Duration of each task given their start times (minutes since midnight).
+
+    A task lasts until the next one starts in time order, wherever it sits
+    in the document (completed and pending tasks live in separate sections
+    and edits append blocks); the latest task of the day counts
+    LAST_TASK_MINUTES. Durations are returned in the order of start_minutes.
+    """
+    order = sorted(range(len(start_minutes)), key=start_minutes.__getitem__)
+    durations = [0] * len(start_minutes)
+    for current, following in zip(order, order[1:]):
+        durations[current] = start_minutes[following] - start_minutes[current]
+    if order:
+        durations[order[-1]] = LAST_TASK_MINUTES
+    return durations
+
+
+@lru_cache(maxsize=4096)
+def period_key(ordinal, period):
+    """Label of the day, ISO week, month or year holding a day ordinal, as
+    used in the period tables of the hours report."""
+    day = date.fromordinal(ordinal)
+    if period == 'day':
+        return day.isoformat()
+    if period == 'week':
+        iso_year, iso_week, _ = day.isocalendar()
+        return f"{iso_year}-W{iso_week:02d}"
+    if period == 'month':
+        return day.strftime("%Y-%m")
+    return str(day.year)
+
+
+def prd_file_date(name):
+    """Return the YYYYMMDD part of a 'PRD_YYYYMMDD.md' file name, or None."""
+    match = PRD_FILENAME_RE.fullmatch(name)
+    return match.group(1) if match else None
+
+
+def list_prd_files(directory, date_from=None, date_to=None):
+    """List PRD_YYYYMMDD.md files in directory, sorted by date.
+
+    date_from and date_to are inclusive YYYYMMDD strings (or None). Uses a
+    single os.scandir pass; files are filtered by name, without stat calls.
+    """
+    found = []
+    with span('scan', folder=str(directory)), os.scandir(Path(directory).expanduser()) as entries:
+        for entry in entries:
+            day = prd_file_date(entry.name)
+            if day is None:
+                continue
+            if date_from and day < date_from:
+                continue
+            if date_to and day > date_to:
+                continue
+            found.append((day, Path(entry.path)))
+    count('dirs_scanned')
+
+    found.sort()
+    return [path for _, path in found]
+
+
+def resolve_range(date_from=None, date_to=None, month=None, week=None):
+    """Turn --from/--to, --month or --week into (first_day, last_day, label).
+
+    first_day and last_day are inclusive YYYYMMDD strings; label names the
+    output file (HORAS_<label>.md).
+    """
+    if month:
+        try:
+            first = datetime.strptime(month.replace('-', ''), "%Y%m").date()
+        except ValueError:
+            raise ValueError(f"Mes inválido: {month}. Use YYYYMM")
+        next_month = (first.replace(day=28) + timedelta(days=4)).replace(day=1)
+        last = next_month - timedelta(days=1)
+        label = first.strftime("%Y-%m")
+    elif week:
+        match = re.fullmatch(r'(\d{4})-?W(\d{1,2})', week.upper())
+        try:
+            first = date.fromisocalendar(int(match.group(1)), int(match.group(2)), 1)
+        except (AttributeError, ValueError):
+            raise ValueError(f"Semana inválida: {week}. Use YYYY-Www")
+        last = first + timedelta(days=6)
+        label = f"{match.group(1)}-W{int(match.group(2)):02d}"
+    else:
+        try:
+            first = datetime.strptime(date_from, "%Y%m%d").date() if date_from else None
+            last = datetime.strptime(date_to, "%Y%m%d").date() if date_to else date.today()
+        except ValueError:
+            raise ValueError("Formato de fecha inválido. Use YYYYMMDD")
+        if first is None:
+            first = last
+        if first > last:
+            raise ValueError("--from no puede ser posterior a --to")
+        label = f"{first:%Y%m%d}-{last:%Y%m%d}"
+
+    return first.strftime("%Y%m%d"), last.strftime("%Y%m%d"), label
+
+
+# Parsed PRDs of this process, keyed by resolved path
+_LOADED = {}
+
+# Optional persistent cache shared between runs (see prd_cache.py)
+_parse_cache = None
+
+
+def set_parse_cache(cache):
+    """Use cache in load_prd(): any object with get(path, stat) and
+    put(path, stat, prd), such as prd_cache.ParseCache or
+    prd_store.TaskStore. None disables it."""
+    global _parse_cache
+    _parse_cache = cache
+
+
+def clear_loaded():
+    """Forget the models kept in memory by load_prd() (benchmarks, tests)."""
+    _LOADED.clear()
+
+
+def _stat_key(stat):
+    # The inode too: two atomic replaces (prd_write) within one mtime tick
+    # can leave the same size and mtime, but each one gets a new inode
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def cached_prd(path, stat):
+    """Model of path already parsed in this process or in the parse cache
+    for this stat, or None. path must be resolved."""
+    key = _stat_key(stat)
+    cached = _LOADED.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    prd = None
+    if _parse_cache:
+        with span('cache.get', file=path.name):
+            prd = _parse_cache.get(path, stat)
+        count('cache_hits' if prd is not None else 'cache_misses')
+    return prd
+
+
+def remember_prd(path, stat, prd, remember=True, cache=True):
+    """Keep a freshly parsed model in this process and the parse cache."""
+    if cache and _parse_cache:
+        with span('cache.put', file=path.name):
+            _parse_cache.put(path, stat, prd)
+    if remember:
+        _LOADED[path] = (_stat_key(stat), prd)
+
+
+def sidecar_path(path):
+    """PRD_YYYYMMDD.json next to PRD_YYYYMMDD.md."""
+    return Path(path).with_suffix(SIDECAR_SUFFIX)
+
+
+def sidecar_json(prd, source_sha256):
+    """JSON text of the sidecar of a PRD whose bytes hash to source_sha256."""
+    # Same layout as PRD.to_dict(), without its deep copy; no indent, so
+    # json uses its C encoder
+    data = {
+        'version': SIDECAR_VERSION,
+        'parser_version': PARSER_VERSION,
+        'source_sha256': source_sha256,
+        'date': prd.date,
+        'summary': prd.summary,
+        'tasks': [vars(task) for task in prd.tasks],
+        'notes': prd.notes,
+        'diagnostics': [vars(diagnostic) for diagnostic in prd.diagnostics],
+    }
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def write_sidecar(path, content, prd):
+    """Write the sidecar of PRD path, just written with content (str) and
+    modelled by prd. Callers hold the PRD write lock (see prd_write)."""
+    source_sha256 = hashlib.sha256(content.encode('utf-8')).hexdigest()
+    with span('sidecar.write', file=Path(path).name):
+        write_atomic(sidecar_path(path), sidecar_json(prd, source_sha256))
+
+
+def read_sidecar(path, source_sha256):
+    """Model stored in the sidecar of PRD path if it was written for the
+    bytes hashing to source_sha256 by this parser version, else None."""
+    try:
+        with open(sidecar_path(path), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if (data.get('source_sha256') != source_sha256
+                or data.get('parser_version') != PARSER_VERSION
+                or data.get('version') != SIDECAR_VERSION):
+            count('sidecar_stale')
+            return None
+        prd = PRD.from_dict(data)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        count('sidecar_stale')
+        return None
+    count('sidecar_hits')
+    return prd
+
+
+def read_prd_file(path):
+    """Read one PRD file and return (model, sha256 of its bytes).
+
+    The model comes from the JSON sidecar when it matches the file, and
+    from parsing the markdown otherwise. Uses no cache, so it is safe to
+    call from reader threads.
+    """
+    path = Path(path)
+    with span('read', file=path.name):
+        with open(path, 'rb') as f:
+            data = f.read()
+    count('files_read')
+    count('bytes_read', len(data))
+    source_sha256 = hashlib.sha256(data).hexdigest()
+    with span('sidecar', file=path.name):
+        prd = read_sidecar(path, source_sha256)
+    if prd is None:
+        with span('parse', file=path.name):
+            prd = parse_prd(data.decode('utf-8'))
+    return prd, source_sha256
+
+
+def load_prd(path, remember=True):
+    """Read and parse a PRD file, at most once per process.
+
+    The parsed model is reused while the file keeps the same mtime, size
+    and inode, within the process and, if a parse cache is set, across runs. Otherwise
+    it comes from the JSON sidecar if it matches the file. Streaming
+    callers pass remember=False so models are not kept in memory.
+    """
+    path = Path(path).expanduser().resolve()
+    stat = os.stat(path)
+    count('files_stat')
+
+    prd = cached_prd(path, stat)
+    if prd is not None:
+        if remember:
+            remember_prd(path, stat, prd, cache=False)
+        return prd
+
+    prd, _ = read_prd_file(path)
+    remember_prd(path, stat, prd, remember)
+    return prd
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+PRD Edit
+Añade y completa tareas en un PRD_YYYYMMDD.md sin reescribir el documento.
+
+- add inserta el bloque de la tarea al final de su sección (Tareas
+  Realizadas o Tareas Pendientes); si la sección solo tenía el texto de la
+  plantilla ("*No hay tareas registradas aún*"), lo sustituye
+- complete pasa una tarea pendiente a Tareas Realizadas con su solución; las
+  demás pendientes conservan su número
+- El Resumen Ejecutivo (tareas completadas, pendientes y total de horas) se
+  recalcula desde el modelo, con la misma regla que el reporte de horas
+- Una sola escritura atómica (archivo temporal + rename), con el bloqueo del
+  PRD tomado durante toda la edición (ver prd_write.py): varias sesiones
+  pueden añadir tareas al mismo día a la vez sin perder ninguna
+- El documento no se vuelve a parsear: el modelo (en memoria, en la caché de
+  parseo o en el sidecar PRD_YYYYMMDD.json) se actualiza con el bloque nuevo
+  y se guarda para la próxima lectura, también en el sidecar
+
+Uso:
+    python prd_edit.py add "Título" [--time HH:MM] [--description TEXTO] [--solution TEXTO]
+                                    [--date YYYYMMDD] [--path ./PRD_DOCUMENTS]
+    python prd_edit.py add "Título" --pending [--state TEXTO]
+    python prd_edit.py complete N [--solution TEXTO] [--time HH:MM]
+
+Ejemplos:
+    python prd_edit.py add "Revisar correos" --time 09:00 --description "Bandeja" --solution "Respondidos"
+    python prd_edit.py add "Apagado Proxmox" --pending --state "En curso"
+    python prd_edit.py complete 1 --solution "Apagado y revisado"
+    python prd_edit.py add "Reunión" --time 16:00 --date 20260216
+"""
+
+import argparse
+import hashlib
+import os
+import re
+from bisect import bisect_left
+from copy import copy
+from datetime import datetime
+from pathlib import Path
+
+from prd_cache import add_cache_arguments, setup_parse_cache
+from prd_config import load_config
+from prd_core import (PRD, STATUS_COMPLETED, STATUS_PENDING, SUMMARY_ITEM_RE, TIME_RE, Task, cached_prd,
+                      parse_prd, read_sidecar, remember_prd, task_durations, write_sidecar)
+from prd_trace import add_trace_arguments, count, setup_trace, span
+from prd_write import locked, write_atomic
+
+# Load configuration
+DEFAULT_PRD_DIR = "~/Documents/prd_diarios/PRD_DOCUMENTS"
+DEFAULT_REPORTS_DIR = None
+
+config = load_config()
+if config:
+    try:
+        folders = config.get("folders", {})
+        DEFAULT_PRD_DIR = os.path.expanduser(folders.get("prd_documents", DEFAULT_PRD_DIR))
+        reports_dir = folders.get("reports") or config.get("prd_output_directory")
+        if reports_dir:
+            DEFAULT_REPORTS_DIR = os.path.expanduser(reports_dir)
+    except Exception:
+        pass
+
+SUMMARY_SECTION = 'Resumen Ejecutivo'
+TASK_SECTIONS = {
+    STATUS_COMPLETED: 'Tareas Realizadas',
+    STATUS_PENDING: 'Tareas Pendientes',
+}
+TASK_EMOJIS = {
+    STATUS_COMPLETED: '✅',
+    STATUS_PENDING: '⏳',
+}
+# Written back when the last pending task is completed (create_daily_prd.py)
+EMPTY_PENDING_TEXT = '*Ninguna por el momento*'
+
+# Template filler of an empty section: a single italic line
+PLACEHOLDER_RE = re.compile(r'\*[^*\s][^*\n]*\*')
+# Code fences and the level 1 and 2 headings that delimit sections. Matched
+# from the line break before them: a leading literal keeps the scan fast.
+HEADING_RE = re.compile(r'\n[ \t]*(?:```|(#{1,2}) ([^\n]*))')
+TASK_LINE_RE = re.compile(r'^[ \t]*### ', re.M)
+# Line breaks other than \n that str.splitlines(), and so parse_prd, honours
+OTHER_BREAKS = '\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+
+
+def prd_path_for(date_obj, prd_dir=None):
+    """Path of the PRD of a day in PRD_DOCUMENTS."""
+    return Path(prd_dir or DEFAULT_PRD_DIR).expanduser() / f"PRD_{date_obj.strftime('%Y%m%d')}.md"
+
+
+def render_task(task):
+    """Markdown lines of a task block, in the format of the PRD template."""
+    lines = [f"### {task.emoji} {task.number}. {task.name} — **{task.time}**", "", "**Descripción**  "]
+    lines += task.description.splitlines()
+    if task.status == STATUS_COMPLETED:
+        lines += ["", "**Solución**  "] + task.solution.splitlines()
+    else:
+        lines += ["", "**Estado**  "] + task.state.splitlines()
+    return lines
+
+
+class PRDDocument:
+    """Text of a PRD and its parsed model, edited together.
+
+    Edits address whole lines by character offset and only look at the
+    lines they touch; the model follows by shifting the line numbers of the
+    tasks below the edit, so the cost of an edit does not depend on how
+    many tasks the day already has.
+    """
+
+    def __init__(self, content, prd):
+        self.content = content
+        self.prd = PRD(prd.date, dict(prd.summary), list(prd.tasks), prd.notes, list(prd.diagnostics))
+        first_line = content[:content.find('\n') + 1]
+        self.newline = '\r\n' if first_line.endswith('\r\n') else '\n'
+        self._sections, self._anchors = self._find_sections()
+
+    def line_number(self, offset):
+        """1-based number of the line that starts at offset, counted from the
+        nearest section heading."""
+        index = bisect_left(self._anchors, (offset,))
+        after = self._anchors[min(index, len(self._anchors) - 1)]
+        before = self._anchors[max(index - 1, 0)]
+        if after[0] >= offset and after[0] - offset < offset - before[0]:
+            return after[1] - self.content.count('\n', offset, after[0])
+        return before[1] + self.content.count('\n', before[0], offset)
+
+    def line_start(self, offset, floor=0):
+        """Offset of the line before the one starting at offset (not before floor)."""
+        return max(self.content.rfind('\n', floor, offset - 1) + 1, floor)
+
+    def body_start(self, start):
+        """Offset of the line after the heading at start."""
+        end = self.content.find('\n', start)
+        return len(self.content) if end < 0 else end + 1
+
+    def _find_sections(self):
+        """{title: (start, stop)} of the '## ' sections: offsets of the heading
+        and of the next level 1 or 2 heading (or the end of the text). Also
+        returns the (offset, line number) of every heading, for line_number()."""
+        sections = {}
+        anchors = [(0, 1)]
+        title = None
+        start = 0
+        in_fence = False
+        for match in HEADING_RE.finditer('\n' + self.content):
+            if match.group(1) is None:
+                in_fence = not in_fence
+                continue
+            if in_fence:
+                continue
+            # The match starts at the line break, one character before the
+            # heading in '\n' + content: the same offset in content
+            offset = match.start()
+            anchors.append((offset, anchors[-1][1] + self.content.count('\n', anchors[-1][0], offset)))
+            if title is not None:
+                sections.setdefault(title, (start, match.start()))
+            title = match.group(2).strip() if len(match.group(1)) == 2 else None
+            start = match.start()
+        if title is not None:
+            sections.setdefault(title, (start, len(self.content)))
+        end = len(self.content)
+        anchors.append((end, anchors[-1][1] + self.content.count('\n', anchors[-1][0], end)))
+        return sections, anchors
+
+    def section(self, title):
+        """(start, stop) offsets of a section; ValueError if it is missing."""
+        if title not in self._sections:
+            raise ValueError(f"El PRD no tiene la sección '## {title}'")
+        return self._sections[title]
+
+    def _replace(self, start, stop, text):
+        """Replace content[start:stop] with text, moving the sections below."""
+        shift = len(text) - (stop - start)
+        lines = text.count('\n') - self.content.count('\n', start, stop)
+        self.content = self.content[:start] + text + self.content[stop:]
+        self._sections = {
+            title: (first + shift if first >= stop else first, last + shift if last >= stop else last)
+            for title, (first, last) in self._sections.items()
+        }
+        self._anchors = [
+            (offset + shift, line + lines) if offset >= stop else (offset, line)
+            for offset, line in self._anchors if not start < offset < stop
+        ]
+
+    def content_end(self, start, stop):
+        """Offset after the last line of a section that is not blank or '---'."""
+        first = self.body_start(start)
+        end = stop
+        while end > first:
+            line_start = self.line_start(end, first)
+            if self.content[line_start:end].strip() not in ('', '---'):
+                break
+            end = line_start
+        return end
+
+    def tasks_between(self, start, stop):
+        """Tasks whose header lies in the section content[start:stop]."""
+        first, last = self.line_number(start), self.line_number(stop)
+        return [task for task in self.prd.tasks if first < task.line < last]
+
+    def splice(self, start, stop, text):
+        """Replace the whole lines content[start:stop] with text. Tasks and
+        diagnostics of those lines are dropped from the model and those
+        below them are shifted."""
+        first = self.line_number(start)
+        after = first + self.content.count('\n', start, stop)
+        shift = text.count('\n') - (after - first)
+        self._replace(start, stop, text)
+        self.prd.tasks = [
+            _moved(task, shift) if task.line >= after else task
+            for task in self.prd.tasks if not first <= task.line < after
+        ]
+        self.prd.diagnostics = [
+            _moved(diagnostic, shift) if diagnostic.line >= after else diagnostic
+            for diagnostic in self.prd.diagnostics if not first <= diagnostic.line < after
+        ]
+
+    def insert_task(self, task):
+        """Add the block of task at the end of its section, in place of the
+        template filler if the section had no tasks. Returns the task as
+        parsed from the inserted block."""
+        start, stop = self.section(TASK_SECTIONS[task.status])
+        block = render_task(task)
+        # Parse the block alone: the model gets exactly what a full parse would
+        parsed = parse_prd('\n'.join(block))
+        fields = ('name', 'description', 'solution', 'state')
+        if (len(parsed.tasks) != 1 or parsed.diagnostics
+                or any(getattr(parsed.tasks[0], key) != getattr(task, key) for key in fields)):
+            raise ValueError("El texto de la tarea rompe el formato del PRD (encabezados '#' o '```')")
+        text = self.newline.join(block) + self.newline
+
+        end = self.content_end(start, stop)
+        body = self.content[self.body_start(start):end]
+        if not self.tasks_between(start, stop) and PLACEHOLDER_RE.fullmatch(body.strip()):
+            line_start = self.line_start(end, self.body_start(start))
+            header = self.line_number(line_start)
+            self.splice(line_start, end, text)
+        else:
+            if end == len(self.content) and not self.content.endswith('\n'):
+                self._replace(end, end, self.newline)
+                end = len(self.content)
+            header = self.line_number(end) + 1
+            self.splice(end, end, self.newline + text)
+
+        added = parsed.tasks[0].replace(line=header)
+        position = sum(1 for other in self.prd.tasks if other.line < header)
+        self.prd.tasks.insert(position, added)
+        return added
+
+    def remove_task(self, task, start, stop):
+        """Delete the block of task from the section content[start:stop],
+        with the blank lines before it if it was the last one."""
+        headers = {}
+        line, offset = self.line_number(start), start
+        for match in TASK_LINE_RE.finditer(self.content, start, stop):
+            line += self.content.count('\n', offset, match.start())
+            offset = match.start()
+            headers[line] = offset
+        later = [other.line for other in self.tasks_between(start, stop) if other.line > task.line]
+        first = headers.get(task.line)
+        last = headers.get(min(later)) if later else self.content_end(start, stop)
+        if first is None or last is None:
+            raise ValueError(f"No se encontró el bloque de la tarea {task.number}")
+        if not later:
+            body_start = self.body_start(start)
+            while first > body_start and not self.content[self.line_start(first, body_start):first].strip():
+                first = self.line_start(first, body_start)
+        self.splice(first, last, '')
+
+    def update_summary(self):
+        """Rewrite the counters and total hours of the Resumen Ejecutivo
+        from the model (same rule as the hours report)."""
+        minutes = sum(task_durations([task.minutes for task in self.prd.tasks]))
+        values = {
+            'Tareas completadas': str(len(self.prd.completed_tasks)),
+            'Tareas pendientes': str(len(self.prd.pending_tasks)),
+            'Total de horas': f"{minutes // 60}h {minutes % 60}m",
+        }
+        start, stop = self._sections.get(SUMMARY_SECTION, (0, 0))
+        lines = self.content[start:stop].splitlines(keepends=True)
+        for index, line in enumerate(lines):
+            text = line.rstrip('\r\n')
+            match = SUMMARY_ITEM_RE.search(text)
+            if match and match.group(1).strip() in values:
+                key = match.group(1).strip()
+                lines[index] = text[:match.start(2)] + values[key] + line[len(text):]
+                self.prd.summary[key] = values[key]
+        self._replace(start, stop, ''.join(lines))
+
+
+def _moved(item, shift):
+    """Copy of a Task or Diagnostic shifted shift lines down."""
+    item = copy(item)
+    item.line += shift
+    return item
+
+
+def _edit(prd_path, change):
+    """Read a PRD, apply change(document) and write it back atomically.
+
+    The whole read-modify-write holds the write lock of the PRD, so edits
+    from concurrent sessions are applied one after another and none is
+    lost. The edited model is stored (in memory and in the parse cache) for
+    the written file. Returns (result of change, error).
+    """
+    path = Path(prd_path).expanduser().resolve()
+    if not path.exists():
+        return None, f"Archivo no encontrado: {path}"
+    try:
+        with locked(path):
+            return _edit_locked(path, change)
+    except TimeoutError as e:
+        return None, str(e)
+    except OSError as e:
+        return None, f"No se pudo escribir {path}: {e}"
+
+
+def _edit_locked(path, change):
+    try:
+        with span('read', file=path.name):
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                stat = os.fstat(f.fileno())
+                content = f.read()
+    except FileNotFoundError:
+        return None, f"Archivo no encontrado: {path}"
+    count('files_read')
+    count('bytes_read', stat.st_size)
+    if content.count('\r') != content.count('\r\n') or any(c in content for c in OTHER_BREAKS):
+        return None, "El PRD tiene saltos de línea no estándar (\\r, \\f...); guárdalo con saltos \\n"
+
+    prd = cached_prd(path, stat)
+    if prd is None:
+        prd = read_sidecar(path, hashlib.sha256(content.encode('utf-8')).hexdigest())
+    if prd is None:
+        with span('parse', file=path.name):
+            prd = parse_prd(content)
+    document = PRDDocument(content, prd)
+    try:
+        result = change(document)
+    except ValueError as e:
+        return None, str(e)
+    document.update_summary()
+
+    write_atomic(path, document.content)
+    remember_prd(path, os.stat(path), document.prd)
+    write_sidecar(path, document.content, document.prd)
+    return result, None
+
+
+def add_task(prd_path, name, time_str=None, description='', solution='', pending=False, state=''):
+    """Add a task at the end of Tareas Realizadas (or Tareas Pendientes).
+
+    time_str defaults to the current time. Returns (task, error).
+    """
+    name = ' '.join(name.split())
+    time_str = time_str or datetime.now().strftime("%H:%M")
+    if not name:
+        return None, "El título de la tarea está vacío"
+    if not TIME_RE.fullmatch(time_str):
+        return None, f"Hora inválida: {time_str}. Use HH:MM"
+    status = STATUS_PENDING if pending else STATUS_COMPLETED
+
+    def change(document):
+        section = document.section(TASK_SECTIONS[status])
+        numbers = [int(task.number) for task in document.tasks_between(*section)]
+        task = Task(number=str(max(numbers, default=0) + 1), name=name, time=time_str, status=status,
+                    emoji=TASK_EMOJIS[status], description=description.strip(),
+                    solution='' if pending else solution.strip(), state=state.strip() if pending else '')
+        return document.insert_task(task)
+
+    return _edit(prd_path, change)
+
+
+def complete_task(prd_path, number, solution='', time_str=None):
+    """Move pending task number to Tareas Realizadas with its solution.
+
+    The task keeps its start time unless time_str is given. Returns
+    (task, error).
+    """
+    if time_str and not TIME_RE.fullmatch(time_str):
+        return None, f"Hora inválida: {time_str}. Use HH:MM"
+
+    def change(document):
+        start, stop = document.section(TASK_SECTIONS[STATUS_PENDING])
+        pending = [task for task in document.tasks_between(start, stop) if task.number == str(number)]
+        if not pending:
+            raise ValueError(f"No hay ninguna tarea pendiente número {number}")
+        task = pending[0]
+        document.remove_task(task, start, stop)
+        start, stop = document.section(TASK_SECTIONS[STATUS_PENDING])
+        body_start = document.body_start(start)
+        if not document.tasks_between(start, stop) and document.content_end(start, stop) == body_start:
+            document.splice(body_start, body_start, document.newline + EMPTY_PENDING_TEXT + document.newline)
+
+        section = document.section(TASK_SECTIONS[STATUS_COMPLETED])
+        numbers = [int(other.number) for other in document.tasks_between(*section)]
+        done = task.replace(number=str(max(numbers, default=0) + 1), status=STATUS_COMPLETED,
+                            emoji=TASK_EMOJIS[STATUS_COMPLETED], time=time_str or task.time,
+                            solution=solution.strip(), state='')
+        return document.insert_task(done)
+
+    return _edit(prd_path, change)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Añadir o completar tareas en el PRD del día",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python prd_edit.py add "Revisar correos" --time 09:00 --description "Bandeja" --solution "Respondidos"
+  python prd_edit.py add "Apagado Proxmox" --pending --state "En curso"
+  python prd_edit.py complete 1 --solution "Apagado y revisado"
+  python prd_edit.py add "Reunión" --time 16:00 --date 20260216
+        """
+    )
+    # Options shared by both commands, accepted after the command name
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--date', help='Fecha del PRD en formato YYYYMMDD (default: hoy)')
+    common.add_argument('--path', default=None, help=f'Carpeta PRD_DOCUMENTS (default: {DEFAULT_PRD_DIR})')
+    add_cache_arguments(common)
+    add_trace_arguments(common)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    add_parser = subparsers.add_parser('add', parents=[common], help='Añadir una tarea')
+    add_parser.add_argument('name', help='Título de la tarea')
+    add_parser.add_argument('--time', help='Hora de inicio HH:MM (default: ahora)')
+    add_parser.add_argument('--description', default='', help='Texto de **Descripción**')
+    add_parser.add_argument('--solution', default='', help='Texto de **Solución** (tareas realizadas)')
+    add_parser.add_argument('--pending', action='store_true', help='Añadir a Tareas Pendientes')
+    add_parser.add_argument('--state', default='', help='Texto de **Estado** (tareas pendientes)')
+
+    complete_parser = subparsers.add_parser('complete', parents=[common],
+                                            help='Pasar una tarea pendiente a realizadas')
+    complete_parser.add_argument('number', type=int, help='Número de la tarea en Tareas Pendientes')
+    complete_parser.add_argument('--solution', default='', help='Texto de **Solución**')
+    complete_parser.add_argument('--time', help='Nueva hora de inicio HH:MM (default: la de la tarea)')
+
+    args = parser.parse_args(argv)
+    setup_trace(args)
+    setup_parse_cache(args, DEFAULT_REPORTS_DIR)
+
+    try:
+        date_obj = datetime.strptime(args.date, "%Y%m%d") if args.date else datetime.now()
+    except ValueError:
+        print(f"❌ Error: Formato de fecha inválido: {args.date}. Use YYYYMMDD")
+        return 1
+    prd_path = prd_path_for(date_obj, args.path)
+
+    if args.command == 'add':
+        task, error = add_task(prd_path, args.name, args.time, args.description, args.solution,
+                               args.pending, args.state)
+    else:
+        task, error = complete_task(prd_path, args.number, args.solution, args.time)
+    if error:
+        print(f"❌ Error: {error}")
+        return 1
+
+    action = "añadida" if args.command == 'add' else "completada"
+    print(f"✅ Tarea {action}: {task.emoji} {task.number}. {task.name} — {task.time}")
+    print(f"   Archivo: {prd_path}")
+    return 0
+
+
+def add_task_main(argv=None):
+    """Entry point of 'prddiario add-task'."""
+    return main(['add', *(argv or [])])
+
+
+def complete_task_main(argv=None):
+    """Entry point of 'prddiario complete-task'."""
+    return main(['complete', *(argv or [])])
+
+
+if __name__ == "__main__":
+    exit(main())
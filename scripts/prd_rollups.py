@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+PRD Rollups
+Totales precalculados por semana ISO, mes y año (minutos, tareas
+completadas, pendientes y total de tareas) para responder las consultas de
+periodo sin recorrer los PRD diarios.
+
+REPORTS/prd_rollups.json guarda la aportación de cada día (con el hash y el
+stat de su PRD) y la suma de cada periodo. Cuando cambia el PRD de un día se
+resta su aportación anterior y se suma la nueva solo en su semana, su mes y
+su año; consultar un periodo es buscar una clave en un diccionario.
+
+- query y list solo leen el archivo (con --update lo actualizan antes)
+- update hace un stat de cada PRD vivo (los archivados se comparan por el
+  hash del índice de ARCHIVES) y solo lee los que cambiaron; los días cuyo
+  PRD ya no existe se restan
+- update --rebuild recalcula todo desde los PRD
+- watch_reports.py actualiza los días que regenera
+
+Los minutos siguen la misma regla que el reporte de horas.
+
+Uso:
+    python prd_rollups.py update [--rebuild] [--path ./PRD_DOCUMENTS] [--archives DIR]
+    python prd_rollups.py query (--week YYYY-Www | --month YYYYMM | --year YYYY | --date YYYYMMDD) [--update]
+    python prd_rollups.py list [--period week|month|year] [--from YYYYMMDD] [--to YYYYMMDD]
+
+Ejemplos:
+    python prd_rollups.py update                    # Incremental: solo los días que cambiaron
+    python prd_rollups.py update --rebuild          # Recalcular todo
+    python prd_rollups.py query --month 202602
+    python prd_rollups.py list --period week --from 20260101
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+from prd_build import hash_file
+from prd_config import load_config
+from prd_core import load_prd, period_key, task_durations
+from prd_storage import add_io_arguments, add_storage_arguments, open_storage
+from prd_trace import add_trace_arguments, count, setup_trace, span
+from prd_write import locked, replace_file
+
+# Load configuration
+DEFAULT_PRD_DIR = "~/Documents/prd_diarios/PRD_DOCUMENTS"
+DEFAULT_REPORTS_DIR = "~/Documents/prd_diarios/REPORTS"
+
+config = load_config()
+if config:
+    try:
+        folders = config.get("folders", {})
+        DEFAULT_PRD_DIR = os.path.expanduser(folders.get("prd_documents", DEFAULT_PRD_DIR))
+        DEFAULT_REPORTS_DIR = os.path.expanduser(folders.get("reports", DEFAULT_REPORTS_DIR))
+    except Exception:
+        pass
+
+ROLLUPS_FILENAME = "prd_rollups.json"
+DEFAULT_ROLLUPS_PATH = os.path.join(DEFAULT_REPORTS_DIR, ROLLUPS_FILENAME)
+ROLLUPS_VERSION = 2
+
+PERIOD_KINDS = ('week', 'month', 'year')
+# Totals kept for every day and period; periods also count their days
+FIELDS = ('minutes', 'completed', 'pending', 'tasks')
+
+WEEK_RE = re.compile(r'\d{4}-W\d{2}')
+
+
+def stat_key(stat):
+    """What is remembered of a live PRD's stat to skip hashing it again.
+
+    The inode too: two atomic replaces (prd_write) within one mtime tick
+    can leave the same size and mtime, but each one gets a new inode.
+    """
+    return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+
+def day_totals(prd):
+    """Contribution of one parsed PRD to its periods."""
+    start_minutes = [task.minutes for task in prd.tasks if task.time]
+    return {
+        'minutes': sum(task_durations(start_minutes)),
+        'completed': len(prd.completed_tasks),
+        'pending': len(prd.pending_tasks),
+        'tasks': len(prd.tasks),
+    }
+
+
+class Rollups:
+    """Per-day contributions and per-period sums, loaded from one file."""
+
+    def __init__(self, path):
+        self.path = Path(path).expanduser()
+        self.days = {}
+        self.periods = {kind: {} for kind in PERIOD_KINDS}
+        self.dirty = False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == ROLLUPS_VERSION:
+                self.days = data['days']
+                self.periods = data['periods']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def _apply(self, day, totals, sign):
+        ordinal = date(int(day[:4]), int(day[4:6]), int(day[6:])).toordinal()
+        for kind in PERIOD_KINDS:
+            key = period_key(ordinal, kind)
+            periods = self.periods[kind]
+            period = periods.get(key)
+            if period is None:
+                period = periods[key] = dict.fromkeys(FIELDS + ('days',), 0)
+            for field in FIELDS:
+                period[field] += sign * totals[field]
+            period['days'] += sign
+            if not period['days']:
+                del periods[key]
+        count('rollup_periods_updated', len(PERIOD_KINDS))
+
+    def set_day(self, day, prd, sha256, stat=None):
+        """Replace the contribution of day (YYYYMMDD) with that of prd."""
+        self.set_totals(day, day_totals(prd), sha256, stat)
+
+    def set_totals(self, day, totals, sha256, stat=None):
+        """Replace the contribution of day with totals (a FIELDS dict)."""
+        old = self.days.get(day)
+        if old:
+            self._apply(day, old, -1)
+        self._apply(day, totals, 1)
+        self.days[day] = {**totals, 'sha256': sha256,
+                          'stat': stat_key(stat) if stat else None}
+        self.dirty = True
+
+    def remove_day(self, day):
+        old = self.days.pop(day, None)
+        if old:
+            self._apply(day, old, -1)
+            self.dirty = True
+
+    def clear(self):
+        self.days = {}
+        self.periods = {kind: {} for kind in PERIOD_KINDS}
+        self.dirty = True
+
+    def period(self, kind, key):
+        """Totals of one period ('2026-W07', '2026-02', '2026'), or None."""
+        return self.periods[kind].get(key)
+
+    def day(self, day):
+        """Totals of one day (YYYYMMDD), or None."""
+        return self.days.get(day)
+
+    def save(self):
+        """Write the file atomically if it changed."""
+        if not self.dirty:
+            return
+        data = json.dumps({'version': ROLLUPS_VERSION, 'days': self.days, 'periods': self.periods},
+                          ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with span('write', file=self.path.name):
+            replace_file(self.path, data.encode('utf-8'))
+        self.dirty = False
+
+
+def sync(rollups, entries, io_workers=None, rebuild=False):
+    """Bring rollups in line with entries (PRDEntry of every day).
+
+    Only days whose PRD changed are read. Returns counts of added, updated,
+    removed and unchanged days.
+    """
+    # Imported here: asyncio is costly to import and only full updates need it
+    from prd_aio import iter_prds
+
+    stats = dict.fromkeys(('added', 'updated', 'removed', 'unchanged'), 0)
+    if rebuild:
+        rollups.clear()
+
+    changed = []
+    with span('rollups.scan', days=len(entries)):
+        for entry in entries:
+            known = rollups.days.get(entry.day)
+            if entry.archived:
+                if known and known['sha256'] == entry.sha256:
+                    stats['unchanged'] += 1
+                else:
+                    changed.append((entry, entry.sha256, None))
+                continue
+
+            stat = os.stat(entry.path)
+            count('files_stat')
+            if known and known['stat'] == stat_key(stat):
+                stats['unchanged'] += 1
+                continue
+            sha256 = hash_file(entry.path)
+            if known and known['sha256'] == sha256:
+                known['stat'] = stat_key(stat)
+                rollups.dirty = True
+                stats['unchanged'] += 1
+                continue
+            changed.append((entry, sha256, stat))
+
+    loaded = iter_prds([entry for entry, _, _ in changed], io_workers)
+    for (entry, sha256, stat), (_, prd) in zip(changed, loaded):
+        stats['updated' if entry.day in rollups.days else 'added'] += 1
+        rollups.set_day(entry.day, prd, sha256, stat)
+
+    current = {entry.day for entry in entries}
+    for day in [day for day in rollups.days if day not in current]:
+        rollups.remove_day(day)
+        stats['removed'] += 1
+    return stats
+
+
+def update_rollups(prd_dir=None, path=None, archive_dir=None, io_workers=None, rebuild=False):
+    """Update (or rebuild) the rollups file from every live and archived PRD.
+
+    Holds the file's write lock, so concurrent updates do not lose days.
+    Returns (rollups, stats).
+    """
+    path = Path(path or DEFAULT_ROLLUPS_PATH).expanduser()
+    prd_dir = Path(prd_dir or DEFAULT_PRD_DIR).expanduser()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with locked(path):
+        rollups = Rollups(path)
+        storage = open_storage(prd_dir, archive_dir)
+        # The storage index is per process; a long-lived caller (watch) may
+        # have seen days since deleted or archived
+        storage.refresh()
+        stats = sync(rollups, storage.entries(), io_workers, rebuild)
+        rollups.save()
+    return rollups, stats
+
+
+def update_days(days, prd_dir=None, path=None):
+    """Update only the given days (YYYYMMDD) from their live PRDs.
+
+    For callers that already know what changed (watch_reports); the PRDs
+    were usually just parsed in this process, so nothing is read twice.
+    """
+    path = Path(path or DEFAULT_ROLLUPS_PATH).expanduser()
+    prd_dir = Path(prd_dir or DEFAULT_PRD_DIR).expanduser()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with locked(path):
+        rollups = Rollups(path)
+        for day in days:
+            prd_path = prd_dir / f"PRD_{day}.md"
+            try:
+                stat = os.stat(prd_path)
+            except FileNotFoundError:
+                # Deleted or archived: left to the next full update
+                continue
+            known = rollups.days.get(day)
+            if known and known['stat'] == stat_key(stat):
+                continue
+            rollups.set_day(day, load_prd(prd_path), hash_file(prd_path), stat)
+        rollups.save()
+    return rollups
+
+
+def period_of(args):
+    """(kind, key) of the period chosen with --week/--month/--year/--date."""
+    if args.week:
+        if not WEEK_RE.fullmatch(args.week):
+            raise ValueError(f"Semana inválida: {args.week}. Use YYYY-Www")
+        return 'week', args.week
+    if args.month:
+        try:
+            month = datetime.strptime(args.month, "%Y%m")
+        except ValueError:
+            raise ValueError(f"Mes inválido: {args.month}. Use YYYYMM")
+        return 'month', month.strftime("%Y-%m")
+    if args.year:
+        if not re.fullmatch(r'\d{4}', args.year):
+            raise ValueError(f"Año inválido: {args.year}. Use YYYY")
+        return 'year', args.year
+    try:
+        datetime.strptime(args.date, "%Y%m%d")
+    except ValueError:
+        raise ValueError(f"Fecha inválida: {args.date}. Use YYYYMMDD")
+    return 'day', args.date
+
+
+def parse_day(value):
+    """argparse type for YYYYMMDD dates."""
+    try:
+        datetime.strptime(value, "%Y%m%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Formato de fecha inválido: {value}. Use YYYYMMDD")
+    return value
+
+
+def format_totals(totals):
+    minutes = totals['minutes']
+    days = f"{totals['days']} días · " if 'days' in totals else ""
+    return (f"{days}{totals['tasks']} tareas ({totals['completed']} completadas, "
+            f"{totals['pending']} pendientes) · {minutes // 60}h {minutes % 60}m")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Totales precalculados por semana, mes y año",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python prd_rollups.py update
+  python prd_rollups.py update --rebuild
+  python prd_rollups.py query --month 202602
+  python prd_rollups.py query --week 2026-W07 --update
+  python prd_rollups.py list --period week --from 20260101
+        """
+    )
+    parser.add_argument('--file', default=DEFAULT_ROLLUPS_PATH,
+                        help=f'Archivo de totales (default: {DEFAULT_ROLLUPS_PATH})')
+    # Options shared by every command, accepted after the command name
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--path', default=None, help=f'Carpeta PRD_DOCUMENTS (default: {DEFAULT_PRD_DIR})')
+    add_storage_arguments(common)
+    add_io_arguments(common)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    update_parser = subparsers.add_parser('update', parents=[common], help='Actualizar los totales')
+    update_parser.add_argument('--rebuild', action='store_true', help='Recalcular todo desde los PRD')
+
+    query_parser = subparsers.add_parser('query', parents=[common], help='Totales de un periodo')
+    period_group = query_parser.add_mutually_exclusive_group(required=True)
+    period_group.add_argument('--week', help='Semana ISO YYYY-Www')
+    period_group.add_argument('--month', help='Mes YYYYMM')
+    period_group.add_argument('--year', help='Año YYYY')
+    period_group.add_argument('--date', help='Día YYYYMMDD')
+    query_parser.add_argument('--update', action='store_true', help='Actualizar los totales antes de consultar')
+
+    list_parser = subparsers.add_parser('list', parents=[common], help='Totales de todos los periodos')
+    list_parser.add_argument('--period', choices=PERIOD_KINDS, default='month', help='Tipo de periodo (default: month)')
+    list_parser.add_argument('--from', dest='date_from', type=parse_day, help='Primera fecha YYYYMMDD')
+    list_parser.add_argument('--to', dest='date_to', type=parse_day, help='Última fecha YYYYMMDD')
+    list_parser.add_argument('--update', action='store_true', help='Actualizar los totales antes de listar')
+
+    add_trace_arguments(parser)
+
+    args = parser.parse_args(argv)
+    setup_trace(args)
+
+    if args.command == 'query':
+        try:
+            kind, key = period_of(args)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+
+    # query and list read the stored totals as they are unless asked to refresh
+    if args.command == 'update' or args.update:
+        started = time.perf_counter()
+        try:
+            rollups, stats = update_rollups(args.path, args.file, args.archives, args.io_workers,
+                                            getattr(args, 'rebuild', False))
+        except (OSError, TimeoutError) as e:
+            print(f"❌ Error: {e}")
+            return 1
+        if args.command == 'update':
+            elapsed = time.perf_counter() - started
+            print(f"✅ Totales actualizados en {elapsed:.2f}s: {rollups.path}")
+            print(f"   - Días nuevos: {stats['added']}")
+            print(f"   - Actualizados: {stats['updated']}")
+            print(f"   - Sin cambios: {stats['unchanged']}")
+            print(f"   - Eliminados: {stats['removed']}")
+            return 0
+    else:
+        rollups = Rollups(args.file)
+
+    if args.command == 'query':
+        totals = rollups.day(key) if kind == 'day' else rollups.period(kind, key)
+        if not totals:
+            print(f"⚠️  Sin datos para {key}")
+            return 1
+        print(f"📊 {key}: {format_totals(totals)}")
+        return 0
+
+    first = period_key(datetime.strptime(args.date_from, "%Y%m%d").toordinal(), args.period) if args.date_from else None
+    last = period_key(datetime.strptime(args.date_to, "%Y%m%d").toordinal(), args.period) if args.date_to else None
+    keys = [key for key in sorted(rollups.periods[args.period])
+            if (not first or key >= first) and (not last or key <= last)]
+    if not keys:
+        print("⚠️  Sin datos en el rango")
+        return 1
+    for key in keys:
+        print(f"{key:<9} {format_totals(rollups.period(args.period, key))}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
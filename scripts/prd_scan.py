@@ -0,0 +1,183 @@
+"""
+PRD Folder Scanner
+Recorre las carpetas de trabajo diario y devuelve los metadatos de sus
+archivos (fecha de creación, modificación y tamaño).
+
+- Un solo os.scandir por carpeta; los datos de DirEntry se reutilizan
+- Recorre subcarpetas hasta una profundidad máxima
+- Descarta node_modules, .git, archivos ocultos, etc. con un único patrón
+  precompilado, sin entrar en esas carpetas
+- Opcionalmente hace los stat en paralelo (carpetas de red o sincronizadas)
+- En Linux obtiene la fecha de creación real con statx cuando está disponible
+
+Uso:
+    from prd_scan import scan_folder
+    files = scan_folder(folder_path, max_depth=3, workers=8)
+"""
+
+import fnmatch
+import os
+import re
+import struct
+import sys
+from datetime import datetime
+
+from prd_trace import count, span
+
+# sys.platform rather than platform.system(): the platform module alone
+# takes longer to import than scanning a small folder
+SYSTEM = sys.platform
+
+DEFAULT_IGNORE = ('.*', 'node_modules', '__pycache__', 'Thumbs.db', 'desktop.ini')
+DEFAULT_MAX_DEPTH = 3
+
+# statx(2): AT_FDCWD, AT_SYMLINK_NOFOLLOW, STATX_BASIC_STATS | STATX_BTIME
+AT_FDCWD = -100
+AT_SYMLINK_NOFOLLOW = 0x100
+STATX_MASK = 0x7ff | 0x800
+STATX_BTIME = 0x800
+STATX_SIZE = 256
+# Offsets in struct statx of stx_mask, stx_size and the btime/mtime timestamps
+STATX_MASK_OFFSET = 0
+STATX_SIZE_OFFSET = 40
+STATX_BTIME_OFFSET = 80
+STATX_MTIME_OFFSET = 112
+
+_statx = None
+
+
+def compile_ignore(patterns):
+    """Compile glob patterns into one matcher: name -> truthy if ignored."""
+    if not patterns:
+        return lambda name: None
+    return re.compile('|'.join(fnmatch.translate(p) for p in patterns)).match
+
+
+def _load_statx():
+    """Return the libc statx function, or False if this system lacks it."""
+    global _statx
+    if _statx is None:
+        _statx = False
+        if SYSTEM.startswith('linux'):
+            try:
+                import ctypes
+                libc = ctypes.CDLL(None, use_errno=True)
+                function = libc.statx
+                function.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+                                     ctypes.c_uint, ctypes.c_char_p)
+                function.restype = ctypes.c_int
+                _statx = (function, ctypes.create_string_buffer)
+            except (OSError, AttributeError):
+                _statx = False
+    return _statx
+
+
+def _statx_times(path):
+    """(birth_ns or None, mtime_ns, size) of path via statx, or None."""
+    statx = _load_statx()
+    if not statx:
+        return None
+    function, create_buffer = statx
+    buffer = create_buffer(STATX_SIZE)
+    if function(AT_FDCWD, os.fsencode(path), AT_SYMLINK_NOFOLLOW, STATX_MASK, buffer) != 0:
+        return None
+
+    mask, = struct.unpack_from('I', buffer, STATX_MASK_OFFSET)
+    size, = struct.unpack_from('Q', buffer, STATX_SIZE_OFFSET)
+    mtime_sec, mtime_nsec = struct.unpack_from('qI', buffer, STATX_MTIME_OFFSET)
+    birth_ns = None
+    if mask & STATX_BTIME:
+        btime_sec, btime_nsec = struct.unpack_from('qI', buffer, STATX_BTIME_OFFSET)
+        birth_ns = btime_sec * 1_000_000_000 + btime_nsec
+    return birth_ns, mtime_sec * 1_000_000_000 + mtime_nsec, size
+
+
+def file_metadata(entry):
+    """Creation time, modification time and size of a DirEntry or path.
+
+    Creation time is st_birthtime on macOS/BSD and Windows, statx btime on
+    Linux, and the modification time where the system does not record it.
+    """
+    path = entry.path if isinstance(entry, os.DirEntry) else os.fspath(entry)
+
+    times = _statx_times(path) if SYSTEM.startswith('linux') else None
+    if times:
+        birth_ns, mtime_ns, size = times
+    else:
+        stat = entry.stat() if isinstance(entry, os.DirEntry) else os.stat(path)
+        mtime_ns = stat.st_mtime_ns
+        size = stat.st_size
+        birth = getattr(stat, 'st_birthtime', None)
+        if birth is None and SYSTEM == 'win32':
+            birth = stat.st_ctime
+        birth_ns = int(birth * 1_000_000_000) if birth is not None else None
+
+    return {
+        'creation_time': datetime.fromtimestamp((birth_ns if birth_ns is not None else mtime_ns) / 1e9),
+        'modification_time': datetime.fromtimestamp(mtime_ns / 1e9),
+        'size': size,
+        'mtime_ns': mtime_ns
+    }
+
+
+def iter_entries(folder, max_depth=DEFAULT_MAX_DEPTH, ignore=DEFAULT_IGNORE):
+    """Yield (relative name, DirEntry) for the files under folder.
+
+    max_depth 0 lists only folder itself, None means unlimited. Ignored
+    names are pruned before descending. Symlinked folders are not followed.
+    """
+    ignored = compile_ignore(ignore)
+    stack = [(os.fspath(folder), '', 0)]
+    while stack:
+        path, prefix, depth = stack.pop()
+        count('dirs_scanned')
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if ignored(entry.name):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if max_depth is None or depth < max_depth:
+                                stack.append((entry.path, f"{prefix}{entry.name}/", depth + 1))
+                        elif entry.is_file():
+                            yield f"{prefix}{entry.name}", entry
+                    except OSError:
+                        continue
+        except OSError:
+            if depth == 0:
+                raise
+
+
+def scan_folder(folder, max_depth=DEFAULT_MAX_DEPTH, ignore=DEFAULT_IGNORE, workers=None):
+    """Return [{'name', 'path', 'metadata'}] for the files under folder.
+
+    name is relative to folder ('sub/file.txt' for nested files). With
+    workers > 1 the stat calls run in a thread pool, which pays off on
+    network and cloud-synced drives where each stat is a round trip.
+    """
+    with span('scan', folder=os.fspath(folder)):
+        entries = list(iter_entries(folder, max_depth, ignore))
+
+    count('files_stat', len(entries))
+    with span('stat', files=len(entries), workers=workers or 1):
+        if workers and workers > 1 and len(entries) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                metadata = list(pool.map(_safe_metadata, (entry for _, entry in entries)))
+        else:
+            metadata = [_safe_metadata(entry) for _, entry in entries]
+
+    return [
+        {'name': name, 'path': entry.path, 'metadata': meta}
+        for (name, entry), meta in zip(entries, metadata)
+        if meta is not None
+    ]
+
+
+def _safe_metadata(entry):
+    # Files can disappear between scandir and stat
+    try:
+        return file_metadata(entry)
+    except OSError:
+        return None
@@ -0,0 +1,253 @@
+"""
+PRD Storage
+Acceso a los PRD por fecha, estén vivos en PRD_DOCUMENTS o guardados en un
+zip de ARCHIVES (ver prd_archive.py).
+
+- Índice en memoria: un solo os.scandir de PRD_DOCUMENTS y la lectura de
+  ARCHIVES/archive_index.json; buscar un día no recorre ninguna carpeta
+- Un PRD vivo tiene prioridad sobre su copia archivada; si un día está en
+  varios archivos (semana y mes) se usa el más reciente
+- Los miembros descomprimidos se guardan en una pequeña caché LRU
+- El hash de un PRD archivado sale del índice, sin descomprimirlo, así que
+  los reportes de rangos archivados se saltan sin leer nada si están al día
+
+Uso:
+    from prd_storage import load_entry, open_storage
+
+    storage = open_storage(prd_dir)
+    for entry in storage.entries("20260101", "20260331"):
+        prd = load_entry(entry)
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from prd_build import hash_file
+from prd_config import load_config
+from prd_core import load_prd, parse_prd, prd_file_date
+from prd_trace import count, span
+
+# Load configuration
+DEFAULT_ARCHIVE_DIR = "~/Documents/prd_diarios/ARCHIVES"
+
+config = load_config()
+if config:
+    try:
+        DEFAULT_ARCHIVE_DIR = os.path.expanduser(config.get("folders", {}).get("archives", DEFAULT_ARCHIVE_DIR))
+    except Exception:
+        pass
+
+# Kept in sync with prd_archive.py (not imported: it pulls in zipfile)
+ARCHIVE_INDEX_FILENAME = "archive_index.json"
+ARCHIVED_PRD_PREFIX = "PRD_DOCUMENTS/"
+
+# Files read at the same time by range and batch modes (see prd_aio)
+DEFAULT_IO_WORKERS = 8
+
+# Decompressed members kept in memory, most recently used last
+MEMBER_CACHE_SIZE = 32
+
+_members = OrderedDict()
+_zips = {}
+# read_member() is also called from the reader threads of prd_aio
+_lock = threading.Lock()
+_storages = {}
+
+
+class PRDEntry:
+    """Where the PRD of one day lives.
+
+    path is the live file, or where it lived before being archived (its
+    name and folder still name the reports); archive and member locate the
+    archived copy, and sha256 is its hash from the archive index. Entries
+    are immutable and compare by value.
+    """
+
+    __slots__ = ('day', 'path', 'archive', 'member', 'sha256')
+
+    def __init__(self, day, path, archive=None, member=None, sha256=None):
+        for name, value in zip(self.__slots__, (day, path, archive, member, sha256)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"PRDEntry is immutable: cannot set {name}")
+
+    def _fields(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other._fields() == self._fields()
+
+    def __hash__(self):
+        return hash(self._fields())
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={value!r}" for name, value in zip(self.__slots__, self._fields()))
+        return f"PRDEntry({fields})"
+
+    @property
+    def name(self):
+        return self.path.name
+
+    @property
+    def stem(self):
+        return self.path.stem
+
+    @property
+    def parent(self):
+        return self.path.parent
+
+    @property
+    def archived(self):
+        return self.archive is not None
+
+    @property
+    def key(self):
+        """Identity of the PRD in build manifests."""
+        if self.archived:
+            return f"{self.archive.resolve()}::{self.member}"
+        return str(self.path.resolve())
+
+    def __str__(self):
+        if self.archived:
+            return f"{self.archive.name}:{self.member}"
+        return str(self.path)
+
+
+def as_entry(prd_file):
+    """Return prd_file (a path or a PRDEntry) as a PRDEntry."""
+    if isinstance(prd_file, PRDEntry):
+        return prd_file
+    path = Path(prd_file)
+    return PRDEntry(prd_file_date(path.name), path)
+
+
+def read_member(archive, member):
+    """Bytes of one archived file, through the LRU of decompressed members."""
+    key = (str(archive), member)
+    with _lock:
+        data = _members.get(key)
+        if data is not None:
+            _members.move_to_end(key)
+    if data is not None:
+        count('archive_hits')
+        return data
+
+    import zipfile
+
+    with _lock:
+        zf = _zips.get(key[0])
+        if zf is None:
+            zf = _zips[key[0]] = zipfile.ZipFile(archive)
+
+    # ZipFile serializes reads of its file handle itself
+    data = zf.read(member)
+
+    count('archive_reads')
+    count('bytes_read', len(data))
+    with _lock:
+        _members[key] = data
+        if len(_members) > MEMBER_CACHE_SIZE:
+            _members.popitem(last=False)
+    return data
+
+
+def load_entry(prd_file, remember=True):
+    """Parsed PRD of a path or PRDEntry, live or archived."""
+    entry = as_entry(prd_file)
+    if not entry.archived:
+        return load_prd(entry.path, remember)
+    with span('read', file=entry.name, archive=entry.archive.name):
+        content = read_member(entry.archive, entry.member).decode('utf-8')
+    with span('parse', file=entry.name):
+        return parse_prd(content)
+
+
+def entry_hash(prd_file):
+    """SHA-256 of a PRD; archived ones come from the index, not the zip."""
+    entry = as_entry(prd_file)
+    return entry.sha256 if entry.archived else hash_file(entry.path)
+
+
+class PRDStorage:
+    """In-memory index of the live and archived PRDs, by day."""
+
+    def __init__(self, prd_dir, archive_dir=None):
+        self.prd_dir = Path(prd_dir).expanduser()
+        self.archive_dir = Path(archive_dir or DEFAULT_ARCHIVE_DIR).expanduser()
+        self._days = None
+
+    def _build(self):
+        days = {}
+        with span('index', archives=str(self.archive_dir)):
+            try:
+                with open(self.archive_dir / ARCHIVE_INDEX_FILENAME, 'r', encoding='utf-8') as f:
+                    archives = json.load(f).get('archives', {})
+            except (OSError, ValueError):
+                archives = {}
+            # Oldest first, so a day in several archives ends up in the newest
+            for name, archive in sorted(archives.items(), key=lambda item: item[1].get('created', '')):
+                for member, info in archive.get('members', {}).items():
+                    if not member.startswith(ARCHIVED_PRD_PREFIX):
+                        continue
+                    filename = member[len(ARCHIVED_PRD_PREFIX):]
+                    day = prd_file_date(filename)
+                    if day:
+                        days[day] = PRDEntry(day, self.prd_dir / filename, self.archive_dir / name,
+                                             member, info['sha256'])
+
+            try:
+                with os.scandir(self.prd_dir) as entries:
+                    for entry in entries:
+                        day = prd_file_date(entry.name)
+                        if day and entry.is_file():
+                            days[day] = PRDEntry(day, Path(entry.path))
+            except FileNotFoundError:
+                if not days:
+                    raise
+        count('dirs_scanned')
+        self._days = days
+
+    def refresh(self):
+        """Forget the index; it is rebuilt on the next lookup."""
+        self._days = None
+
+    def get(self, day):
+        """PRDEntry of day (YYYYMMDD), or None."""
+        if self._days is None:
+            self._build()
+        return self._days.get(day)
+
+    def entries(self, date_from=None, date_to=None):
+        """PRDEntry of every day in [date_from, date_to], sorted by day."""
+        if self._days is None:
+            self._build()
+        return [
+            self._days[day] for day in sorted(self._days)
+            if (not date_from or day >= date_from) and (not date_to or day <= date_to)
+        ]
+
+
+def open_storage(prd_dir, archive_dir=None):
+    """Process-wide PRDStorage of a PRD_DOCUMENTS/ARCHIVES pair."""
+    key = (str(Path(prd_dir).expanduser().resolve()),
+           str(Path(archive_dir or DEFAULT_ARCHIVE_DIR).expanduser().resolve()))
+    if key not in _storages:
+        _storages[key] = PRDStorage(prd_dir, archive_dir)
+    return _storages[key]
+
+
+def add_io_arguments(parser):
+    """Add the --io-workers option (reads in flight in range and batch modes)."""
+    parser.add_argument('--io-workers', type=int, default=DEFAULT_IO_WORKERS, metavar='N',
+                        help=f'Lecturas simultáneas en modo rango/lote; sube el valor en carpetas de red '
+                             f'o sincronizadas (default: {DEFAULT_IO_WORKERS})')
+
+
+def add_storage_arguments(parser):
+    """Add the --archives option to an argparse parser."""
+    parser.add_argument('--archives', default=None, metavar='DIR',
+                        help=f'Carpeta ARCHIVES donde buscar los días archivados (default: {DEFAULT_ARCHIVE_DIR})')
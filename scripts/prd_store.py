@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+PRD Task Store
+Base de datos SQLite local con el historial completo de PRD diarios.
+
+El comando `index` ingiere todos los PRD_YYYYMMDD.md de PRD_DOCUMENTS y
+los archivados en ARCHIVES (ver prd_archive.py) en tablas de días, tareas y
+archivos. La ingesta es incremental: un archivo
+con el mismo mtime y tamaño no se vuelve a leer, y uno con el mismo hash de
+contenido no se vuelve a parsear (un PRD archivado se compara por el hash
+del índice de ARCHIVES, sin descomprimirlo). Todas las inserciones de una ejecución
+van en una única transacción.
+
+El comando `search` busca en títulos, descripciones y soluciones de todas
+las tareas con un índice de texto completo (SQLite FTS5), ordenando por
+relevancia. Antes de buscar actualiza el índice con los PRD nuevos.
+
+Los generadores pueden leer del almacén en lugar del markdown con
+--from-store.
+
+Uso:
+    python prd_store.py index [--path ./PRD_DOCUMENTS] [--db ./prd_store.sqlite] [--prune]
+    python prd_store.py search "texto" [--from YYYYMMDD] [--to YYYYMMDD] [--status completada|pendiente]
+
+Ejemplos:
+    python prd_store.py index                       # Indexa PRD_DOCUMENTS
+    python prd_store.py index --prune               # Y borra días cuyo PRD ya no existe (ni archivado)
+    python prd_store.py search "certificado vpn"    # ¿Cuándo se arregló el certificado?
+    python prd_store.py search proxmox --status pendiente --from 20260101
+"""
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+from prd_build import hash_bytes
+from prd_config import load_config
+from prd_core import (
+    PARSER_VERSION, PRD, STATUS_COMPLETED, STATUS_PENDING, Diagnostic, Task,
+    parse_prd, prd_file_date, read_sidecar, set_parse_cache, task_durations,
+)
+from prd_storage import add_storage_arguments, load_entry, open_storage
+from prd_trace import add_trace_arguments, setup_trace
+
+# Load configuration
+DEFAULT_PRD_DIR = "~/Documents/prd_diarios/PRD_DOCUMENTS"
+DEFAULT_REPORTS_DIR = "~/Documents/prd_diarios/REPORTS"
+
+config = load_config()
+if config:
+    try:
+        folders = config.get("folders", {})
+        DEFAULT_PRD_DIR = os.path.expanduser(folders.get("prd_documents", DEFAULT_PRD_DIR))
+        DEFAULT_REPORTS_DIR = os.path.expanduser(folders.get("reports", DEFAULT_REPORTS_DIR))
+    except Exception:
+        pass
+
+STORE_FILENAME = "prd_store.sqlite"
+DEFAULT_DB_PATH = os.path.join(DEFAULT_REPORTS_DIR, STORE_FILENAME)
+
+# Bump when what is stored for a day changes (columns, durations...). The
+# indexed days are dropped when this or PARSER_VERSION differs from the
+# versions that filled the store.
+STORE_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    day TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS days (
+    day TEXT PRIMARY KEY,
+    date_label TEXT NOT NULL,
+    completed INTEGER NOT NULL,
+    pending INTEGER NOT NULL,
+    total_minutes INTEGER NOT NULL,
+    summary TEXT NOT NULL,
+    notes TEXT NOT NULL,
+    diagnostics TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    day TEXT NOT NULL REFERENCES days(day) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    number TEXT NOT NULL,
+    title TEXT NOT NULL,
+    time TEXT NOT NULL,
+    status TEXT NOT NULL,
+    emoji TEXT NOT NULL,
+    description TEXT NOT NULL,
+    solution TEXT NOT NULL,
+    state TEXT NOT NULL,
+    duration_minutes INTEGER NOT NULL,
+    line INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_by_day ON tasks(day, position);
+CREATE INDEX IF NOT EXISTS tasks_by_status ON tasks(status, day);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Full-text index over tasks, kept in sync by triggers. remove_diacritics
+# lets "solucion" match "Solución".
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    title, description, solution,
+    content='tasks', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_fts(rowid, title, description, solution)
+    VALUES (new.id, new.title, new.description, new.solution);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+    INSERT INTO tasks_fts(tasks_fts, rowid, title, description, solution)
+    VALUES ('delete', old.id, old.title, old.description, old.solution);
+END;
+"""
+
+# bm25 weights of title, description and solution
+FTS_WEIGHTS = (10.0, 2.0, 2.0)
+
+
+class TaskStore:
+    """SQLite store of days, tasks and source files.
+
+    Also usable as the load_prd() cache (get/put), which is how the
+    generators read from the store instead of parsing markdown.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        import sqlite3
+
+        self.db_path = Path(db_path).expanduser()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+        self.fts = self._setup_fts()
+        self._check_version()
+
+    def _setup_fts(self):
+        """Create the full-text index; False if SQLite lacks FTS5."""
+        import sqlite3
+
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'").fetchone()
+        try:
+            self.conn.executescript(FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            return False
+        if not exists:
+            # Store created before the index existed: fill it once
+            with self.conn:
+                self.conn.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+        return True
+
+    def _check_version(self):
+        """Forget every indexed day if the store was filled by another parser
+        or store version: its models would be stale. The next index (or
+        load_prd through get/put) fills it again."""
+        version = f"{STORE_VERSION}.{PARSER_VERSION}"
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row and row[0] == version:
+            return
+        with self.conn:
+            self.conn.execute("DELETE FROM tasks")
+            self.conn.execute("DELETE FROM days")
+            # Recreated: its columns may have changed with STORE_VERSION
+            self.conn.execute("DROP TABLE files")
+        self.conn.executescript(SCHEMA)
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (version,))
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    # -- ingestion ---------------------------------------------------------
+
+    def _replace_day(self, day, prd):
+        """Replace the rows of one day with the content of prd."""
+        durations = task_durations([task.minutes for task in prd.tasks])
+        self._delete_day(day)
+        self.conn.execute(
+            "INSERT INTO days VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (day, prd.date, len(prd.completed_tasks), len(prd.pending_tasks),
+             sum(durations),
+             json.dumps(prd.summary, ensure_ascii=False), prd.notes,
+             json.dumps([[d.line, d.message] for d in prd.diagnostics], ensure_ascii=False))
+        )
+        self.conn.executemany(
+            "INSERT INTO tasks (day, position, number, title, time, status, emoji, "
+            "description, solution, state, duration_minutes, line) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (day, position, t.number, t.name, t.time, t.status, t.emoji,
+                 t.description, t.solution, t.state, duration, t.line)
+                for position, (t, duration) in enumerate(zip(prd.tasks, durations))
+            ]
+        )
+
+    def _delete_day(self, day):
+        # Tasks first, explicitly, so the full-text triggers see every row
+        self.conn.execute("DELETE FROM tasks WHERE day = ?", (day,))
+        self.conn.execute("DELETE FROM days WHERE day = ?", (day,))
+
+    def _upsert_file(self, path, day, stat, sha256):
+        """Record a source file; stat is None for an archived PRD (its path
+        no longer exists, so get() never matches it)."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (str(path), day, stat.st_mtime_ns if stat else 0, stat.st_size if stat else 0,
+             stat.st_ino if stat else 0, sha256, time.time())
+        )
+
+    def index(self, prd_dir=DEFAULT_PRD_DIR, prune=False, archive_dir=None):
+        """Ingest the live and archived PRDs of prd_dir incrementally, in one
+        transaction.
+
+        With prune, days whose PRD is neither live nor archived are removed.
+        Returns a dict of counters: added, updated, unchanged, touched
+        (same content, new mtime) and removed.
+        """
+        stats = {'added': 0, 'updated': 0, 'unchanged': 0, 'touched': 0, 'removed': 0}
+        known = {
+            path: (mtime_ns, size, ino, sha256)
+            for path, mtime_ns, size, ino, sha256 in self.conn.execute(
+                "SELECT path, mtime_ns, size, ino, sha256 FROM files")
+        }
+        seen = set()
+
+        storage = open_storage(prd_dir, archive_dir)
+        # The storage index is per process; a day may have been archived since
+        storage.refresh()
+
+        with self.conn:
+            for entry in storage.entries():
+                path = str(entry.path.resolve())
+                seen.add(path)
+                previous = known.get(path)
+                if entry.archived:
+                    if previous and previous[3] == entry.sha256:
+                        stats['unchanged'] += 1
+                        continue
+                    self._replace_day(entry.day, load_entry(entry, remember=False))
+                    self._upsert_file(path, entry.day, None, entry.sha256)
+                    stats['updated' if previous else 'added'] += 1
+                    continue
+
+                stat = os.stat(path)
+                if previous and previous[:3] == (stat.st_mtime_ns, stat.st_size, stat.st_ino):
+                    stats['unchanged'] += 1
+                    continue
+
+                with open(path, 'rb') as f:
+                    data = f.read()
+                sha256 = hash_bytes(data)
+                if previous and previous[3] == sha256:
+                    stats['touched'] += 1
+                else:
+                    prd = read_sidecar(entry.path, sha256) or parse_prd(data.decode('utf-8'))
+                    self._replace_day(entry.day, prd)
+                    stats['updated' if previous else 'added'] += 1
+                self._upsert_file(path, entry.day, stat, sha256)
+
+            if prune:
+                for path in known.keys() - seen:
+                    if os.path.exists(path):
+                        continue
+                    row = self.conn.execute("SELECT day FROM files WHERE path = ?", (path,)).fetchone()
+                    self.conn.execute("DELETE FROM files WHERE path = ?", (path,))
+                    self._delete_day(row[0])
+                    stats['removed'] += 1
+
+        return stats
+
+    # -- reading -----------------------------------------------------------
+
+    def load_day(self, day):
+        """Rebuild the PRD model of a day (YYYYMMDD), or None if not indexed."""
+        row = self.conn.execute(
+            "SELECT date_label, summary, notes, diagnostics FROM days WHERE day = ?",
+            (day,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        date_label, summary, notes, diagnostics = row
+        tasks = [
+            Task(number=number, name=title, time=time_str, status=status, emoji=emoji,
+                 description=description, solution=solution, state=state, line=line)
+            for number, title, time_str, status, emoji, description, solution, state, line
+            in self.conn.execute(
+                "SELECT number, title, time, status, emoji, description, solution, state, line "
+                "FROM tasks WHERE day = ? ORDER BY position", (day,))
+        ]
+        return PRD(
+            date=date_label,
+            summary=json.loads(summary),
+            tasks=tasks,
+            notes=notes,
+            diagnostics=[Diagnostic(line, message) for line, message in json.loads(diagnostics)]
+        )
+
+    def search(self, query, date_from=None, date_to=None, status=None, limit=20):
+        """Ranked full-text search over task titles, descriptions and solutions.
+
+        Every word of query must appear (as a prefix) in the task. Returns
+        dicts with day, number, title, time, status, emoji and a snippet,
+        best match first.
+        """
+        terms = [term.replace('"', '') for term in query.split()]
+        terms = [term for term in terms if term]
+        if not terms:
+            return []
+
+        filters = []
+        params = []
+        if date_from:
+            filters.append("t.day >= ?")
+            params.append(date_from)
+        if date_to:
+            filters.append("t.day <= ?")
+            params.append(date_to)
+        if status:
+            filters.append("t.status = ?")
+            params.append(status)
+
+        if self.fts:
+            where = ["tasks_fts MATCH ?"] + filters
+            params = [' '.join(f'"{term}"*' for term in terms)] + params
+            sql = (
+                "SELECT t.day, t.number, t.title, t.time, t.status, t.emoji, "
+                "snippet(tasks_fts, -1, '[', ']', '…', 12) "
+                "FROM tasks_fts JOIN tasks t ON t.id = tasks_fts.rowid "
+                f"WHERE {' AND '.join(where)} "
+                f"ORDER BY bm25(tasks_fts, {', '.join(map(str, FTS_WEIGHTS))}), t.day DESC "
+                "LIMIT ?"
+            )
+        else:
+            # Without FTS5: unranked substring match, newest first
+            where = ["(t.title || ' ' || t.description || ' ' || t.solution) LIKE ?"] * len(terms) + filters
+            params = [f"%{term}%" for term in terms] + params
+            sql = (
+                "SELECT t.day, t.number, t.title, t.time, t.status, t.emoji, substr(t.description, 1, 120) "
+                f"FROM tasks t WHERE {' AND '.join(where)} "
+                "ORDER BY t.day DESC, t.position LIMIT ?"
+            )
+
+        rows = self.conn.execute(sql, params + [limit]).fetchall()
+        return [
+            {'day': day, 'number': number, 'title': title, 'time': time_str,
+             'status': status, 'emoji': emoji, 'snippet': ' '.join(snippet.split())}
+            for day, number, title, time_str, status, emoji, snippet in rows
+        ]
+
+    def get(self, path, stat):
+        """load_prd() hook: the stored model if path is indexed and unchanged
+        (same size, mtime and inode, as in prd_core._stat_key)."""
+        row = self.conn.execute(
+            "SELECT day FROM files WHERE path = ? AND mtime_ns = ? AND size = ? AND ino = ?",
+            (str(path), stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        ).fetchone()
+        return self.load_day(row[0]) if row else None
+
+    def put(self, path, stat, prd):
+        """load_prd() hook: index a PRD file that was just parsed."""
+        day = prd_file_date(Path(path).name)
+        if day is None:
+            return
+        with open(path, 'rb') as f:
+            sha256 = hash_bytes(f.read())
+        with self.conn:
+            self._replace_day(day, prd)
+            self._upsert_file(path, day, stat, sha256)
+
+
+def add_store_arguments(parser):
+    """Add the --from-store option to a generator's argparse parser."""
+    parser.add_argument('--from-store', nargs='?', const=DEFAULT_DB_PATH, default=None,
+                        metavar='DB', help=f'Leer los PRD del almacén SQLite (default: {DEFAULT_DB_PATH})')
+
+
+def setup_store(args):
+    """Make load_prd() read from the task store if --from-store was given."""
+    if not args.from_store:
+        return None
+    store = TaskStore(args.from_store)
+    set_parse_cache(store)
+    return store
+
+
+def parse_day(value):
+    """argparse type for YYYYMMDD dates."""
+    try:
+        datetime.strptime(value, "%Y%m%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Formato de fecha inválido: {value}. Use YYYYMMDD")
+    return value
+
+
+def print_results(results):
+    for result in results:
+        day = result['day']
+        print(f"{day[:4]}-{day[4:6]}-{day[6:]}  {result['emoji']} {result['number']}. "
+              f"{result['title']} — {result['time']}")
+        if result['snippet']:
+            print(f"      {result['snippet']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Almacén SQLite con el historial de PRD diarios",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python prd_store.py index                 # Indexa PRD_DOCUMENTS
+  python prd_store.py index --prune         # Y borra días cuyo PRD ya no existe (ni archivado)
+  python prd_store.py search "certificado vpn"
+  python prd_store.py search proxmox --status pendiente --from 20260101
+        """
+    )
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help=f'Base de datos (default: {DEFAULT_DB_PATH})')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    index_parser = subparsers.add_parser('index', help='Ingerir PRD en el almacén')
+    index_parser.add_argument('--path', default=DEFAULT_PRD_DIR, help=f'Carpeta PRD_DOCUMENTS (default: {DEFAULT_PRD_DIR})')
+    index_parser.add_argument('--prune', action='store_true', help='Eliminar días cuyo PRD ya no existe (ni vivo ni archivado)')
+    add_storage_arguments(index_parser)
+
+    search_parser = subparsers.add_parser('search', help='Buscar tareas en el historial')
+    search_parser.add_argument('query', help='Palabras a buscar (todas deben aparecer)')
+    search_parser.add_argument('--from', dest='date_from', type=parse_day, help='Primera fecha (YYYYMMDD)')
+    search_parser.add_argument('--to', dest='date_to', type=parse_day, help='Última fecha (YYYYMMDD)')
+    search_parser.add_argument('--status', choices=[STATUS_COMPLETED, STATUS_PENDING], help='Filtrar por estado')
+    search_parser.add_argument('--limit', type=int, default=20, help='Máximo de resultados (default: 20)')
+    search_parser.add_argument('--path', default=DEFAULT_PRD_DIR, help=f'Carpeta PRD_DOCUMENTS (default: {DEFAULT_PRD_DIR})')
+    search_parser.add_argument('--no-update', action='store_true', help='No actualizar el índice antes de buscar')
+    add_storage_arguments(search_parser)
+
+    add_trace_arguments(parser)
+
+    args = parser.parse_args(argv)
+    setup_trace(args)
+    store = TaskStore(args.db)
+
+    if args.command == 'index':
+        started = time.perf_counter()
+        try:
+            stats = store.index(args.path, args.prune, args.archives)
+        except OSError as e:
+            print(f"❌ Error: {e}")
+            return 1
+        elapsed = time.perf_counter() - started
+        print(f"✅ Índice actualizado en {elapsed:.2f}s: {store.db_path}")
+        print(f"   - Nuevos: {stats['added']}")
+        print(f"   - Actualizados: {stats['updated']}")
+        print(f"   - Sin cambios: {stats['unchanged'] + stats['touched']}")
+        if args.prune:
+            print(f"   - Eliminados: {stats['removed']}")
+
+    elif args.command == 'search':
+        if not args.no_update and Path(args.path).expanduser().is_dir():
+            store.index(Path(args.path).expanduser(), archive_dir=args.archives)
+        started = time.perf_counter()
+        results = store.search(args.query, args.date_from, args.date_to, args.status, args.limit)
+        elapsed = (time.perf_counter() - started) * 1000
+        if not results:
+            print(f"⚠️  Sin resultados para: {args.query}")
+        else:
+            print_results(results)
+            print(f"\n🔎 {len(results)} resultado(s) en {elapsed:.1f} ms")
+
+    store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,259 @@
+"""
+PRD Trace
+Trazas de rendimiento comunes a todos los scripts: tramos de tiempo (carga
+de configuración, recorrido de carpetas, lectura, parseo, render, escritura)
+y contadores (archivos consultados, bytes leídos, tareas parseadas), que se
+guardan en un archivo JSON al terminar.
+
+Se activa con --profile en cualquier script o con la variable de entorno
+PRDDIARIO_TRACE, cuyo valor es una lista separada por comas de:
+- 1 / on        activar la traza
+- cpu           añadir un perfil cProfile (.prof y las 25 funciones más caras)
+- memory        añadir una instantánea de tracemalloc
+- RUTA.json     archivo de salida
+
+Con la traza desactivada span() devuelve un objeto vacío compartido y
+count() solo comprueba una variable global, así que el coste es despreciable.
+
+Uso:
+    from prd_trace import count, span
+
+    with span('parse', file=name):
+        prd = parse_prd(content)
+    count('tasks_parsed', len(prd.tasks))
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+ENV_VAR = 'PRDDIARIO_TRACE'
+TRACE_VERSION = 1
+TOP_FUNCTIONS = 25
+TOP_ALLOCATIONS = 25
+
+# Reference point for the 'startup' span: imports and config loading
+_IMPORTED_AT = time.perf_counter()
+
+_tracer = None
+# span() and count() are also called from reader threads (prd_scan, prd_aio)
+_count_lock = threading.Lock()
+
+
+class _NoSpan:
+    """Shared do-nothing context manager returned while tracing is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _Span:
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        # Nesting depth is per thread
+        self.depth = getattr(self.tracer.local, 'depth', 0)
+        self.tracer.local.depth = self.depth + 1
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        self.tracer.local.depth = self.depth
+        record = {
+            'name': self.name,
+            'start_ms': round((self.start - self.tracer.started) * 1000, 3),
+            'duration_ms': round((end - self.start) * 1000, 3),
+            'depth': self.depth,
+        }
+        if self.attrs:
+            record['attrs'] = self.attrs
+        self.tracer.spans.append(record)
+        return False
+
+
+class Tracer:
+    """Collects spans and counters of one process and writes them as JSON."""
+
+    def __init__(self, path, cpu=False, memory=False, script=None):
+        self.path = Path(path)
+        self.script = script or Path(sys.argv[0]).stem
+        self.started = time.perf_counter()
+        self.wall_started = datetime.now()
+        self.spans = []
+        self.counters = {}
+        self.local = threading.local()
+        self.profiler = None
+        self.memory = memory
+
+        # Everything before tracing was switched on: imports and config
+        self.spans.append({
+            'name': 'startup',
+            'start_ms': round((_IMPORTED_AT - self.started) * 1000, 3),
+            'duration_ms': round((self.started - _IMPORTED_AT) * 1000, 3),
+            'depth': 0,
+        })
+
+        if cpu:
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        if memory:
+            import tracemalloc
+            tracemalloc.start()
+
+    def span(self, name, attrs):
+        return _Span(self, name, attrs)
+
+    def finish(self):
+        """Stop the profilers and write the trace file. Returns its path."""
+        trace = {
+            'version': TRACE_VERSION,
+            'script': self.script,
+            'argv': sys.argv[1:],
+            'started': self.wall_started.isoformat(timespec='seconds'),
+            'duration_ms': round((time.perf_counter() - self.started) * 1000, 3),
+            'counters': dict(sorted(self.counters.items())),
+            'spans': sorted(self.spans, key=lambda s: s['start_ms']),
+        }
+
+        totals = {}
+        for record in self.spans:
+            totals[record['name']] = totals.get(record['name'], 0) + record['duration_ms']
+        trace['totals_ms'] = {name: round(ms, 3) for name, ms in sorted(totals.items())}
+
+        if self.profiler:
+            self.profiler.disable()
+            trace['cpu'] = self._cpu_profile()
+        if self.memory:
+            trace['memory'] = self._memory_snapshot()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, indent=1, ensure_ascii=False)
+        return self.path
+
+    def _cpu_profile(self):
+        import pstats
+
+        prof_path = self.path.with_suffix('.prof')
+        self.profiler.dump_stats(str(prof_path))
+        stats = pstats.Stats(self.profiler)
+        rows = []
+        for (file, line, function), (calls, _, own, cumulative, _) in stats.stats.items():
+            rows.append({
+                'function': f"{Path(file).name}:{line}({function})",
+                'calls': calls,
+                'own_ms': round(own * 1000, 3),
+                'cumulative_ms': round(cumulative * 1000, 3),
+            })
+        rows.sort(key=lambda r: r['cumulative_ms'], reverse=True)
+        return {'prof_file': str(prof_path), 'top': rows[:TOP_FUNCTIONS]}
+
+    def _memory_snapshot(self):
+        import tracemalloc
+
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        top = snapshot.statistics('lineno')[:TOP_ALLOCATIONS]
+        return {
+            'current_kb': round(current / 1024, 1),
+            'peak_kb': round(peak / 1024, 1),
+            'top': [
+                {'location': f"{Path(s.traceback[0].filename).name}:{s.traceback[0].lineno}",
+                 'size_kb': round(s.size / 1024, 1), 'count': s.count}
+                for s in top
+            ],
+        }
+
+
+def span(name, **attrs):
+    """Context manager timing a block; a shared no-op when tracing is off."""
+    if _tracer is None:
+        return _NO_SPAN
+    return _tracer.span(name, attrs)
+
+
+def count(name, amount=1):
+    """Add amount to a counter of the trace (no-op when tracing is off)."""
+    if _tracer is not None:
+        with _count_lock:
+            _tracer.counters[name] = _tracer.counters.get(name, 0) + amount
+
+
+def enabled():
+    return _tracer is not None
+
+
+def default_trace_path(script):
+    return Path.cwd() / f"prd_trace_{script}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+
+
+def start_trace(path=None, cpu=False, memory=False, script=None):
+    """Switch tracing on for this process; the trace is written at exit."""
+    global _tracer
+    if _tracer is not None:
+        return _tracer
+    script = script or Path(sys.argv[0]).stem
+    _tracer = Tracer(path or default_trace_path(script), cpu, memory, script)
+    atexit.register(_finish)
+    return _tracer
+
+
+def _finish():
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is None:
+        return
+    try:
+        path = tracer.finish()
+        print(f"📊 Traza guardada en {path}", file=sys.stderr)
+    except OSError as e:
+        print(f"⚠️  No se pudo guardar la traza: {e}", file=sys.stderr)
+
+
+def _options_from_env(value):
+    """Parse PRDDIARIO_TRACE into (path, cpu, memory), or None if off."""
+    items = [item.strip() for item in value.split(',') if item.strip()]
+    if not items or items == ['0'] or items[0].lower() in ('off', 'false', 'no'):
+        return None
+    path = next((item for item in items if item.endswith('.json')), None)
+    return path, 'cpu' in items, 'memory' in items
+
+
+def add_trace_arguments(parser):
+    """Add --profile, --profile-cpu and --profile-memory to an argparse parser."""
+    parser.add_argument('--profile', nargs='?', const='', default=None, metavar='TRACE.json',
+                        help=f'Guardar una traza de rendimiento en JSON (también con {ENV_VAR}=1)')
+    parser.add_argument('--profile-cpu', action='store_true', help='Añadir a la traza un perfil cProfile')
+    parser.add_argument('--profile-memory', action='store_true', help='Añadir a la traza una instantánea de tracemalloc')
+
+
+def setup_trace(args):
+    """Start tracing if --profile (or --profile-cpu/--profile-memory) was given."""
+    if args.profile is not None or args.profile_cpu or args.profile_memory:
+        start_trace(args.profile or None, args.profile_cpu, args.profile_memory)
+    return _tracer
+
+
+# PRDDIARIO_TRACE switches tracing on at import time, so the config loading
+# of the script that imported this module is traced too.
+if os.environ.get(ENV_VAR):
+    _env_options = _options_from_env(os.environ[ENV_VAR])
+    if _env_options:
+        start_trace(*_env_options)
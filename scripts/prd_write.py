@@ -0,0 +1,168 @@
+"""
+PRD Write
+Escritura segura de un PRD cuando varias sesiones (agentes, terminales,
+watch) escriben en el mismo día a la vez.
+
+- locked(path): bloqueo consultivo exclusivo (fcntl.flock; msvcrt en Windows)
+  sobre un archivo `.PRD_YYYYMMDD.md.lock` junto al PRD. Quien lo tiene lee,
+  modifica y escribe; los demás esperan con reintentos y espera exponencial
+  (con jitter) hasta un tiempo máximo
+- write_atomic(path, content): archivo temporal único en la misma carpeta y
+  os.replace(); los lectores ven el archivo anterior o el nuevo, nunca uno a
+  medias. El replace se reintenta si otro proceso tiene el destino abierto
+  (Windows, OneDrive, antivirus)
+
+El bloqueo va en un archivo aparte porque el replace cambia el inodo del PRD:
+un bloqueo sobre el propio PRD se quedaría en el archivo reemplazado. El
+archivo .lock no se borra nunca (borrarlo abriría una carrera entre quien lo
+suelta y quien lo espera).
+
+Uso:
+    from prd_write import locked, write_atomic
+
+    with locked(prd_path):
+        content = read(prd_path)
+        write_atomic(prd_path, edit(content))
+"""
+
+import os
+import stat
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from prd_trace import count, span
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Seconds a writer waits for the lock before giving up
+DEFAULT_LOCK_TIMEOUT = 30.0
+
+# Exponential backoff between attempts, in seconds
+RETRY_DELAY = 0.001
+MAX_RETRY_DELAY = 0.01
+
+# Attempts of os.replace() while the target is held open by another process
+REPLACE_ATTEMPTS = 10
+
+
+def backoff(attempt):
+    """Seconds to sleep before retry number attempt (0-based), with jitter
+    so waiting writers do not wake up in lockstep."""
+    return min(MAX_RETRY_DELAY, RETRY_DELAY * 2 ** attempt) * (0.5 + os.urandom(1)[0] / 510)
+
+
+def lock_path(path):
+    """Lock file guarding path: a hidden sibling, .NAME.lock."""
+    path = Path(path)
+    return path.with_name(f".{path.name}.lock")
+
+
+def _try_lock(f):
+    """Take the exclusive lock of open file f without blocking; False if
+    another process holds it."""
+    try:
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+    except BlockingIOError:
+        return False
+    except OSError:
+        if fcntl:
+            raise
+        # msvcrt reports a held lock as EACCES/EDEADLOCK
+        return False
+    return True
+
+
+def _unlock(f):
+    if fcntl:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def locked(path, timeout=DEFAULT_LOCK_TIMEOUT):
+    """Hold the exclusive write lock of path for the duration of the block.
+
+    Raises TimeoutError if another process keeps it longer than timeout
+    seconds. The lock is per open file, so threads of one process exclude
+    each other too.
+    """
+    path = Path(path)
+    with open(lock_path(path), 'a+b') as f:
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        with span('lock', file=path.name):
+            while not _try_lock(f):
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"{path.name} está bloqueado por otro proceso desde hace más de {timeout:g}s")
+                count('lock_waits')
+                time.sleep(backoff(attempt))
+                attempt += 1
+        count('locks')
+        try:
+            yield
+        finally:
+            _unlock(f)
+
+
+def temp_path(path):
+    """Temporary file name of this process next to path: same folder, so
+    os.replace() stays atomic, and never shared with another writer."""
+    path = Path(path)
+    return path.with_name(f".{path.name}.{os.getpid()}.{os.urandom(4).hex()}.tmp")
+
+
+def move_into_place(tmp_path, path):
+    """Replace path with the finished temporary file tmp_path, keeping the
+    permissions of the file it replaces."""
+    try:
+        os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+    except FileNotFoundError:
+        pass
+    for attempt in range(REPLACE_ATTEMPTS):
+        try:
+            os.replace(tmp_path, path)
+            return
+        except PermissionError:
+            if attempt == REPLACE_ATTEMPTS - 1:
+                raise
+            count('replace_retries')
+            time.sleep(backoff(attempt + 4))
+
+
+def replace_file(path, data):
+    """Replace path with data (bytes) through a temporary file of this
+    process in the same folder, so concurrent writers never share one.
+
+    The new file keeps the permissions of the one it replaces.
+    """
+    path = Path(path)
+    tmp_path = temp_path(path)
+    try:
+        with open(tmp_path, 'xb') as f:
+            f.write(data)
+        move_into_place(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_atomic(path, content):
+    """Replace path with content (str) in one step: readers see either the
+    old or the new file, never a half-written one."""
+    data = content.encode('utf-8')
+    path = Path(path)
+    with span('write', file=path.name):
+        replace_file(path, data)
+    count('files_written')
+    count('bytes_written', len(data))
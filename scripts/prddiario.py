@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+PRD Diario CLI
+Punto de entrada único para todos los scripts: un solo arranque del
+intérprete, config.json se lee una vez y solo se importan los módulos del
+comando elegido.
+
+Uso:
+    python prddiario.py <comando> [opciones]
+
+Comandos:
+    init-day       Crea la carpeta DAILY_WORK/YYMMDD y el PRD_YYYYMMDD.md del día
+    close-day      Horas, resumen y dashboard del día en una pasada (close_day.py)
+    add-task       Añade una tarea al PRD del día (prd_edit.py)
+    complete-task  Pasa una tarea pendiente a realizadas (prd_edit.py)
+    hours          Reporte de horas de un PRD o de un rango (generate_hours_report.py)
+    summary        Resumen del día (generate_day_summary.py)
+    dashboard      Dashboard HTML (generate_dashboard.py)
+    trends         Dashboard HTML de tendencias por semana, mes y año (generate_trend_dashboard.py)
+    store          Almacén SQLite: index / search (prd_store.py)
+    columns        Almacén columnar de horas para varios años: build / stats (prd_columns.py)
+    rollups        Totales por semana, mes y año: update / query / list (prd_rollups.py)
+    archive        Archiva semanas o meses terminados: pack / verify / list (prd_archive.py)
+    watch          Regenera reportes al cambiar un PRD (watch_reports.py)
+    setup          Asistente de configuración (setup_config.py)
+
+Ejemplos:
+    python prddiario.py init-day                      # Empezar el día
+    python prddiario.py add-task "Revisar correos" --time 09:00 --solution "Respondidos"
+    python prddiario.py complete-task 1 --solution "Hecho"
+    python prddiario.py close-day                     # Terminar el día
+    python prddiario.py hours PRD_20260216.md
+    python prddiario.py summary --date 20260216
+    python prddiario.py dashboard --all
+    python prddiario.py hours --help                  # Opciones de un comando
+"""
+
+import sys
+
+# command -> (module, description). Modules are imported only when their
+# command runs; each exposes main(argv), or the function named after a colon.
+COMMANDS = {
+    'init-day': (None, 'Crea la carpeta del día y su PRD'),
+    'add-task': ('prd_edit:add_task_main', 'Añade una tarea al PRD del día'),
+    'complete-task': ('prd_edit:complete_task_main', 'Pasa una tarea pendiente a realizadas'),
+    'close-day': ('close_day', 'Horas, resumen y dashboard del día en una pasada'),
+    'hours': ('generate_hours_report', 'Reporte de horas de un PRD o de un rango'),
+    'summary': ('generate_day_summary', 'Resumen del día'),
+    'dashboard': ('generate_dashboard', 'Dashboard HTML'),
+    'trends': ('generate_trend_dashboard', 'Dashboard HTML de tendencias por semana, mes y año'),
+    'store': ('prd_store', 'Almacén SQLite: index / search'),
+    'columns': ('prd_columns', 'Almacén columnar de horas para varios años: build / stats'),
+    'rollups': ('prd_rollups', 'Totales por semana, mes y año: update / query / list'),
+    'archive': ('prd_archive', 'Archiva semanas o meses terminados: pack / verify / list'),
+    'watch': ('watch_reports', 'Regenera reportes al cambiar un PRD'),
+    'setup': ('setup_config', 'Asistente de configuración'),
+}
+
+
+def init_day(argv=None):
+    """Create today's daily folder and PRD in one process."""
+    import argparse
+
+    import create_daily_folder
+    import create_daily_prd
+    from prd_trace import add_trace_arguments, setup_trace
+
+    parser = argparse.ArgumentParser(
+        prog="prddiario init-day",
+        description="Crear la carpeta del día (DAILY_WORK/YYMMDD) y su PRD_YYYYMMDD.md"
+    )
+    parser.add_argument('--date', help='Fecha en formato YYYYMMDD (default: hoy)')
+    parser.add_argument('--path', default=None,
+                        help=f'Carpeta DAILY_WORK (default: {create_daily_folder.DEFAULT_DAILY_WORK_DIR})')
+    parser.add_argument('--prd-path', default=None,
+                        help=f'Carpeta PRD_DOCUMENTS (default: {create_daily_prd.PRD_DOCUMENTS_DIR})')
+    add_trace_arguments(parser)
+
+    args = parser.parse_args(argv)
+    setup_trace(args)
+
+    try:
+        _, folder_path, success, message = create_daily_folder.create_daily_folder(args.date, args.path)
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return 1
+    if success:
+        print(f"✅ {message}: {folder_path}")
+    else:
+        print(f"❌ Error: {message}")
+        return 1
+
+    _, prd_path, success, message = create_daily_prd.create_prd(args.date, args.prd_path)
+    if success:
+        print(f"✅ {message}: {prd_path}")
+    elif message == "Archivo ya existe":
+        print(f"✅ PRD ya existe: {prd_path}")
+    else:
+        print(f"❌ Error: {message}")
+        return 1
+    return 0
+
+
+def print_usage():
+    print("Uso: prddiario <comando> [opciones]\n")
+    print("Comandos:")
+    for name, (_, description) in COMMANDS.items():
+        print(f"  {name:<14} {description}")
+    print("\nUsa 'prddiario <comando> --help' para ver las opciones de cada comando.")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ('-h', '--help'):
+        print_usage()
+        return 0 if argv else 2
+
+    command, rest = argv[0], argv[1:]
+    if command not in COMMANDS:
+        print(f"❌ Comando desconocido: {command}\n")
+        print_usage()
+        return 2
+
+    if command == 'init-day':
+        return init_day(rest)
+
+    module_name, _, function = COMMANDS[command][0].partition(':')
+    # argparse takes the program name from sys.argv[0]
+    sys.argv[0] = f"prddiario {command}"
+    module = __import__(module_name)
+    return getattr(module, function or 'main')(rest)
+
+
+if __name__ == "__main__":
+    exit(main())
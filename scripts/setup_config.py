@@ -18,6 +18,8 @@ import os
 from pathlib import Path
 from datetime import datetime
 
+from prd_trace import add_trace_arguments, setup_trace
+
 CONFIG_FILE = Path(__file__).parent.parent / "config.json"
 
 
@@ -241,7 +243,7 @@ def reset_config():
         print(tint('yellow', "⚠️  No hay configuración para resetear.\n"))
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Configurar rutas de PRD Diario",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -254,8 +256,10 @@ Ejemplos:
     )
     parser.add_argument('--reset', action='store_true', help='Resetear configuración')
     parser.add_argument('--show', action='store_true', help='Mostrar configuración actual')
+    add_trace_arguments(parser)
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    setup_trace(args)
     
     if args.reset:
         reset_config()
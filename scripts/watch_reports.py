@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Watch Reports
+Vigila PRD_DOCUMENTS y la carpeta DAILY_WORK/YYMMDD del día y regenera
+automáticamente el reporte de horas, el resumen y el dashboard afectados
+cuando cambia un archivo, y los totales por semana, mes y año de los días
+que cambiaron (prd_rollups.py).
+
+Funciona por sondeo (polling) con os.scandir, solo con la librería estándar:
+no necesita inotify ni dependencias externas. Entre sondeos el proceso
+duerme, así que el consumo de CPU en reposo es prácticamente nulo.
+
+Uso:
+    python watch_reports.py --watch [--interval 2] [--debounce 2]
+
+Ejemplos:
+    python watch_reports.py --watch                 # Vigila hasta Ctrl+C
+    python watch_reports.py --watch --interval 5    # Sondeo cada 5 segundos
+    python watch_reports.py                         # Una sola pasada y termina
+"""
+
+import argparse
+import os
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import generate_dashboard
+import generate_day_summary
+import generate_hours_report
+import prd_rollups
+from prd_cache import add_cache_arguments, setup_parse_cache
+from prd_core import prd_file_date
+from prd_scan import DEFAULT_MAX_DEPTH, iter_entries
+from prd_trace import add_trace_arguments, setup_trace
+
+# Every FULL_SCAN_EVERY polls all PRDs are stat'ed; in between only the
+# PRDs of the last HOT_DAYS days, which are the ones being edited.
+FULL_SCAN_EVERY = 30
+HOT_DAYS = 2
+
+
+def snapshot_prds(prd_dir, hot_from=None):
+    """Return {date: (mtime_ns, size)} for PRD_YYYYMMDD.md files.
+
+    One os.scandir pass; entries older than hot_from (YYYYMMDD) are skipped
+    without a stat call.
+    """
+    state = {}
+    try:
+        with os.scandir(prd_dir) as entries:
+            for entry in entries:
+                day = prd_file_date(entry.name)
+                if day is None or (hot_from and day < hot_from):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                state[day] = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        pass
+    return state
+
+
+def snapshot_folder(folder):
+    """Return {name: (mtime_ns, size)} for the files of a day folder, with
+    the same subfolders and ignore patterns as the daily summary."""
+    state = {}
+    try:
+        for name, entry in iter_entries(folder, DEFAULT_MAX_DEPTH, generate_day_summary.SUMMARY_IGNORE):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            state[name] = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        pass
+    return state
+
+
+def changed_keys(old, new):
+    """Keys added, removed or modified between two snapshots."""
+    return {key for key in old.keys() | new.keys() if old.get(key) != new.get(key)}
+
+
+def regenerate(days, summary_days, prd_dir, daily_dir, output_dir=None):
+    """Regenerate hours report and dashboard for days (YYYYMMDD) and the
+    summary for days | summary_days. Up-to-date outputs are skipped by the
+    build manifest."""
+    for day in sorted(days):
+        prd_file = Path(prd_dir) / f"PRD_{day}.md"
+        if not prd_file.exists():
+            continue
+
+        report_file, message = generate_hours_report.generate_report(prd_file, output_dir)
+        print(f"   {'✅' if report_file else '❌'} Horas: {message}")
+
+        try:
+            dashboard_file, diagnostics = generate_dashboard.generate_dashboard(prd_file, output_dir)
+            state = "al día" if diagnostics is None else "generado"
+            print(f"   ✅ Dashboard {state}: {dashboard_file}")
+        except Exception as e:
+            print(f"   ❌ Dashboard: {e}")
+
+    if days:
+        rollups_path = Path(output_dir) / prd_rollups.ROLLUPS_FILENAME if output_dir else None
+        try:
+            prd_rollups.update_days(sorted(days), prd_dir, rollups_path)
+            print("   ✅ Totales por periodo actualizados")
+        except (OSError, TimeoutError) as e:
+            print(f"   ❌ Totales por periodo: {e}")
+
+    for day in sorted(days | summary_days):
+        date_obj = datetime.strptime(day, "%Y%m%d")
+        report_path, analysis, error = generate_day_summary.generate_summary(
+            date_obj, daily_dir, output_dir, prd_dir=prd_dir)
+        if error:
+            print(f"   ⚠️  Resumen: {error}")
+        else:
+            state = "al día" if analysis is None else "generado"
+            print(f"   ✅ Resumen {state}: {report_path}")
+
+
+def watch(prd_dir, daily_dir, interval=2.0, debounce=2.0, output_dir=None, once=False):
+    """Poll the folders and regenerate affected reports until interrupted.
+
+    Changes are collected until no new change has been seen for `debounce`
+    seconds, so a burst of saves triggers a single regeneration.
+    """
+    prd_dir = Path(prd_dir).expanduser()
+    daily_dir = Path(daily_dir).expanduser()
+
+    today = datetime.now().strftime("%Y%m%d")
+    prd_state = snapshot_prds(prd_dir)
+    day_state = snapshot_folder(daily_dir / today[2:])
+
+    if once:
+        regenerate({today}, set(), prd_dir, daily_dir, output_dir)
+        return
+
+    print(f"👀 Vigilando {prd_dir} y {daily_dir / today[2:]} (Ctrl+C para salir)")
+    pending_days = set()
+    pending_summaries = set()
+    last_change = None
+    polls = 0
+
+    while True:
+        time.sleep(interval)
+        polls += 1
+
+        now = datetime.now()
+        if now.strftime("%Y%m%d") != today:
+            # Midnight: start watching the new day folder
+            today = now.strftime("%Y%m%d")
+            day_state = snapshot_folder(daily_dir / today[2:])
+
+        if polls % FULL_SCAN_EVERY == 0:
+            new_prd_state = snapshot_prds(prd_dir)
+            changed = changed_keys(prd_state, new_prd_state)
+        else:
+            hot_from = (now - timedelta(days=HOT_DAYS)).strftime("%Y%m%d")
+            new_hot = snapshot_prds(prd_dir, hot_from)
+            old_hot = {d: v for d, v in prd_state.items() if d >= hot_from}
+            changed = changed_keys(old_hot, new_hot)
+            new_prd_state = {d: v for d, v in prd_state.items() if d < hot_from}
+            new_prd_state.update(new_hot)
+        prd_state = new_prd_state
+
+        new_day_state = snapshot_folder(daily_dir / today[2:])
+        folder_changed = changed_keys(day_state, new_day_state)
+        day_state = new_day_state
+
+        if changed or folder_changed:
+            pending_days |= changed
+            if folder_changed:
+                pending_summaries.add(today)
+            last_change = time.monotonic()
+            continue
+
+        if last_change is not None and time.monotonic() - last_change >= debounce:
+            print(f"🔄 {now.strftime('%H:%M:%S')} Cambios en: {', '.join(sorted(pending_days | pending_summaries))}")
+            regenerate(pending_days, pending_summaries, prd_dir, daily_dir, output_dir)
+            pending_days = set()
+            pending_summaries = set()
+            last_change = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Regenerar reportes automáticamente cuando cambia un PRD",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Ejemplos:
+  python watch_reports.py --watch                 # Vigila hasta Ctrl+C
+  python watch_reports.py --watch --interval 5    # Sondeo cada 5 segundos
+  python watch_reports.py                         # Una sola pasada
+        """
+    )
+    parser.add_argument('--watch', action='store_true', help='Vigilar continuamente (sin esto se hace una sola pasada)')
+    parser.add_argument('--interval', type=float, default=2.0, help='Segundos entre sondeos (default: 2)')
+    parser.add_argument('--debounce', type=float, default=2.0, help='Segundos sin cambios antes de regenerar (default: 2)')
+    parser.add_argument('--prd-path', default=None, help=f'Carpeta PRD_DOCUMENTS (default: {generate_dashboard.DEFAULT_PRD_DIR})')
+    parser.add_argument('--path', default=None, help=f'Carpeta DAILY_WORK (default: {generate_day_summary.DEFAULT_BASE_DIR})')
+    parser.add_argument('--output', default=None, help='Carpeta de salida de los reportes (default: la de cada script)')
+    add_cache_arguments(parser)
+    add_trace_arguments(parser)
+
+    args = parser.parse_args(argv)
+    setup_trace(args)
+    setup_parse_cache(args, generate_day_summary.DEFAULT_REPORTS_DIR)
+
+    prd_dir = args.prd_path or generate_dashboard.DEFAULT_PRD_DIR
+    daily_dir = args.path or generate_day_summary.DEFAULT_BASE_DIR
+
+    try:
+        watch(prd_dir, daily_dir, args.interval, args.debounce, args.output, once=not args.watch)
+    except KeyboardInterrupt:
+        print("\n👋 Vigilancia detenida")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
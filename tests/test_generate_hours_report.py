@@ -0,0 +1,31 @@
+"""Regression tests for generate_hours_report."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from generate_hours_report import render_report
+from prd_core import parse_prd
+
+PRD = """# PRD - 16 de febrero de 2026 - Sprint 4
+
+## Tareas Realizadas
+
+### ✅ 1. Revisar correo — **09:00**
+
+**Descripción:** Bandeja de entrada
+"""
+
+
+class RenderReportTest(unittest.TestCase):
+
+    def test_header_with_trailing_text_keeps_date(self):
+        content, error = render_report(parse_prd(PRD))
+        self.assertIsNone(error)
+        self.assertIn("16 de febrero de 2026", content)
+
+
+if __name__ == "__main__":
+    unittest.main()
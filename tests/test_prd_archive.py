@@ -0,0 +1,145 @@
+"""Tests for the archive: pack, verify and list round trip."""
+
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import prd_archive
+from prd_archive import INDEX_FILENAME, ArchiveIndex, pack_period, verify_archive
+
+PRD_TEXT = """# PRD - {day}
+
+## Tareas Realizadas
+
+### ✅ 1. Revisar correo — **09:00**
+
+**Descripción**: Bandeja de entrada
+**Solución**: Respondidos
+"""
+
+DAYS = ("20240115", "20240131")
+
+
+class PackPeriodTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory(prefix="prd_archive_")
+        folder = Path(self.tmp.name)
+        self.prd_dir = folder / "PRD_DOCUMENTS"
+        self.daily_dir = folder / "DAILY_WORK"
+        self.reports_dir = folder / "REPORTS"
+        self.archive_dir = folder / "ARCHIVES"
+        for path in (self.prd_dir, self.daily_dir, self.reports_dir):
+            path.mkdir()
+        for day in DAYS:
+            (self.prd_dir / f"PRD_{day}.md").write_text(PRD_TEXT.format(day=day), encoding='utf-8')
+            (self.reports_dir / f"HORAS_PRD_{day}.md").write_text("# Horas\n", encoding='utf-8')
+            notes = self.daily_dir / day[2:] / "scripts"
+            notes.mkdir(parents=True)
+            (notes / "backup.sh").write_text("#!/bin/sh\n", encoding='utf-8')
+        # Outside the period: never touched
+        (self.prd_dir / "PRD_20240201.md").write_text(PRD_TEXT.format(day="20240201"), encoding='utf-8')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def pack(self, keep=False):
+        archive_path, sources, problems = pack_period(
+            "2024-01", "20240101", "20240131", self.prd_dir, self.daily_dir, self.reports_dir,
+            self.archive_dir, keep=keep)
+        self.assertEqual(problems, [])
+        return archive_path, sources
+
+    def run_main(self, *args):
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            code = prd_archive.main(['--archives', str(self.archive_dir), *args])
+        return code, out.getvalue()
+
+    def test_pack_moves_the_period_into_one_zip(self):
+        archive_path, sources = self.pack()
+        self.assertEqual(archive_path.name, "PRD_2024-01.zip")
+        with zipfile.ZipFile(archive_path) as zf:
+            names = set(zf.namelist())
+        self.assertEqual(names, {
+            "index.json",
+            "PRD_DOCUMENTS/PRD_20240115.md", "PRD_DOCUMENTS/PRD_20240131.md",
+            "REPORTS/HORAS_PRD_20240115.md", "REPORTS/HORAS_PRD_20240131.md",
+            "DAILY_WORK/240115/scripts/backup.sh", "DAILY_WORK/240131/scripts/backup.sh",
+        })
+        self.assertTrue(all(not path.exists() for _, path in sources))
+        self.assertEqual(list(self.daily_dir.iterdir()), [])
+        self.assertEqual(sorted(p.name for p in self.prd_dir.iterdir()), ["PRD_20240201.md"])
+
+    def test_keep_leaves_the_originals(self):
+        _, sources = self.pack(keep=True)
+        self.assertTrue(all(path.exists() for _, path in sources))
+
+    def test_index_lists_the_archive_and_verifies(self):
+        archive_path, _ = self.pack()
+        entry = ArchiveIndex(self.archive_dir).archives[archive_path.name]
+        self.assertEqual((entry['period'], entry['days']), ("2024-01", list(DAYS)))
+        self.assertEqual(verify_archive(archive_path, entry), [])
+        self.assertEqual(verify_archive(archive_path), [])
+
+        code, out = self.run_main('list')
+        self.assertEqual(code, 0)
+        self.assertIn("PRD_2024-01.zip", out)
+        self.assertEqual(self.run_main('verify')[0], 0)
+
+    def test_tampered_member_is_detected(self):
+        archive_path, _ = self.pack()
+        entry = ArchiveIndex(self.archive_dir).archives[archive_path.name]
+        tampered = archive_path.with_name("tampered.zip")
+        with zipfile.ZipFile(archive_path) as src, zipfile.ZipFile(tampered, 'w') as dst:
+            for info in src.infolist():
+                data = src.read(info)
+                if info.filename == "PRD_DOCUMENTS/PRD_20240115.md":
+                    data = data.replace(b"Respondidos", b"Borrados")
+                dst.writestr(info, data)
+        tampered.replace(archive_path)
+
+        self.assertEqual(verify_archive(archive_path, entry),
+                         ["Hash distinto en PRD_DOCUMENTS/PRD_20240115.md"])
+        code, out = self.run_main('verify')
+        self.assertEqual(code, 1)
+        self.assertIn("Hash distinto en PRD_DOCUMENTS/PRD_20240115.md", out)
+
+    def test_missing_and_extra_members_are_detected(self):
+        archive_path, _ = self.pack()
+        entry = ArchiveIndex(self.archive_dir).archives[archive_path.name]
+        entry['members']["PRD_DOCUMENTS/PRD_20240120.md"] = {'sha256': "0" * 64, 'size': 1}
+        del entry['members']["REPORTS/HORAS_PRD_20240131.md"]
+        self.assertEqual(verify_archive(archive_path, entry), [
+            "Falta PRD_DOCUMENTS/PRD_20240120.md",
+            "Archivo no indexado: REPORTS/HORAS_PRD_20240131.md",
+        ])
+
+    def test_existing_archive_is_not_overwritten(self):
+        self.pack(keep=True)
+        with self.assertRaises(ValueError):
+            self.pack(keep=True)
+
+    def test_current_period_is_refused(self):
+        with self.assertRaises(ValueError):
+            pack_period("2999-01", "29990101", "29990131", self.prd_dir, self.daily_dir,
+                        archive_dir=self.archive_dir)
+
+    def test_rebuild_restores_a_lost_index(self):
+        archive_path, _ = self.pack()
+        expected = ArchiveIndex(self.archive_dir).archives
+        (self.archive_dir / INDEX_FILENAME).unlink()
+
+        code, out = self.run_main('list', '--rebuild')
+        self.assertEqual(code, 0)
+        self.assertIn("PRD_2024-01.zip", out)
+        self.assertEqual(ArchiveIndex(self.archive_dir).archives, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""Tests for incremental builds: manifest freshness and skipped writes."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import generate_hours_report
+from prd_build import BuildManifest, MANIFEST_FILENAME, write_chunks_if_changed, write_if_changed
+from prd_core import clear_loaded
+
+PRD_TEXT = """# PRD - 16 de febrero de 2026
+
+## Tareas Realizadas
+
+### ✅ 1. Revisar correo — **09:00**
+
+**Descripción**: Bandeja de entrada
+**Solución**: Respondidos
+
+### ✅ 2. Desplegar — **10:30**
+
+**Descripción**: Versión 2
+**Solución**: Hecho
+"""
+
+
+class WriteIfChangedTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory(prefix="prd_build_")
+        self.folder = Path(self.tmp.name)
+        self.path = self.folder / "report.md"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_same_bytes_are_not_rewritten(self):
+        self.assertTrue(write_if_changed(self.path, "uno\n"))
+        inode = os.stat(self.path).st_ino
+        self.assertFalse(write_if_changed(self.path, "uno\n"))
+        self.assertEqual(os.stat(self.path).st_ino, inode)
+        self.assertTrue(write_if_changed(self.path, "dos\n"))
+        self.assertEqual(self.path.read_text(encoding='utf-8'), "dos\n")
+
+    def test_chunks_are_compared_like_whole_content(self):
+        self.assertTrue(write_chunks_if_changed(self.path, ["uno", "\n", "dos\n"]))
+        inode = os.stat(self.path).st_ino
+        self.assertFalse(write_chunks_if_changed(self.path, iter(["uno\ndos", "\n"])))
+        self.assertEqual(os.stat(self.path).st_ino, inode)
+        self.assertTrue(write_chunks_if_changed(self.path, ["uno\ntres\n"]))
+        self.assertEqual(self.path.read_text(encoding='utf-8'), "uno\ntres\n")
+        # No temporary file is left behind either way
+        self.assertEqual(sorted(p.name for p in self.folder.iterdir()), ["report.md"])
+
+
+class BuildManifestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory(prefix="prd_build_")
+        self.folder = Path(self.tmp.name)
+        self.artifact = self.folder / "report.md"
+        self.artifact.write_text("contenido\n", encoding='utf-8')
+        self.inputs = {'prd': 'hash-1', 'code': 'code-1'}
+        self.manifest = BuildManifest(self.folder / MANIFEST_FILENAME)
+        self.manifest.record(self.artifact, self.inputs)
+        self.manifest.save()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_fresh_after_record_and_reload(self):
+        self.assertTrue(BuildManifest(self.folder / MANIFEST_FILENAME).is_fresh(self.artifact, self.inputs))
+
+    def test_changed_inputs_are_stale(self):
+        self.assertFalse(self.manifest.is_fresh(self.artifact, {'prd': 'hash-2', 'code': 'code-1'}))
+        self.assertFalse(self.manifest.is_fresh(self.artifact, {'prd': 'hash-1', 'code': 'code-2'}))
+
+    def test_edited_or_missing_artifact_is_stale(self):
+        self.artifact.write_text("editado a mano\n", encoding='utf-8')
+        self.assertFalse(self.manifest.is_fresh(self.artifact, self.inputs))
+        self.artifact.unlink()
+        self.assertFalse(self.manifest.is_fresh(self.artifact, self.inputs))
+
+
+class HoursReportRebuildTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory(prefix="prd_build_")
+        folder = Path(self.tmp.name)
+        self.prd_path = folder / "PRD_20260216.md"
+        self.prd_path.write_text(PRD_TEXT, encoding='utf-8')
+        self.output = folder / "REPORTS"
+        clear_loaded()
+
+    def tearDown(self):
+        clear_loaded()
+        self.tmp.cleanup()
+
+    def generate(self):
+        report_file, message = generate_hours_report.generate_report(self.prd_path, self.output)
+        self.assertIsNotNone(report_file, message)
+        return Path(report_file), message
+
+    def test_unchanged_prd_skips_the_report(self):
+        report_file, _ = self.generate()
+        stat = os.stat(report_file)
+        _, message = self.generate()
+        self.assertEqual(message, "Reporte al día (PRD sin cambios)")
+        self.assertEqual(os.stat(report_file).st_mtime_ns, stat.st_mtime_ns)
+
+    def test_edit_that_does_not_change_the_hours_keeps_the_file(self):
+        report_file, _ = self.generate()
+        stat = os.stat(report_file)
+        self.prd_path.write_text(PRD_TEXT.replace("Versión 2", "Versión 2.1"), encoding='utf-8')
+        self.generate()
+        self.assertEqual(os.stat(report_file).st_ino, stat.st_ino)
+        self.assertEqual(os.stat(report_file).st_mtime_ns, stat.st_mtime_ns)
+
+    def test_edit_that_changes_the_hours_rewrites_the_file(self):
+        report_file, _ = self.generate()
+        self.prd_path.write_text(PRD_TEXT.replace("10:30", "11:00"), encoding='utf-8')
+        self.generate()
+        self.assertIn("**Horas trabajadas**: 3h 0m", report_file.read_text(encoding='utf-8'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Tests for the persistent parse cache: hits and every way to invalidate it."""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import prd_cache
+from prd_cache import ParseCache
+from prd_core import clear_loaded, load_prd, parse_prd, set_parse_cache
+
+PRD_TEXT = """# PRD - 16 de febrero de 2026
+
+## Tareas Realizadas
+
+### ✅ 1. Revisar correo — **09:00**
+
+**Descripción**: Bandeja de entrada
+**Solución**: Respondidos
+"""
+
+
+class ParseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory(prefix="prd_cache_")
+        folder = Path(self.tmp.name)
+        self.path = (folder / "PRD_20260216.md").resolve()
+        self.path.write_text(PRD_TEXT, encoding='utf-8')
+        self.db_path = folder / prd_cache.CACHE_FILENAME
+        self.cache = ParseCache(self.db_path)
+
+    def tearDown(self):
+        set_parse_cache(None)
+        clear_loaded()
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def replace_keeping_stat(self, content):
+        """Atomically replace the PRD with same-size content and the same
+        mtime, as two writes within one mtime tick would leave it."""
+        stat = os.stat(self.path)
+        tmp_path = self.path.with_name("replacement.tmp")
+        tmp_path.write_text(content, encoding='utf-8')
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(tmp_path, self.path)
+        return stat
+
+    def test_unchanged_file_is_a_hit(self):
+        stat = os.stat(self.path)
+        self.cache.put(self.path, stat, parse_prd(PRD_TEXT))
+        self.assertEqual(self.cache.get(self.path, os.stat(self.path)), parse_prd(PRD_TEXT))
+
+    def test_load_prd_reads_through_the_cache(self):
+        set_parse_cache(self.cache)
+        load_prd(self.path)
+        clear_loaded()
+        prd = load_prd(self.path)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(prd.tasks[0].name, "Revisar correo")
+
+    def test_modified_file_is_a_miss(self):
+        self.cache.put(self.path, os.stat(self.path), parse_prd(PRD_TEXT))
+        self.path.write_text(PRD_TEXT + "\n## Notas Adicionales\n\nMás\n", encoding='utf-8')
+        self.assertIsNone(self.cache.get(self.path, os.stat(self.path)))
+
+    def test_same_size_and_mtime_replace_is_a_miss(self):
+        self.cache.put(self.path, os.stat(self.path), parse_prd(PRD_TEXT))
+        old = self.replace_keeping_stat(PRD_TEXT.replace("correo", "CORREO"))
+        new = os.stat(self.path)
+        self.assertEqual((new.st_size, new.st_mtime_ns), (old.st_size, old.st_mtime_ns))
+        self.assertIsNone(self.cache.get(self.path, new))
+
+        set_parse_cache(self.cache)
+        self.assertEqual(load_prd(self.path).tasks[0].name, "Revisar CORREO")
+
+    def test_other_parser_version_is_a_miss(self):
+        self.cache.put(self.path, os.stat(self.path), parse_prd(PRD_TEXT))
+        with mock.patch.object(prd_cache, 'PARSER_VERSION', prd_cache.PARSER_VERSION + 1):
+            self.assertIsNone(self.cache.get(self.path, os.stat(self.path)))
+
+    def test_evict_stale_drops_deleted_and_changed_files(self):
+        self.cache.put(self.path, os.stat(self.path), parse_prd(PRD_TEXT))
+        other = self.path.with_name("PRD_20260217.md")
+        other.write_text(PRD_TEXT, encoding='utf-8')
+        self.cache.put(other, os.stat(other), parse_prd(PRD_TEXT))
+        kept = self.path.with_name("PRD_20260218.md")
+        kept.write_text(PRD_TEXT, encoding='utf-8')
+        self.cache.put(kept, os.stat(kept), parse_prd(PRD_TEXT))
+
+        other.unlink()
+        self.replace_keeping_stat(PRD_TEXT.replace("correo", "CORREO"))
+        self.assertEqual(self.cache.evict_stale(), 2)
+        self.assertIsNotNone(self.cache.get(kept, os.stat(kept)))
+
+    def test_cache_of_an_older_layout_is_recreated(self):
+        self.cache.close()
+        self.db_path.unlink()
+        conn = sqlite3.connect(str(self.db_path))
+        conn.executescript("CREATE TABLE entries (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, "
+                           "size INTEGER NOT NULL, version INTEGER NOT NULL, data TEXT NOT NULL);")
+        conn.close()
+
+        self.cache = ParseCache(self.db_path)
+        self.cache.put(self.path, os.stat(self.path), parse_prd(PRD_TEXT))
+        self.assertIsNotNone(self.cache.get(self.path, os.stat(self.path)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+"""Tests for the columnar time entries, with and without NumPy."""
+
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from prd_columns import ColumnsBuilder, TimeEntries, build_columns, load_numpy
+from prd_core import STATUS_COMPLETED, STATUS_PENDING, parse_prd
+
+PRD_TEXT = """# PRD - {day}
+
+## Tareas Realizadas
+
+### ✅ 1. Correo — **{first}**
+
+**Descripción**: Bandeja de entrada
+**Solución**: Respondidos
+
+### ✅ 2. Deploy — **{second}**
+
+**Descripción**: Versión 2
+**Solución**: Hecho
+"""
+
+PENDING_TEXT = """
+## Tareas Pendientes
+
+### ⏳ 1. Revisar — **11:00**
+
+**Descripción**: Logs
+**Estado**: Esperando acceso
+"""
+
+# Durations (the last task of a day counts 60 minutes):
+# 2024-02-12  Correo 90, Deploy 30, Revisar (pendiente) 60   2024-W07
+# 2024-02-20  Correo 60, Deploy 60                           2024-W08
+# 2024-03-01  Correo 240, Deploy 60                          2024-W09
+DAYS = {
+    "20240212": PRD_TEXT.format(day="20240212", first="09:00", second="10:30") + PENDING_TEXT,
+    "20240220": PRD_TEXT.format(day="20240220", first="09:00", second="10:00"),
+    "20240301": PRD_TEXT.format(day="20240301", first="08:00", second="12:00"),
+}
+
+
+class TimeEntriesTests:
+    """Queries shared by both engines; subclasses set use_numpy."""
+
+    use_numpy = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory(prefix="prd_columns_")
+        cls.path = Path(cls.tmp.name) / "prd_columns.bin"
+        builder = ColumnsBuilder()
+        for day, text in DAYS.items():
+            builder.add_day(date(int(day[:4]), int(day[4:6]), int(day[6:])), parse_prd(text))
+        builder.save(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def setUp(self):
+        self.entries = TimeEntries(self.path, use_numpy=self.use_numpy)
+
+    def tearDown(self):
+        self.entries.close()
+
+    def test_engine(self):
+        self.assertEqual(bool(self.entries.numpy), self.use_numpy is not False)
+        self.assertEqual(self.entries.rows, 7)
+
+    def test_total(self):
+        self.assertEqual(self.entries.total(), (600, 7))
+        self.assertEqual(self.entries.total("20240220", "20240301"), (420, 4))
+        self.assertEqual(self.entries.total(status=STATUS_PENDING), (60, 1))
+        self.assertEqual(self.entries.total("20240213", "20240219"), (0, 0))
+
+    def test_group_by_period(self):
+        self.assertEqual(self.entries.group('month'), {"2024-02": [300, 5], "2024-03": [300, 2]})
+        self.assertEqual(self.entries.group('week'),
+                         {"2024-W07": [180, 3], "2024-W08": [120, 2], "2024-W09": [300, 2]})
+        self.assertEqual(self.entries.group('day', "20240220", "20240220"), {"2024-02-20": [120, 2]})
+        self.assertEqual(self.entries.group('year', "20240213", "20240219"), {})
+
+    def test_group_by_status(self):
+        self.assertEqual(self.entries.group('month', status=STATUS_PENDING), {"2024-02": [60, 1]})
+        self.assertEqual(self.entries.group('week', status=STATUS_COMPLETED),
+                         {"2024-W07": [120, 2], "2024-W08": [120, 2], "2024-W09": [300, 2]})
+
+    def test_group_by_title(self):
+        self.assertEqual(self.entries.group('title'),
+                         {"Correo": [390, 3], "Deploy": [150, 3], "Revisar": [60, 1]})
+        self.assertEqual(self.entries.group('title', "20240220", status=STATUS_COMPLETED),
+                         {"Correo": [300, 2], "Deploy": [120, 2]})
+
+    def test_percentiles(self):
+        # Sorted durations: 30 60 60 60 60 90 240
+        for value, expected in zip(self.entries.percentiles([0, 50, 90, 100]), [30, 60, 150, 240]):
+            self.assertAlmostEqual(value, expected)
+        self.assertEqual(self.entries.percentiles([50], "20240301"), [150])
+        self.assertEqual(self.entries.percentiles([50], "20240213", "20240219"), [])
+
+
+@unittest.skipUnless(load_numpy(), "NumPy no está instalado")
+class NumpyTimeEntriesTest(TimeEntriesTests, unittest.TestCase):
+    use_numpy = None
+
+
+class MemoryviewTimeEntriesTest(TimeEntriesTests, unittest.TestCase):
+    use_numpy = False
+
+
+class BuildColumnsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory(prefix="prd_columns_")
+        folder = Path(self.tmp.name)
+        self.prd_dir = folder / "PRD_DOCUMENTS"
+        self.prd_dir.mkdir()
+        for day, text in DAYS.items():
+            (self.prd_dir / f"PRD_{day}.md").write_text(text, encoding='utf-8')
+        self.archive_dir = folder / "ARCHIVES"
+        self.path = folder / "REPORTS" / "prd_columns.bin"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_build_is_skipped_until_a_prd_changes(self):
+        self.assertEqual(build_columns(self.prd_dir, self.path, self.archive_dir), (self.path, 7, None))
+        self.assertEqual(build_columns(self.prd_dir, self.path, self.archive_dir), (self.path, None, None))
+        (self.prd_dir / "PRD_20240301.md").unlink()
+        self.assertEqual(build_columns(self.prd_dir, self.path, self.archive_dir), (self.path, 5, None))
+        with TimeEntries(self.path, use_numpy=False) as entries:
+            self.assertEqual(entries.total(), (300, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Tests for the prd_core parser: task blocks, diagnostics and the header."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from prd_core import STATUS_COMPLETED, STATUS_PENDING, PRD, parse_prd
+
+PRD_TEXT = """# PRD - 16 de febrero de 2026 - Sprint 4
+
+## Resumen Ejecutivo
+
+- **Fecha**: 16 de febrero de 2026
+- **Total de horas**: 2h 0m
+
+---
+
+## Tareas Realizadas
+
+### ✅ 1. Revisar correo — **09:00**
+
+**Descripción**: Bandeja de entrada
+**Solución**: Respondidos
+
+---
+
+### ✅ 2. Sin descripción — **10:00**
+
+**Solución**: Hecho
+
+### ✅ 3. Sin hora
+
+**Descripción**: No tiene **HH:MM**
+
+## Tareas Pendientes
+
+### ⏳ 1. Desplegar — **11:00**
+
+Texto suelto
+**Descripción**: Subir la versión
+**Estado**: Esperando aprobación
+
+### Título que no es tarea
+
+## Notas Adicionales
+
+Nada más
+"""
+
+
+class ParsePrdTest(unittest.TestCase):
+
+    def setUp(self):
+        self.prd = parse_prd(PRD_TEXT)
+
+    def test_header_keeps_trailing_text(self):
+        self.assertEqual(self.prd.date, "16 de febrero de 2026 - Sprint 4")
+
+    def test_tasks_and_fields(self):
+        self.assertEqual([(t.number, t.name, t.time, t.status) for t in self.prd.tasks], [
+            ("1", "Revisar correo", "09:00", STATUS_COMPLETED),
+            ("2", "Sin descripción", "10:00", STATUS_COMPLETED),
+            ("1", "Desplegar", "11:00", STATUS_PENDING),
+        ])
+        first, _, pending = self.prd.tasks
+        self.assertEqual(first.description, "Bandeja de entrada")
+        self.assertEqual(first.solution, "Respondidos")
+        self.assertEqual(pending.state, "Esperando aprobación")
+        self.assertEqual(self.prd.summary["Total de horas"], "2h 0m")
+        self.assertEqual(self.prd.notes, "Nada más")
+
+    def test_diagnostics_point_at_the_offending_lines(self):
+        lines = PRD_TEXT.splitlines()
+        self.assertEqual([(lines[d.line - 1], d.message) for d in self.prd.diagnostics], [
+            ("### ✅ 2. Sin descripción — **10:00**", "Tarea 2 sin sección **Descripción**"),
+            ("### ✅ 3. Sin hora", "Tarea 3 sin hora **HH:MM**"),
+            ("Texto suelto", "Texto fuera de sección en tarea 1"),
+            ("### Título que no es tarea", "Encabezado no reconocido: ### Título que no es tarea"),
+        ])
+
+    def test_missing_solution_and_state(self):
+        prd = parse_prd("## Tareas Realizadas\n\n### ✅ 1. A — **09:00**\n\n**Descripción**: x\n\n"
+                        "## Tareas Pendientes\n\n### ⏳ 1. B — **10:00**\n\n**Descripción**: y\n")
+        self.assertEqual([t.status for t in prd.tasks], [STATUS_COMPLETED, STATUS_PENDING])
+        self.assertEqual([d.message for d in prd.diagnostics],
+                         ["Tarea 1 sin sección **Solución**", "Tarea 1 sin sección **Estado**"])
+
+    def test_headings_inside_code_fences_are_text(self):
+        prd = parse_prd("## Tareas Realizadas\n\n### ✅ 1. A — **09:00**\n\n**Descripción**:\n"
+                        "```\n### ✅ 2. B — **10:00**\n**Solución**: no\n```\n**Solución**: sí\n")
+        self.assertEqual(len(prd.tasks), 1)
+        self.assertIn("### ✅ 2. B", prd.tasks[0].description)
+        self.assertEqual(prd.tasks[0].solution, "sí")
+        self.assertEqual(prd.diagnostics, [])
+
+    def test_model_round_trips_through_dict(self):
+        self.assertEqual(PRD.from_dict(self.prd.to_dict()), self.prd)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""Regression tests for prd_edit: editing a PRD in place."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import create_daily_prd
+import prd_edit
+from prd_core import parse_prd
+from prd_rollups import day_totals
+
+DAY = "20260216"
+
+
+class TotalHoursTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory(prefix="prd_edit_")
+        _, path, created, message = create_daily_prd.create_prd(DAY, self.tmp.name)
+        self.assertTrue(created, message)
+        self.path = Path(path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_completing_earlier_pending_task_keeps_time_order(self):
+        # Completed tasks end up out of time order in the document: the
+        # total must still follow the start times, not wrap past midnight
+        for name, time_str, pending in (("Correo", "09:00", False),
+                                        ("Despliegue", "10:30", True),
+                                        ("Revisión", "11:15", False)):
+            _, error = prd_edit.add_task(self.path, name, time_str, pending=pending)
+            self.assertIsNone(error)
+        _, error = prd_edit.complete_task(self.path, 1, solution="Hecho")
+        self.assertIsNone(error)
+
+        prd = parse_prd(self.path.read_text(encoding='utf-8'))
+        self.assertEqual([task.time for task in prd.completed_tasks], ["09:00", "11:15", "10:30"])
+        # 09:00-10:30, 10:30-11:15 and 60 minutes for the last task
+        self.assertEqual(prd.summary['Total de horas'], "3h 15m")
+        self.assertEqual(day_totals(prd)['minutes'], 195)
+
+
+if __name__ == "__main__":
+    unittest.main()
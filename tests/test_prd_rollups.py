@@ -0,0 +1,137 @@
+"""Tests for incremental rollups: days added, updated, removed and archived."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from prd_archive import pack_period
+from prd_rollups import Rollups, update_days, update_rollups
+
+PRD_TEXT = """# PRD - {day}
+
+## Tareas Realizadas
+
+### ✅ 1. Revisar correo — **09:00**
+
+**Descripción**: Bandeja de entrada
+**Solución**: Respondidos
+
+## Tareas Pendientes
+
+### ⏳ 1. Desplegar — **{time}**
+
+**Descripción**: Versión 2
+**Estado**: Esperando aprobación
+"""
+
+
+class UpdateRollupsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory(prefix="prd_rollups_")
+        folder = Path(self.tmp.name)
+        self.prd_dir = folder / "PRD_DOCUMENTS"
+        self.prd_dir.mkdir()
+        self.daily_dir = folder / "DAILY_WORK"
+        self.archive_dir = folder / "ARCHIVES"
+        self.path = folder / "REPORTS" / "prd_rollups.json"
+        # Minutes: time - 09:00 for the first task, 60 for the last one
+        self.write("20240131", "10:00")   # 120, 2024-W05
+        self.write("20240212", "10:00")   # 120, 2024-W07
+        self.write("20240213", "11:00")   # 180, 2024-W07
+        self.write("20240220", "10:30")   # 150, 2024-W08
+        self.rollups, self.stats = self.update()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, day, time):
+        path = self.prd_dir / f"PRD_{day}.md"
+        path.write_text(PRD_TEXT.format(day=day, time=time), encoding='utf-8')
+        return path
+
+    def update(self, rebuild=False):
+        return update_rollups(self.prd_dir, self.path, self.archive_dir, rebuild=rebuild)
+
+    def totals(self, kind, key):
+        period = Rollups(self.path).period(kind, key)
+        return period and (period['minutes'], period['days'])
+
+    def test_first_run_adds_every_day(self):
+        self.assertEqual(self.stats, {'added': 4, 'updated': 0, 'removed': 0, 'unchanged': 0})
+        day = self.rollups.day("20240213")
+        self.assertEqual((day['minutes'], day['completed'], day['pending'], day['tasks']), (180, 1, 1, 2))
+        self.assertEqual(self.totals('week', "2024-W07"), (300, 2))
+        self.assertEqual(self.totals('month', "2024-02"), (450, 3))
+        self.assertEqual(self.totals('year', "2024"), (570, 4))
+        self.assertEqual(self.rollups.period('month', "2024-02")['pending'], 3)
+
+    def test_second_run_leaves_every_day_unchanged(self):
+        stat = os.stat(self.path)
+        _, stats = self.update()
+        self.assertEqual(stats, {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 4})
+        self.assertEqual(os.stat(self.path).st_mtime_ns, stat.st_mtime_ns)
+
+    def test_edited_day_replaces_its_contribution(self):
+        self.write("20240213", "12:00")
+        _, stats = self.update()
+        self.assertEqual((stats['updated'], stats['unchanged']), (1, 3))
+        self.assertEqual(self.totals('week', "2024-W07"), (360, 2))
+        self.assertEqual(self.totals('month', "2024-02"), (510, 3))
+
+    def test_same_size_replace_within_the_mtime_tick_is_updated(self):
+        path = self.prd_dir / "PRD_20240212.md"
+        old = os.stat(path)
+        tmp_path = path.with_name("replacement.tmp")
+        tmp_path.write_text(PRD_TEXT.format(day="20240212", time="11:00"), encoding='utf-8')
+        os.utime(tmp_path, ns=(old.st_atime_ns, old.st_mtime_ns))
+        os.replace(tmp_path, path)
+        new = os.stat(path)
+        self.assertEqual((new.st_size, new.st_mtime_ns), (old.st_size, old.st_mtime_ns))
+
+        _, stats = self.update()
+        self.assertEqual(stats['updated'], 1)
+        self.assertEqual(self.totals('week', "2024-W07"), (360, 2))
+
+    def test_deleted_day_is_subtracted_from_its_periods(self):
+        (self.prd_dir / "PRD_20240212.md").unlink()
+        (self.prd_dir / "PRD_20240220.md").unlink()
+        rollups, stats = self.update()
+        self.assertEqual((stats['removed'], stats['unchanged']), (2, 2))
+        self.assertIsNone(rollups.day("20240212"))
+        self.assertEqual(self.totals('week', "2024-W07"), (180, 1))
+        self.assertIsNone(self.totals('week', "2024-W08"))
+        self.assertEqual(self.totals('month', "2024-02"), (180, 1))
+        self.assertEqual(self.totals('year', "2024"), (300, 2))
+
+    def test_archived_day_is_kept_without_rereading(self):
+        _, _, problems = pack_period("2024-01", "20240101", "20240131", self.prd_dir, self.daily_dir,
+                                     archive_dir=self.archive_dir)
+        self.assertEqual(problems, [])
+        self.assertFalse((self.prd_dir / "PRD_20240131.md").exists())
+        _, stats = self.update()
+        self.assertEqual(stats, {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 4})
+        self.assertEqual(self.totals('month', "2024-01"), (120, 1))
+
+    def test_rebuild_matches_the_incremental_result(self):
+        self.write("20240213", "12:00")
+        (self.prd_dir / "PRD_20240220.md").unlink()
+        incremental, _ = self.update()
+        rebuilt, stats = self.update(rebuild=True)
+        self.assertEqual(stats['added'], 3)
+        self.assertEqual((rebuilt.days, rebuilt.periods), (incremental.days, incremental.periods))
+
+    def test_update_days_applies_only_the_given_days(self):
+        self.write("20240213", "12:00")
+        self.write("20240220", "12:00")
+        update_days(["20240213"], self.prd_dir, self.path)
+        self.assertEqual(self.totals('week', "2024-W07"), (360, 2))
+        self.assertEqual(self.totals('week', "2024-W08"), (150, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
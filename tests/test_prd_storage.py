@@ -0,0 +1,101 @@
+"""Tests for PRD storage: days read back from ARCHIVES as if they were live."""
+
+import hashlib
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import generate_hours_report
+from prd_archive import ArchiveIndex, pack_period
+from prd_storage import entry_hash, load_entry, open_storage
+
+PRD_TEXT = """# PRD - {day}
+
+## Tareas Realizadas
+
+### ✅ 1. Revisar correo — **09:00**
+
+**Descripción**: Bandeja de entrada
+**Solución**: Respondidos
+
+### ✅ 2. {name} — **10:00**
+
+**Descripción**: Tarea del día
+**Solución**: Hecho
+"""
+
+
+class ArchivedStorageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory(prefix="prd_storage_")
+        folder = Path(self.tmp.name)
+        self.prd_dir = folder / "PRD_DOCUMENTS"
+        self.prd_dir.mkdir()
+        self.archive_dir = folder / "ARCHIVES"
+        self.reports_dir = folder / "REPORTS"
+        self.texts = {}
+        for day, name in (("20240115", "Backup"), ("20240131", "Cierre de mes"), ("20240201", "Migración")):
+            self.texts[day] = PRD_TEXT.format(day=day, name=name)
+            (self.prd_dir / f"PRD_{day}.md").write_text(self.texts[day], encoding='utf-8')
+        self.archive_path, _, problems = pack_period(
+            "2024-01", "20240101", "20240131", self.prd_dir, folder / "DAILY_WORK",
+            archive_dir=self.archive_dir)
+        self.assertEqual(problems, [])
+        self.storage = open_storage(self.prd_dir, self.archive_dir)
+        self.storage.refresh()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_entries_mix_archived_and_live_days(self):
+        entries = self.storage.entries()
+        self.assertEqual([(e.day, e.archived) for e in entries],
+                         [("20240115", True), ("20240131", True), ("20240201", False)])
+        archived = entries[0]
+        self.assertEqual(archived.archive, self.archive_path)
+        self.assertEqual(archived.member, "PRD_DOCUMENTS/PRD_20240115.md")
+        self.assertEqual(archived.name, "PRD_20240115.md")
+        self.assertFalse(archived.path.exists())
+        self.assertEqual([e.day for e in self.storage.entries("20240131", "20240201")],
+                         ["20240131", "20240201"])
+
+    def test_archived_day_loads_and_hashes_like_the_original(self):
+        entry = self.storage.get("20240131")
+        prd = load_entry(entry)
+        self.assertEqual([t.name for t in prd.tasks], ["Revisar correo", "Cierre de mes"])
+        expected = hashlib.sha256(self.texts["20240131"].encode('utf-8')).hexdigest()
+        self.assertEqual(entry_hash(entry), expected)
+        index_entry = ArchiveIndex(self.archive_dir).archives[self.archive_path.name]
+        self.assertEqual(index_entry['members'][entry.member]['sha256'], expected)
+
+    def test_live_copy_wins_over_the_archived_one(self):
+        (self.prd_dir / "PRD_20240115.md").write_text(
+            PRD_TEXT.format(day="20240115", name="Restaurado"), encoding='utf-8')
+        self.storage.refresh()
+        entry = self.storage.get("20240115")
+        self.assertFalse(entry.archived)
+        self.assertEqual(load_entry(entry, remember=False).tasks[1].name, "Restaurado")
+
+    def test_range_report_reads_archived_days(self):
+        report_file, message = generate_hours_report.generate_range_report(
+            "20240101", "20240229", "2024-01_02", self.prd_dir, self.reports_dir,
+            archive_dir=self.archive_dir)
+        self.assertIsNotNone(report_file, message)
+        report = Path(report_file).read_text(encoding='utf-8')
+        self.assertIn("- **Días con registro**: 3\n", report)
+        for name in ("PRD_20240115.md", "PRD_20240131.md", "PRD_20240201.md"):
+            self.assertIn(f"(`{name}`)", report)
+        self.assertIn("| 2 | Cierre de mes | 10:00 | 1h 0m |", report)
+
+        _, message = generate_hours_report.generate_range_report(
+            "20240101", "20240229", "2024-01_02", self.prd_dir, self.reports_dir,
+            archive_dir=self.archive_dir)
+        self.assertEqual(message, "Reporte al día (ningún PRD del rango cambió)")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""Tests for the task store: incremental indexing and full-text search."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from prd_core import STATUS_COMPLETED, STATUS_PENDING
+from prd_store import TaskStore
+
+
+def prd_text(day_label, tasks):
+    """PRD markdown with one completed task per (title, description)."""
+    blocks = [
+        f"### ✅ {number}. {title} — **{9 + number:02d}:00**\n\n**Descripción**: {description}\n"
+        f"**Solución**: Hecho\n"
+        for number, (title, description) in enumerate(tasks, 1)
+    ]
+    return f"# PRD - {day_label}\n\n## Tareas Realizadas\n\n" + "\n".join(blocks)
+
+
+class SearchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory(prefix="prd_store_")
+        folder = Path(self.tmp.name)
+        self.prd_dir = folder / "PRD_DOCUMENTS"
+        self.prd_dir.mkdir()
+        self.archive_dir = folder / "ARCHIVES"
+        days = {
+            "20260210": ("10 de febrero de 2026", [("Revisar correo", "Menciona proxmox de pasada")]),
+            "20260211": ("11 de febrero de 2026", [("Backup de Proxmox", "Copia nocturna")]),
+            "20260212": ("12 de febrero de 2026", [("Migración", "Aplicar la solución del proveedor")]),
+        }
+        for day, (label, tasks) in days.items():
+            (self.prd_dir / f"PRD_{day}.md").write_text(prd_text(label, tasks), encoding='utf-8')
+        self.store = TaskStore(folder / "store.sqlite")
+        self.stats = self.store.index(self.prd_dir, archive_dir=self.archive_dir)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_index_is_incremental(self):
+        self.assertEqual(self.stats['added'], 3)
+        stats = self.store.index(self.prd_dir, archive_dir=self.archive_dir)
+        self.assertEqual((stats['added'], stats['updated'], stats['unchanged']), (0, 0, 3))
+
+    def test_title_match_ranks_above_description_match(self):
+        if not self.store.fts:
+            self.skipTest("SQLite sin FTS5")
+        results = self.store.search("proxmox")
+        self.assertEqual([(r['day'], r['title']) for r in results],
+                         [("20260211", "Backup de Proxmox"), ("20260210", "Revisar correo")])
+        self.assertIn("[proxmox]", results[1]['snippet'])
+
+    def test_search_ignores_accents_and_matches_prefixes(self):
+        self.assertEqual([r['day'] for r in self.store.search("solucion")], ["20260212"])
+        self.assertEqual([r['day'] for r in self.store.search("migra")], ["20260212"])
+
+    def test_every_term_must_match(self):
+        self.assertEqual([r['day'] for r in self.store.search("proxmox copia")], ["20260211"])
+        self.assertEqual(self.store.search("proxmox migración"), [])
+
+    def test_date_range_filters_results(self):
+        results = self.store.search("proxmox", date_from="20260211", date_to="20260211")
+        self.assertEqual([r['day'] for r in results], ["20260211"])
+
+    def test_status_filters_results(self):
+        (self.prd_dir / "PRD_20260213.md").write_text(
+            prd_text("13 de febrero de 2026", [])
+            + "\n## Tareas Pendientes\n\n### ⏳ 1. Ampliar Proxmox — **15:00**\n\n"
+              "**Descripción**: Más disco\n**Estado**: Esperando compra\n", encoding='utf-8')
+        self.store.index(self.prd_dir, archive_dir=self.archive_dir)
+        pending = self.store.search("proxmox", status=STATUS_PENDING)
+        self.assertEqual([(r['day'], r['status']) for r in pending], [("20260213", STATUS_PENDING)])
+        completed = self.store.search("proxmox", status=STATUS_COMPLETED)
+        self.assertEqual(sorted(r['day'] for r in completed), ["20260210", "20260211"])
+
+    def test_reindexed_day_replaces_its_tasks(self):
+        (self.prd_dir / "PRD_20260211.md").write_text(
+            prd_text("11 de febrero de 2026", [("Backup de servidores", "Copia nocturna")]), encoding='utf-8')
+        stats = self.store.index(self.prd_dir, archive_dir=self.archive_dir)
+        self.assertEqual(stats['updated'], 1)
+        self.assertEqual([r['day'] for r in self.store.search("proxmox")], ["20260210"])
+        self.assertEqual([r['day'] for r in self.store.search("servidores")], ["20260211"])
+
+
+if __name__ == "__main__":
+    unittest.main()